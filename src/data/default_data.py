@@ -2,6 +2,10 @@ DEFAULT_SESSION = {
     "base_directory": "",
     "input_config": "",
     "output_config": "",
+    "input_snapshot": "",
+    "output_snapshot": "",
+    "snapshot": None,
+    "has_snapshot_data": False,
     "directories": None,
     "metric_type": "individual",
     "load_count": 0,
@@ -25,6 +29,7 @@ DEFAULT_SESSION = {
     "anchor_y": -0.15,
     "frameon": False,
     "legend_position": "upper center",
+    "error_statistic": "error",
     "use_custom_loads": False,
     "load_points_filter": "",
     "loads": {},
@@ -34,6 +39,8 @@ DEFAULT_DATA = {
     "base-directory": "",
     "input-config": "",
     "output-config": "",
+    "input-snapshot": "",
+    "output-snapshot": "",
     "directory-list": [],
     "labels": [],
     "metric-type": "individual",
@@ -57,6 +64,7 @@ DEFAULT_DATA = {
     "anchor-y": "-0.15",
     "frameon": "",
     "legend-position": "upper center",
+    "error-statistic": "error",
     "use-custom-loads": False,
     "loads": {},
     "load-points-filter": "",
@@ -0,0 +1,81 @@
+# Number of threads used to read simulation result files concurrently.
+# Set to 1 to read the files sequentially.
+LOADING_WORKERS = 8
+
+# Name of the hidden directory, created inside each simulation directory,
+# where SAFS stores the files derived from the simulation results.
+CACHE_DIRECTORY_NAME = ".safs"
+
+# Whether parsed result files are stored in (and read from) the on-disk cache.
+# A file of which only some metrics or load points are requested is stored the
+# second time part of it is requested, since only then is it parsed in full.
+DISK_CACHE_ENABLED = True
+
+# Number of rows parsed at a time when only part of a result file is requested.
+READ_CHUNK_ROWS = 10_000
+
+# Memory budget (in bytes) of the in-process cache of loaded simulation results.
+RESULT_CACHE_MAX_BYTES = 512 * 1024**2
+
+# Whether loaded results are stored compactly: categorical 'Metrics' column and
+# integer 'LoadPoint' column.
+COMPACT_RESULTS = True
+
+# Data type of the repetition columns of the loaded results. Use "float32" to
+# halve their memory usage, at the cost of precision.
+REPETITION_DTYPE = "float64"
+
+# Extensions of the result files, in order of preference when a metric group has
+# more than one file. Compressed files are decompressed while they are read.
+RESULT_FILE_EXTENSIONS = [".csv", ".csv.gz", ".csv.xz", ".csv.zst"]
+
+# Metric groups whose result files may have an extra column before the repetition
+# columns in the data rows, which is removed while the files are read.
+NORMALIZED_METRIC_GROUPS = ["SpectrumUtilization"]
+
+# Engine used to parse the result files: "c" (pandas' default parser), "pyarrow"
+# (multithreaded, requires the 'pyarrow' package) or "auto", which chooses between
+# them by file size with a calibration made on first use. Compressed files are parsed
+# with the C engine in "auto" mode. The two engines may round a few values of a file
+# differently in the last digit (one ulp), so results parsed with the Arrow engine can
+# differ from the C engine at that level.
+PARSE_ENGINE = "auto"
+
+# Whether graphs and exports fetch the results from the SQLite result store of the
+# base directory, where each result file is ingested once, instead of the CSV files.
+RESULT_STORE_ENABLED = False
+
+# Name of the SQLite file of the result store, inside the cache directory of the
+# base directory.
+RESULT_STORE_FILENAME = "results.sqlite"
+
+# Whether the summary sidecar files written by 'src/indexer.py' are used instead
+# of the result files while they are fresh.
+SUMMARY_SIDECARS_ENABLED = True
+
+# Whether the metric lists of the generation page are discovered from the
+# 'Metrics' column of the result files instead of taken from 'metrics_data.py'.
+METRIC_DISCOVERY_ENABLED = True
+
+# Memory budget (in bytes) of the in-process cache of compiled series (mean and
+# error of a metric by load point), reused while the result files are not modified.
+COMPILED_CACHE_MAX_BYTES = 64 * 1024**2
+
+# Whether the compiled series are also stored in the cache directory of each
+# simulation directory, to be reused after the server restarts.
+COMPILED_DISK_CACHE_ENABLED = False
+
+# Whether the series are compiled from the metric × load point × repetition tensors
+# of the result files, stored as memory-mapped files in the cache directory of each
+# simulation directory. Results that can not be represented as a tensor are compiled
+# from the result files.
+TENSOR_STORE_ENABLED = False
+
+# Whether graphs and exports follow result files that are still being written by
+# the simulator, parsing only the lines and repetition columns added since the
+# previous request instead of the whole files.
+FOLLOW_RESULT_FILES = False
+
+# Maximum number of followed result files whose parsed lines are kept in memory.
+# The least recently read files are dropped first and parsed again on their next read.
+FOLLOWED_FILES_MAX_ENTRIES = 64
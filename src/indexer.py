@@ -0,0 +1,121 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from services import (
+    path_utils as pus,
+    simulation_utils as sus,
+    summary_utils as sms,
+)
+from services.index_utils import directory_index
+
+# Message printed for each status of the summary of a result file.
+STATUS_MESSAGES = {
+    "written": "written",
+    "up to date": "up to date",
+    "no repetitions": "skipped, the file has no repetition columns",
+}
+
+
+def compute_summary(simulation_result: pd.DataFrame) -> pd.DataFrame:
+    """
+    Computes the mean, the standard error, the number of repetitions and the sum of
+    squared differences from the mean of each row of a simulation result.\\
+    The mean and the standard error are computed as `sus.calculate_average` and
+    `sus.calculate_standard_error` do.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+    Returns:
+        pd.DataFrame: A DataFrame with the `SUMMARY_COLUMNS` columns.
+    """
+    repetitions = sus.extract_repetitions([simulation_result])
+    number_of_reps = sus.get_number_of_repetitions(repetitions)
+    n, _, m2 = sms.compute_running_statistics(repetitions[0].to_numpy(dtype=np.float64))
+    return pd.DataFrame(
+        {
+            "Metrics": simulation_result["Metrics"].astype(str).tolist(),
+            "LoadPoint": simulation_result["LoadPoint"].tolist(),
+            "mean": sus.calculate_average(repetitions)[0],
+            "error": sus.calculate_standard_error(repetitions, number_of_reps)[0],
+            "n": n.tolist(),
+            "m2": m2.tolist(),
+        }
+    )
+
+
+def write_summaries(
+    base_directory: str, force: bool = False
+) -> list[tuple[str, str, str]]:
+    """
+    Writes the summary sidecar files of all result files of a base directory,
+    skipping the ones that are already fresh and only adding the new repetitions to
+    the ones that can be brought up to date. Result files without repetition
+    columns are skipped.
+    Args:
+        base_directory (str): The base directory.
+        force (bool, optional): Whether to write the summaries even if they are fresh.
+    Returns:
+        list[tuple[str, str, str]]: For each result file, a tuple containing
+        - The simulation directory.
+        - The metric group.
+        - The status of its summary, from `STATUS_MESSAGES`.
+    """
+    statuses = []
+    for simulation_directory in pus.get_simulations_dirs_paths(base_directory):
+        group_files = directory_index.get_group_files(simulation_directory)
+        for metric_group in sorted(group_files):
+            path = pus.get_result_paths([simulation_directory], metric_group)[0]
+            status = "up to date"
+            if force or sms.load_summary(path) is None:
+                status = "written"
+                if force or sus.update_simulation_summary(path) is None:
+                    status = write_summary(path)
+            statuses.append((simulation_directory, metric_group, status))
+    return statuses
+
+
+def write_summary(path: str | list[str]) -> str:
+    """
+    Computes and writes the summary sidecar file of a result file from all its
+    repetitions.
+    Args:
+        path (str | list[str]): The path to the result file, or the paths to its shards.
+    Returns:
+        str: "written", or "no repetitions" if the result has no repetition columns.
+    """
+    signature = sms.get_signature(path)
+    simulation_result = sus.load_simulation_result(path)
+    repetitions = list(simulation_result.filter(like="rep", axis=1).columns)
+    if not repetitions:
+        return "no repetitions"
+    summary = compute_summary(simulation_result)
+    checksum = None
+    if not isinstance(path, list):
+        last = simulation_result[repetitions[-1]]
+        checksum = sms.get_checksum(last.to_numpy(dtype=np.float64))
+    sms.save_summary(path, summary, signature, repetitions, checksum)
+    return "written"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write the summary sidecar files of the simulation results."
+    )
+    parser.add_argument(
+        "base_directory", help="Base directory containing the simulation directories"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite the summaries even if they are up to date",
+    )
+    args = parser.parse_args()
+    for directory, metric_group, status in write_summaries(
+        args.base_directory, args.force
+    ):
+        print(f"{directory} [{metric_group}]: {STATUS_MESSAGES[status]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,18 @@ from flask import Blueprint, jsonify
 import os.path as op
 
 from services import (
+    cache_utils as cus,
+    catalog_utils as cas,
+    compiled_cache as ccs,
     config_utils as cs,
     loads_utils as lus,
     path_utils as pus,
     data_utils as dus,
+    snapshot_utils as sns,
 )
 from services.data_utils import session
+from data.loading_data import METRIC_DISCOVERY_ENABLED
+from data.metrics_data import FILTERED_METRICS as FM
 
 blueprint = Blueprint("config", __name__)
 
@@ -19,6 +25,19 @@ def clear_session():
     return jsonify(message), status_code
 
 
+@blueprint.route("/cache-stats", methods=["GET"])
+def cache_stats():
+    """
+    Reports the usage of the in-process cache of simulation results.
+    Returns:
+        A JSON response containing the hits, misses, entries and memory usage of the cache,
+        and the ones of the cache of compiled series under 'compiled'.
+    """
+    stats = cus.result_cache.stats()
+    stats["compiled"] = ccs.compiled_cache.stats()
+    return jsonify(stats)
+
+
 @blueprint.route("/load-directory", methods=["POST"])
 def load_directory():
     """
@@ -26,10 +45,17 @@ def load_directory():
     Returns:
         A JSON response containing the simulation directories and metrics or an error message.
         - If the base directory is not found or an error occurs, it sets an error message in the session.
+        - The metrics are discovered from the result files when `METRIC_DISCOVERY_ENABLED` is set,
+          falling back to `FILTERED_METRICS` if the discovery fails.
     """
     data = dus.Data()
     base_directory = data["base-directory"]
-    sess_data = {"base_directory": base_directory}
+    sess_data = {
+        "base_directory": base_directory,
+        "snapshot": None,
+        "has_snapshot_data": False,
+    }
+    response = {}
     try:
         if base_directory != "":
             simulation_dirs_paths = pus.get_simulations_dirs_paths(base_directory)
@@ -42,6 +68,14 @@ def load_directory():
                 loads = lus.calculate_loads(base_directory, simulation_dirs[0])
                 sess_data["loads"] = loads
             load_count = lus.get_number_of_load_points(base_path)
+            response["directories"] = simulation_dirs
+            if METRIC_DISCOVERY_ENABLED:
+                try:
+                    response["metrics"] = cas.discover_metrics(
+                        base_directory, simulation_dirs, metric_type
+                    )
+                except Exception:
+                    response["metrics"] = FM[metric_type]
 
             sess_data.update(
                 {
@@ -53,9 +87,10 @@ def load_directory():
             )
     except Exception as e:
         sess_data["base_dir_error"] = str(e)
+        response = {"error": str(e)}
     finally:
         session.update(sess_data)
-        return ""
+        return jsonify(response)
 
 
 @blueprint.route("/load-config", methods=["POST"])
@@ -100,6 +135,81 @@ def save_config():
     return jsonify({"message": result})
 
 
+@blueprint.route("/load-snapshot", methods=["POST"])
+def load_snapshot():
+    """
+    Loads the snapshot file specified in the request and restores the session from it.
+    Returns:
+        A JSON response containing the selection of the snapshot and whether the page
+        must be reloaded to show it, or an error message.
+    """
+    data = dus.Data()
+    input_snapshot = data["input-snapshot"]
+    sess_data = {"input_snapshot": input_snapshot}
+    response = {}
+    try:
+        snapshot = sns.load_snapshot(input_snapshot)
+        reload = (
+            session["base_directory"] != snapshot.base_directory
+            or session["directories"] != snapshot.directories
+            or session["metric_type"] != snapshot.metric_type
+            or session["snapshot"] != input_snapshot
+        )
+        sess_data.update(
+            {
+                "base_directory": snapshot.base_directory,
+                "base_dir_error": None,
+                "directories": snapshot.directories,
+                "metric_type": snapshot.metric_type,
+                "load_count": len(snapshot.loads),
+                "loads": snapshot.get_loads(),
+                "use_custom_loads": False,
+                "snapshot": input_snapshot,
+                "has_snapshot_data": True,
+            }
+        )
+        response = {"snapshot_data": snapshot.get_config_data(), "reload": reload}
+    except Exception as e:
+        sess_data["has_snapshot_data"] = False
+        response = {"error": str(e)}
+    finally:
+        session.update(sess_data)
+        return jsonify(response)
+
+
+@blueprint.route("/save-snapshot", methods=["POST"])
+def save_snapshot():
+    """
+    Saves the selected directories, labels and metric groups, the loads and the
+    compiled statistics to the output snapshot file specified in the request.
+    Returns:
+        A JSON response indicating the success or failure of the save operation.
+    """
+    data = dus.Data()
+    output_snapshot = data["output-snapshot"]
+    session.update({"output_snapshot": output_snapshot})
+    if not output_snapshot:
+        return jsonify({"error": "Nenhum arquivo de snapshot informado."})
+    directories = data["directory-list"]
+    if not directories:
+        return jsonify({"error": "Nenhum diretório selecionado."})
+    grouped_metrics = data["grouped-metrics"]
+    if not grouped_metrics:
+        return jsonify({"error": "Nenhuma métrica selecionada."})
+    try:
+        sns.save_snapshot(
+            output_snapshot,
+            session["base_directory"],
+            session["metric_type"],
+            directories,
+            data["labels"],
+            grouped_metrics,
+        )
+        return jsonify({"message": "Snapshot salvo com sucesso."})
+    except Exception as e:
+        return jsonify({"error": "Erro ao salvar snapshot:\n" + str(e)})
+
+
 @blueprint.route("/update-metric-type", methods=["POST"])
 def update_metric_type():
     """
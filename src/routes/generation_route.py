@@ -1,12 +1,15 @@
 from flask import Blueprint, render_template, jsonify
 from services import (
+    catalog_utils as cas,
     exportation as es,
     graph_generation as ggs,
     loads_utils as lus,
     data_utils as dus,
+    snapshot_utils as sns,
     utils as us,
 )
 from services.data_utils import session
+from data.loading_data import METRIC_DISCOVERY_ENABLED
 from data.metrics_data import FILTERED_METRICS as FM
 
 blueprint = Blueprint("generation", __name__)
@@ -28,16 +31,28 @@ def index():
             base_dir_error=base_dir_error,
         )
     metric_type = session["metric_type"]
+    grouped_metrics = FM[metric_type]
+    directories = session["directories"]
+    if METRIC_DISCOVERY_ENABLED and directories and not session["snapshot"]:
+        try:
+            grouped_metrics = cas.discover_metrics(
+                base_directory, directories, metric_type
+            )
+        except Exception:
+            grouped_metrics = FM[metric_type]
     return render_template(
         "generation.jinja",
         base_directory=base_directory,
         metric_type=metric_type,
-        grouped_metrics=FM[metric_type],
+        grouped_metrics=grouped_metrics,
         input_config=session["input_config"],
         output_config=session["output_config"],
-        directories=session["directories"],
+        directories=directories,
         load_count=session["load_count"],
         has_config_data=session["has_config_data"],
+        input_snapshot=session["input_snapshot"],
+        output_snapshot=session["output_snapshot"],
+        has_snapshot_data=session["has_snapshot_data"],
         graph_type=session["graph_type"],
         language=session["language"],
         overwrite="true" if session["overwrite"] else "false",
@@ -57,6 +72,7 @@ def index():
         anchor_y=session["anchor_y"],
         frameon="true" if session["frameon"] else "false",
         legend_position=session["legend_position"],
+        error_statistic=session["error_statistic"],
         use_custom_loads=session["use_custom_loads"],
         load_points_filter=session["load_points_filter"],
         loads=session["loads"],
@@ -73,6 +89,7 @@ def generate_graphs():
     base_directory = session["base_directory"]
     metric_type = session["metric_type"]
     use_custom_loads = session["use_custom_loads"]
+    snapshot = session["snapshot"]
 
     data = dus.Data()
     directories: list[str] = data["directory-list"]
@@ -107,26 +124,28 @@ def generate_graphs():
     legend_position = data["legend-position"]
     max_columns = int(data["max-columns"])
     frameon = data["frameon"] == "true"
+    error_statistic = data["error-statistic"]
 
     load_error = ""
     load_points_filter = ""
+    load_report = None
     if use_custom_loads:
         raw_loads: dict = data["loads"]
+    elif snapshot:
+        load_points_filter = data["load-points-filter"]
+        try:
+            raw_loads = sns.load_snapshot(snapshot).get_loads(load_points_filter)
+        except Exception as e:
+            return jsonify({"error": str(e)})
     else:
         load_points_filter = data["load-points-filter"]
         try:
-            raw_loads: dict = lus.calculate_loads(
-                base_directory, directories[0], load_points_filter
+            raw_loads, load_report = lus.check_loads_consistency(
+                base_directory, directories, load_points_filter
             )
-            for i in range(1, len(directories)):
-                other_raw_loads = lus.calculate_loads(
-                    base_directory, directories[i], load_points_filter
-                )
-                if len(other_raw_loads) != len(raw_loads):
-                    load_error = "Gráficos gerados com sucesso, mas a quantidade de pontos de carga não é igual entre os diretórios selecionados."
-                    break
         except Exception as e:
             return jsonify({"error": str(e)})
+        load_error = lus.get_loads_consistency_error(load_report)
     loads = list(raw_loads.values())
     load_points = list(raw_loads.keys())
     session.update(
@@ -151,6 +170,7 @@ def generate_graphs():
             "anchor_y": anchor[1],
             "frameon": frameon,
             "max_columns": max_columns,
+            "error_statistic": error_statistic,
             "load_points_filter": load_points_filter,
             "loads": raw_loads,
         }
@@ -168,6 +188,8 @@ def generate_graphs():
                 grouped_metrics=grouped_metrics,
                 loads=loads,
                 load_points=load_points,
+                snapshot=snapshot,
+                error_statistic=error_statistic,
             ).generate_graphs(
                 ylim_low,
                 ylim_up,
@@ -186,8 +208,10 @@ def generate_graphs():
                 frameon,
             )
             if load_error:
-                return jsonify({"error": load_error})
-            return jsonify({"message": "Gráficos gerados com sucesso."})
+                return jsonify({"error": load_error, "load_report": load_report})
+            return jsonify(
+                {"message": "Gráficos gerados com sucesso.", "load_report": load_report}
+            )
         except Exception as e:
             return jsonify({"error": "Erro ao gerar gráficos:\n" + str(e)})
     else:
@@ -204,6 +228,7 @@ def export_results():
     base_directory = session["base_directory"]
     use_custom_loads = session["use_custom_loads"]
     metric_type = session["metric_type"]
+    snapshot = session["snapshot"]
 
     data = dus.Data()
     directories = data["directory-list"]
@@ -216,15 +241,19 @@ def export_results():
     if not grouped_metrics:
         return jsonify({"error": "Nenhuma métrica selecionada."})
     overwrite = data["overwrite"] == "true"
+    error_statistic = data["error-statistic"]
 
     if use_custom_loads:
         raw_loads: dict = data["loads"]
     else:
         load_points_filter = data["load-points-filter"]
         try:
-            raw_loads = lus.calculate_loads(
-                base_directory, directories[0], load_points_filter
-            )
+            if snapshot:
+                raw_loads = sns.load_snapshot(snapshot).get_loads(load_points_filter)
+            else:
+                raw_loads = lus.calculate_loads(
+                    base_directory, directories[0], load_points_filter
+                )
         except Exception as e:
             return jsonify({"error": "Erro ao calcular cargas:\n" + str(e)})
     loads = list(raw_loads.values())
@@ -235,6 +264,7 @@ def export_results():
             "labels": session_labels,
             "loads": loads,
             "overwrite": overwrite,
+            "error_statistic": error_statistic,
         }
     )
     try:
@@ -247,6 +277,8 @@ def export_results():
             loads=loads,
             load_points=load_points,
             overwrite=overwrite,
+            snapshot=snapshot,
+            error_statistic=error_statistic,
         )
         return jsonify({"message": "Resultados exportados com sucesso."})
     except Exception as e:
@@ -0,0 +1,280 @@
+from collections import OrderedDict
+import json
+import os
+import os.path as op
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data.loading_data import (
+    CACHE_DIRECTORY_NAME,
+    DISK_CACHE_ENABLED,
+    RESULT_CACHE_MAX_BYTES,
+)
+
+# Maximum number of result files recorded by the partial read log.
+PARTIAL_READ_MAX_ENTRIES = 4096
+
+
+def get_file_signature(path: str) -> dict[str, int]:
+    """
+    Returns the signature used to detect changes in a file.
+    Args:
+        path (str): The path to the file.
+    Returns:
+        dict[str, int]: A dictionary with the size and the modification time (ns) of the file.
+    """
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def get_cache_paths(path: str, suffix: str = "") -> tuple[str, str]:
+    """
+    Returns the paths of the cache files of a result file.\\
+    The cache files are stored in the cache directory next to the result file.
+    Args:
+        path (str): The path to the result file.
+        suffix (str, optional): Suffix added to the names of the cache files,
+            identifying the kind of data they store. Defaults to "".
+    Returns:
+        tuple[str, str]: A tuple containing
+        - The path to the header file (JSON).
+        - The path to the data file (NPY).
+    """
+    cache_directory = op.join(op.dirname(path), CACHE_DIRECTORY_NAME)
+    name = op.basename(path) + suffix
+    return (
+        op.join(cache_directory, f"{name}.json"),
+        op.join(cache_directory, f"{name}.npy"),
+    )
+
+
+def load_cached_result(path: str) -> pd.DataFrame | None:
+    """
+    Loads a result file from the on-disk cache.\\
+    The float columns are memory-mapped from the data file, while the remaining
+    columns are restored from the header file.
+    Args:
+        path (str): The path to the result file.
+    Returns:
+        pd.DataFrame | None: The cached DataFrame, or None if the cache is disabled,
+        missing or stale.
+    """
+    if not DISK_CACHE_ENABLED:
+        return None
+    header_path, data_path = get_cache_paths(path)
+    try:
+        with open(header_path, "r") as file:
+            header = json.load(file)
+        if header["source"] != op.abspath(path):
+            return None
+        if header["signature"] != get_file_signature(path):
+            return None
+        block = np.load(data_path, mmap_mode="r")
+    except (OSError, ValueError, KeyError):
+        return None
+    if block.shape != (header["rows"], len(header["block_columns"])):
+        return None
+
+    df = pd.DataFrame(block, columns=header["block_columns"], copy=False)
+    for position, column in enumerate(header["columns"]):
+        if column in header["other_columns"]:
+            values = header["other_columns"][column]
+            df.insert(
+                position,
+                column,
+                pd.Series(values, dtype=header["dtypes"][column]),
+            )
+    return df
+
+
+def save_cached_result(path: str, df: pd.DataFrame):
+    """
+    Saves a parsed result file to the on-disk cache.\\
+    The float columns are written as a single column-major NPY array and the
+    remaining columns, together with the file signature, as a JSON header.
+    Failures are ignored, since the cache is only an optimization.
+    Args:
+        path (str): The path to the result file.
+        df (pd.DataFrame): The parsed result file.
+    """
+    if not DISK_CACHE_ENABLED:
+        return
+    header_path, data_path = get_cache_paths(path)
+    block_columns = [c for c in df.columns if df[c].dtype == np.float64]
+    header = {
+        "source": op.abspath(path),
+        "signature": get_file_signature(path),
+        "rows": len(df),
+        "columns": list(df.columns),
+        "dtypes": {c: str(df[c].dtype) for c in df.columns},
+        "block_columns": block_columns,
+        "other_columns": {
+            c: df[c].tolist() for c in df.columns if c not in block_columns
+        },
+    }
+    block = np.asfortranarray(df[block_columns].to_numpy(dtype=np.float64))
+    try:
+        os.makedirs(op.dirname(header_path), exist_ok=True)
+        write_atomically(data_path, lambda f: np.save(f, block))
+        write_atomically(header_path, lambda f: f.write(json.dumps(header).encode()))
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def write_atomically(path: str, write_func):
+    """
+    Writes a file through a temporary file, replacing the target only when complete.\\
+    The temporary file is named after the process and the thread, so threads writing
+    the same file at the same time do not share it.
+    Args:
+        path (str): The path to the file.
+        write_func (Callable): Function that receives the open binary file and writes it.
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            write_func(file)
+        os.replace(temp_path, path)
+    finally:
+        if op.exists(temp_path):
+            os.remove(temp_path)
+
+
+class ResultCache:
+    """
+    Process-wide LRU cache of loaded simulation results.\\
+    Entries are validated against the signature of the source file and the least
+    recently used ones are evicted when the memory budget is exceeded.
+    The cached DataFrames are shared between requests and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initializes the cache with the provided memory budget.
+        Args:
+            max_bytes (int): Maximum memory (in bytes) used by the cached DataFrames.
+        """
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[tuple, tuple[dict, pd.DataFrame, int]] = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: tuple, signature: dict[str, int]) -> pd.DataFrame | None:
+        """
+        Retrieves a DataFrame from the cache.
+        Args:
+            key (tuple): The key of the entry.
+            signature (dict[str, int]): The current signature of the source file.
+        Returns:
+            pd.DataFrame | None: The cached DataFrame, or None if it is missing or stale.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != signature:
+                if entry is not None:
+                    self.remove(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, signature: dict[str, int], df: pd.DataFrame):
+        """
+        Stores a DataFrame in the cache, evicting the least recently used entries if needed.\\
+        DataFrames larger than the whole budget are not stored.
+        Args:
+            key (tuple): The key of the entry.
+            signature (dict[str, int]): The signature of the source file.
+            df (pd.DataFrame): The DataFrame to store.
+        """
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+            self.entries[key] = (signature, df, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                self.remove(next(iter(self.entries)))
+
+    def remove(self, key: tuple):
+        """
+        Removes an entry from the cache. Must be called with the lock held.
+        Args:
+            key (tuple): The key of the entry.
+        """
+        _, _, size = self.entries.pop(key)
+        self.total_bytes -= size
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the usage statistics of the cache.
+        Returns:
+            dict[str, int]: The number of hits, misses and entries, and the memory used and available.
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class PartialReadLog:
+    """
+    Record of the result files of which only the requested rows and columns were
+    parsed, with the signature they had at that time.\\
+    The oldest records are dropped when more than `max_entries` files are recorded,
+    which only delays the storage of those files in the on-disk cache.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initializes the log with the provided size limit.
+        Args:
+            max_entries (int): Maximum number of recorded files.
+        """
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, dict[str, int]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def record(self, source: str, signature: dict[str, int]) -> bool:
+        """
+        Records a partial read of a file.
+        Args:
+            source (str): The absolute path to the file.
+            signature (dict[str, int]): The current signature of the file.
+        Returns:
+            bool: True if part of the file was already read since it was last
+            modified, in which case the record is removed.
+        """
+        with self.lock:
+            if self.entries.get(source) == signature:
+                del self.entries[source]
+                return True
+            self.entries[source] = signature
+            self.entries.move_to_end(source)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            return False
+
+    def forget(self, source: str):
+        """
+        Removes the record of a file.
+        Args:
+            source (str): The absolute path to the file.
+        """
+        with self.lock:
+            self.entries.pop(source, None)
+
+
+result_cache = ResultCache(RESULT_CACHE_MAX_BYTES)
+partial_read_log = PartialReadLog(PARTIAL_READ_MAX_ENTRIES)
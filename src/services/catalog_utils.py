@@ -0,0 +1,186 @@
+import json
+import os
+import os.path as op
+import threading
+
+import pandas as pd
+
+from data.loading_data import CACHE_DIRECTORY_NAME
+from data.metrics_data import FILTERED_METRICS, METRIC_GROUP_ALIASES
+from services import (
+    cache_utils as cus,
+    normalization as nus,
+    path_utils as pus,
+    utils as us,
+)
+from services.index_utils import directory_index
+
+CATALOG_FILENAME = "metrics.json"
+CATALOG_VERSION = 1
+
+
+class MetricCatalog:
+    """
+    Catalog of the metrics found in the result files of each simulation directory.\\
+    Only the 'Metrics' column of the files of the metric groups listed in
+    `METRIC_GROUP_ALIASES` is read, so other CSV files in the directory are ignored.
+    The metrics of each directory are kept in memory and in its cache directory, and
+    a metric group is read again only when its files are modified.
+    """
+
+    def __init__(self):
+        self.catalogs: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def get_directory_metrics(self, simulation_directory: str) -> dict[str, list[str]]:
+        """
+        Retrieves the metrics of each metric group of a simulation directory.
+        Args:
+            simulation_directory (str): The simulation directory.
+        Returns:
+            dict[str, list[str]]: A dictionary mapping each metric group to its metrics,
+            in the order they appear in the result file. Files that can not be read
+            have no metrics.
+        """
+        key = op.abspath(simulation_directory)
+        with self.lock:
+            catalog = self.catalogs.get(key)
+        if catalog is None:
+            catalog = load_catalog(simulation_directory)
+        groups = {}
+        changed = False
+        for metric_group in directory_index.get_group_files(simulation_directory):
+            if metric_group not in METRIC_GROUP_ALIASES:
+                continue
+            path = pus.get_result_paths([simulation_directory], metric_group)[0]
+            paths = path if isinstance(path, list) else [path]
+            signature = [cus.get_file_signature(p) for p in paths]
+            entry = catalog["groups"].get(metric_group)
+            if entry is None or entry["signature"] != signature:
+                try:
+                    metrics = read_metric_names(paths[0])
+                except Exception:
+                    metrics = []
+                entry = {"signature": signature, "metrics": metrics}
+                changed = True
+            groups[metric_group] = entry
+        if changed or groups.keys() != catalog["groups"].keys():
+            catalog = {"version": CATALOG_VERSION, "groups": groups}
+            save_catalog(simulation_directory, catalog)
+        with self.lock:
+            self.catalogs[key] = catalog
+        return {group: entry["metrics"] for group, entry in groups.items()}
+
+    def clear(self):
+        """
+        Removes all catalogs from memory.
+        """
+        with self.lock:
+            self.catalogs.clear()
+
+
+def read_metric_names(path: str) -> list[str]:
+    """
+    Reads the names of the metrics of a result file, parsing only its 'Metrics' column.
+    Args:
+        path (str): The path to the result file.
+    Returns:
+        list[str]: The metrics, in the order they appear in the file.
+    """
+    with nus.normalize_result_stream(path, us.open_result_file(path)) as file:
+        sep = us.sniff_separator(us.peek_first_line(file))
+        try:
+            column = pd.read_csv(file, sep=sep, usecols=["Metrics"])["Metrics"]
+        except ValueError:
+            raise Exception(f"O arquivo '{path}' não contém a coluna 'Metrics'.")
+    return column.dropna().astype(str).unique().tolist()
+
+
+def get_catalog_path(simulation_directory: str) -> str:
+    """
+    Returns the path where the metric catalog of a simulation directory is stored.
+    Args:
+        simulation_directory (str): The simulation directory.
+    Returns:
+        str: The path to the catalog file.
+    """
+    return op.join(simulation_directory, CACHE_DIRECTORY_NAME, CATALOG_FILENAME)
+
+
+def load_catalog(simulation_directory: str) -> dict:
+    """
+    Loads the stored metric catalog of a simulation directory.
+    Args:
+        simulation_directory (str): The simulation directory.
+    Returns:
+        dict: The stored catalog, or an empty catalog if it is missing or invalid.
+    """
+    try:
+        with open(get_catalog_path(simulation_directory), "r") as file:
+            catalog = json.load(file)
+        if isinstance(catalog, dict) and catalog.get("version") == CATALOG_VERSION:
+            return catalog
+    except (OSError, ValueError):
+        pass
+    return {"version": CATALOG_VERSION, "groups": {}}
+
+
+def save_catalog(simulation_directory: str, catalog: dict):
+    """
+    Stores the metric catalog of a simulation directory. Failures are ignored.
+    Args:
+        simulation_directory (str): The simulation directory.
+        catalog (dict): The catalog to store.
+    """
+    path = get_catalog_path(simulation_directory)
+    try:
+        os.makedirs(op.dirname(path), exist_ok=True)
+        cus.write_atomically(path, lambda f: f.write(json.dumps(catalog).encode()))
+    except OSError:
+        pass
+
+
+def discover_metrics(
+    base_directory: str, directories: list[str], metric_type: str
+) -> dict[str, list[str]]:
+    """
+    Discovers the metrics of the simulation directories that can be selected for
+    the given metric type.\\
+    The metrics listed in `FILTERED_METRICS` come first, in their order, when they
+    are found in any directory. Metrics found in the files but not listed there
+    follow them, in the order they were found. Metric groups without an alias are
+    left out.
+    Args:
+        base_directory (str): The base directory.
+        directories (list[str]): The simulation directories.
+        metric_type (str): The metric type, "individual" or "grouped".
+    Returns:
+        dict[str, list[str]]: A dictionary mapping each metric group to its metrics.
+    """
+    found: dict[str, list[str]] = {}
+    for simulation_directory in pus.get_full_paths(base_directory, directories):
+        directory_metrics = metric_catalog.get_directory_metrics(simulation_directory)
+        for metric_group, metrics in directory_metrics.items():
+            group_metrics = found.setdefault(metric_group, [])
+            group_metrics.extend(m for m in metrics if m not in group_metrics)
+
+    known = {
+        metric
+        for grouped_metrics in FILTERED_METRICS.values()
+        for metric_list in grouped_metrics.values()
+        for metric in metric_list
+    }
+    configured = FILTERED_METRICS.get(metric_type, {})
+    discovered = {}
+    for metric_group in METRIC_GROUP_ALIASES:
+        metrics = found.get(metric_group, [])
+        group_metrics = [m for m in configured.get(metric_group, []) if m in metrics]
+        group_metrics += [m for m in metrics if m not in known]
+        if metric_type == "individual":
+            group_metrics += [m for m in metrics if m not in group_metrics]
+        if group_metrics:
+            discovered[metric_group] = group_metrics
+    return discovered
+
+
+metric_catalog = MetricCatalog()
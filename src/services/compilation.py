@@ -1,64 +1,149 @@
+from functools import partial
+import warnings
+
+import numpy as np
 import pandas as pd
-from services import simulation_utils as sus
+from scipy import stats as st
+from data.loading_data import TENSOR_STORE_ENABLED
+from services import (
+    compiled_cache as ccs,
+    path_utils as pus,
+    result_store as rss,
+    simulation_utils as sus,
+    tensor_store as tss,
+)
+
+# Statistics of the repetitions of each load point that can drive the error bars of
+# the graphs and of the exported tables: the standard error (as computed by
+# `sus.calculate_standard_error`), the standard deviation, the half-width of the
+# t-based 95% and 99% confidence intervals, and the semi-interquartile range.
+ERROR_STATISTICS = ["error", "std", "ci95", "ci99", "iqr"]
+
+# Confidence levels of the confidence interval statistics.
+CONFIDENCE_LEVELS = {"ci95": 0.95, "ci99": 0.99}
+
+# Percentiles of the order statistics.
+PERCENTILES = {"p25": 25, "median": 50, "p75": 75}
+
+# All statistics that can be compiled.
+STATISTICS = ["mean"] + ERROR_STATISTICS + list(PERCENTILES)
 
 
 class DataCompiler:
-    def __init__(self, metric_type: str, load_points: list[str]):
-        if metric_type == "individual":
-            self.filter_func = lambda: sus.filter_result_list_by_metric(
-                self.metrics[0], self.simulation_results
-            )
-            self.length_func = lambda: len(self.simulation_results)
-        elif metric_type == "grouped":
-            self.filter_func = lambda: sus.filter_result_by_metric_list(
-                self.metrics, self.simulation_results[0]
-            )
-            self.length_func = lambda: len(self.metrics)
-        else:
+    def __init__(
+        self, metric_type: str, load_points: list[str], error_statistic: str = "error"
+    ):
+        if metric_type not in ("individual", "grouped"):
             raise ValueError(f"Tipo de métrica não suportado: {metric_type}")
+        if error_statistic not in ERROR_STATISTICS:
+            raise ValueError(f"Estatística não suportada: {error_statistic}")
+        self.statistics = list(sus.STATISTIC_COLUMNS)
+        if error_statistic not in self.statistics:
+            self.statistics.append(error_statistic)
         self.load_points = load_points
         self.simulation_results = []
         self.metrics = []
 
-    def compile_data(self) -> list[pd.DataFrame]:
+    def compile_batch(self) -> list[list[pd.DataFrame]]:
         """
-        Compiles data from simulation results and metrics.
+        Compiles all metrics of all simulation results at once.\\
+        The repetitions of the metrics of each simulation result are gathered into a
+        single (metric × load point × repetition) array, and the mean and the standard
+        error of every metric, and the other statistics chosen for the error bars, are
+        computed in one vectorized pass. The returned DataFrames are views of the array
+        of statistics of each simulation result.
         Returns:
-            list[pd.DataFrame]: A list of DataFrames containing the compiled data.
+            list[list[pd.DataFrame]]: For each simulation result, a list with the
+            compiled data of each metric.
         """
-        length = self.length_func()
-        metric_results = self.filter_func()
-        if not metric_results:
-            return [pd.DataFrame()] * length
-
-        if self.load_points is not None and len(self.load_points) > 0:
-            load_points_set = {str(l) for l in self.load_points}
-            for i in range(len(metric_results)):
-                loadpoint_col = metric_results[i]["LoadPoint"]
-                first = loadpoint_col.iloc[0]
-                if isinstance(first, float) and first.is_integer():
-                    loadpoint_str = loadpoint_col.astype(int).astype(str)
-                else:
-                    loadpoint_str = loadpoint_col.astype(str)
-                metric_results[i] = metric_results[i][
-                    loadpoint_str.isin(load_points_set)
-                ]
-
-        final_results = sus.extract_repetitions(metric_results)
-        del metric_results
+        return [
+            compile_metrics(sr, self.metrics, self.load_points, self.statistics)
+            for sr in self.simulation_results
+        ]
 
-        number_of_reps = sus.get_number_of_repetitions(final_results)
-        average = sus.calculate_average(final_results)
-        error = sus.calculate_standard_error(final_results, number_of_reps)
-        del final_results
+    def compile_group(
+        self,
+        base_directory: str,
+        directory_paths: list[str],
+        metric_group: str,
+        snapshot: str | None = None,
+    ) -> list[list[pd.DataFrame]]:
+        """
+        Compiles the metrics of a metric group for each directory, reusing the series
+        compiled before from the same result files, metrics and load points.\\
+        Only the results of the directories with missing series are loaded, and all
+        their metrics are compiled at once. The results of a snapshot are not cached.
+        Snapshots and summary sidecar files only hold the mean and the standard error,
+        so the repetitions are read from the result files for any other statistic.
+        When `TENSOR_STORE_ENABLED` is set, the missing series are compiled from the
+        stored tensors of the result files instead.
+        Args:
+            base_directory (str): The base directory.
+            directory_paths (list[str]): List of directories containing the simulation results.
+            metric_group (str): The metric group.
+            snapshot (str, optional): The path to the snapshot file of the analysis.
+        Returns:
+            list[list[pd.DataFrame]]: For each directory, a list with the compiled
+            data of each metric.
+        """
+        only_saved_statistics = set(self.statistics) <= set(sus.STATISTIC_COLUMNS)
 
-        dataframes = [pd.DataFrame() for _ in range(length)]
+        def load(directories: list[str]) -> list[pd.DataFrame]:
+            return rss.load_results(
+                base_directory,
+                directories,
+                metric_group,
+                metrics=self.metrics,
+                load_points=self.load_points,
+                snapshot=snapshot if only_saved_statistics else None,
+                use_summary=None if only_saved_statistics else False,
+            )
 
-        for i in range(length):
-            dataframes[i]["mean"] = average[i]
-            dataframes[i]["error"] = error[i]
+        if snapshot and only_saved_statistics:
+            return self.set_simulation_results(load(directory_paths)).compile_batch()
 
-        return dataframes
+        paths = pus.get_result_paths(directory_paths, metric_group)
+        cached = [
+            ccs.compiled_cache.get(
+                path, self.metrics, self.load_points, self.statistics
+            )
+            for path in paths
+        ]
+        compiled = [series for _, series in cached]
+        missing = [
+            i for i, series in enumerate(compiled) if any(s is None for s in series)
+        ]
+        if missing:
+            tensors = [None] * len(missing)
+            if TENSOR_STORE_ENABLED:
+                tensors = tss.load_simulation_tensors(
+                    [directory_paths[i] for i in missing], metric_group
+                )
+            unloaded = [i for i, t in zip(missing, tensors) if t is None]
+            simulation_results = iter(
+                load([directory_paths[i] for i in unloaded]) if unloaded else []
+            )
+            for i, tensor in zip(missing, tensors):
+                if tensor is None:
+                    compiled[i] = compile_metrics(
+                        next(simulation_results),
+                        self.metrics,
+                        self.load_points,
+                        self.statistics,
+                    )
+                else:
+                    compiled[i] = compile_tensor(
+                        tensor, self.metrics, self.load_points, self.statistics
+                    )
+                ccs.compiled_cache.put(
+                    paths[i],
+                    cached[i][0],
+                    self.metrics,
+                    self.load_points,
+                    self.statistics,
+                    compiled[i],
+                )
+        return compiled
 
     def set_simulation_results(self, simulation_results: list[pd.DataFrame]):
         """
@@ -86,3 +171,324 @@ class DataCompiler:
         self.simulation_results = []
         self.metrics = []
         return self
+
+
+def compile_metrics(
+    simulation_result: pd.DataFrame,
+    metrics: list[str],
+    load_points: list[str] | None,
+    statistics: list[str] | None = None,
+) -> list[pd.DataFrame]:
+    """
+    Compiles the given metrics of a simulation result in one vectorized pass.\\
+    The repetitions are gathered with the repetition axis outermost in memory, so each
+    mean and error is accumulated in the same order as in `sus.calculate_average` and
+    `sus.calculate_standard_error`, giving the same results.
+    Statistics already present as columns, as in summaries, snapshots and followed
+    result files, are taken from them when all of the requested ones are present.
+    If the metrics do not have the same number of load points, each one is compiled
+    separately.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+        metrics (list[str]): The metrics to compile.
+        load_points (list[str] | None): The load points to keep, or None for all of them.
+        statistics (list[str], optional): The statistics to compute, from `STATISTICS`.
+            Defaults to the mean and the standard error.
+    Returns:
+        list[pd.DataFrame]: A list with the compiled data of each metric, with a column
+        for each statistic.
+    """
+    if statistics is None:
+        statistics = list(sus.STATISTIC_COLUMNS)
+    metric_index = sus.get_metric_index(simulation_result)
+    all_rows = np.arange(len(simulation_result))
+    rows = all_rows
+    if load_points:
+        rows = sus.get_load_point_positions(simulation_result, load_points)
+    positions = []
+    for metric in metrics:
+        if metric not in metric_index:
+            raise Exception(f"A métrica '{metric}' não foi encontrada no DataFrame.")
+        metric_rows = all_rows[metric_index[metric]]
+        positions.append(metric_rows[np.isin(metric_rows, rows)])
+    if not positions or any(len(p) != len(positions[0]) for p in positions):
+        return [
+            compile_metrics(simulation_result, [metric], load_points, statistics)[0]
+            for metric in metrics
+        ]
+    row_index = np.stack(positions)
+
+    repetitions = sus.extract_repetitions([simulation_result])[0]
+    if all(s in simulation_result.columns for s in statistics):
+        values = simulation_result[statistics].to_numpy(dtype=np.float64)[row_index]
+    elif len(repetitions.columns) == 0:
+        missing = [s for s in statistics if s not in simulation_result.columns]
+        raise Exception(
+            f"A estatística '{missing[0]}' não está disponível nos resultados "
+            "sem as repetições."
+        )
+    else:
+        number_of_reps = len(repetitions.columns)
+        columns = np.asfortranarray(repetitions.to_numpy()).T
+        values = np.empty((number_of_reps,) + row_index.shape, dtype=columns.dtype)
+        np.take(columns, row_index, axis=1, out=values)
+        values = calculate_statistics(values.transpose(1, 2, 0), statistics)
+    return [
+        pd.DataFrame(values[i], columns=statistics, copy=False)
+        for i in range(len(metrics))
+    ]
+
+
+def compile_tensor(
+    tensor: tss.ResultTensor,
+    metrics: list[str],
+    load_points: list[str] | None,
+    statistics: list[str] | None = None,
+) -> list[pd.DataFrame]:
+    """
+    Compiles the given metrics of the tensor of a simulation result.\\
+    The selected cells are copied with the repetition axis outermost in memory, as in
+    `compile_metrics`, so both give the same results.
+    Args:
+        tensor (ResultTensor): The tensor of the simulation result.
+        metrics (list[str]): The metrics to compile.
+        load_points (list[str] | None): The load points to keep, or None for all of them.
+        statistics (list[str], optional): The statistics to compute, from `STATISTICS`.
+            Defaults to the mean and the standard error.
+    Returns:
+        list[pd.DataFrame]: A list with the compiled data of each metric, with a column
+        for each statistic.
+    """
+    if statistics is None:
+        statistics = list(sus.STATISTIC_COLUMNS)
+    selected = tensor.select(metrics, load_points)
+    values = np.ascontiguousarray(selected.transpose(2, 0, 1)).transpose(1, 2, 0)
+    values = calculate_statistics(values, statistics)
+    return [
+        pd.DataFrame(values[i], columns=statistics, copy=False)
+        for i in range(len(metrics))
+    ]
+
+
+def calculate_statistics(
+    values: np.ndarray, statistics: list[str] | None = None
+) -> np.ndarray:
+    """
+    Calculates a set of statistics of the repetitions of a
+    (metric × load point × repetition) array, in one pass over each kind of statistic.\\
+    Each statistic is computed by its kernel in `STATISTIC_KERNELS`. The kernels share
+    their intermediate results: the mean and the standard error are computed together,
+    the confidence intervals reuse the standard deviation, and all percentiles are
+    taken from a single partition of the repetitions. Missing values are skipped by
+    the mean and propagated by the other statistics, as in `sus.calculate_average`
+    and `sus.calculate_standard_error`.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        statistics (list[str], optional): The statistics to compute, from `STATISTICS`.
+            Defaults to the mean and the standard error.
+    Returns:
+        np.ndarray: A (metric × load point × statistic) array with the statistics.
+    """
+    if statistics is None:
+        statistics = list(sus.STATISTIC_COLUMNS)
+    for statistic in statistics:
+        if statistic not in STATISTIC_KERNELS:
+            raise ValueError(f"Estatística não suportada: {statistic}")
+    computed = {"percentiles": get_required_percentiles(statistics)}
+    result = np.empty(values.shape[:2] + (len(statistics),))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for i, statistic in enumerate(statistics):
+            result[..., i] = STATISTIC_KERNELS[statistic](values, computed)
+    return result
+
+
+def get_required_percentiles(statistics: list[str]) -> list[int]:
+    """
+    Returns the percentiles needed to compute a set of statistics.
+    Args:
+        statistics (list[str]): The statistics to compute.
+    Returns:
+        list[int]: The percentiles, in ascending order.
+    """
+    percentiles = {PERCENTILES[s] for s in statistics if s in PERCENTILES}
+    if "iqr" in statistics:
+        percentiles |= {PERCENTILES["p25"], PERCENTILES["p75"]}
+    return sorted(percentiles)
+
+
+def get_mean_and_error(values: np.ndarray, computed: dict) -> np.ndarray:
+    """
+    Returns the means and the standard errors of the repetitions, computing them on first use.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        computed (dict): The intermediate results of the statistics already computed.
+    Returns:
+        np.ndarray: A (metric × load point × 2) array with the means and the errors.
+    """
+    if "mean_and_error" not in computed:
+        computed["mean_and_error"] = calculate_mean_and_error(values)
+    return computed["mean_and_error"]
+
+
+def get_mean(values: np.ndarray, computed: dict) -> np.ndarray:
+    """
+    Returns the mean of the repetitions of each metric and load point.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        computed (dict): The intermediate results of the statistics already computed.
+    Returns:
+        np.ndarray: The mean of each metric and load point.
+    """
+    return get_mean_and_error(values, computed)[..., 0]
+
+
+def get_error(values: np.ndarray, computed: dict) -> np.ndarray:
+    """
+    Returns the standard error of the repetitions of each metric and load point.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        computed (dict): The intermediate results of the statistics already computed.
+    Returns:
+        np.ndarray: The standard error of each metric and load point.
+    """
+    return get_mean_and_error(values, computed)[..., 1]
+
+
+def get_std(values: np.ndarray, computed: dict) -> np.ndarray:
+    """
+    Returns the sample standard deviation (ddof = 1) of the repetitions of each metric
+    and load point, computing it on first use.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        computed (dict): The intermediate results of the statistics already computed.
+    Returns:
+        np.ndarray: The standard deviation of each metric and load point.
+    """
+    if "std" not in computed:
+        computed["std"] = np.std(values, axis=2, ddof=1)
+    return computed["std"]
+
+
+def get_confidence_interval(
+    values: np.ndarray, computed: dict, level: float
+) -> np.ndarray:
+    """
+    Returns the half-width of the t-based confidence interval of the mean of the
+    repetitions of each metric and load point.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        computed (dict): The intermediate results of the statistics already computed.
+        level (float): The confidence level.
+    Returns:
+        np.ndarray: The half-width of each confidence interval.
+    """
+    number_of_reps = values.shape[2]
+    t = st.t.ppf((1 + level) / 2, number_of_reps - 1)
+    return t * get_std(values, computed) / np.sqrt(number_of_reps)
+
+
+def get_percentile(values: np.ndarray, computed: dict, percentile: int) -> np.ndarray:
+    """
+    Returns a percentile of the repetitions of each metric and load point. All the
+    required percentiles are computed together on first use.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        computed (dict): The intermediate results of the statistics already computed.
+        percentile (int): The percentile.
+    Returns:
+        np.ndarray: The percentile of each metric and load point.
+    """
+    if "quantiles" not in computed:
+        percentiles = computed["percentiles"]
+        quantiles = np.percentile(values, percentiles, axis=2)
+        computed["quantiles"] = dict(zip(percentiles, quantiles))
+    return computed["quantiles"][percentile]
+
+
+def get_semi_interquartile_range(values: np.ndarray, computed: dict) -> np.ndarray:
+    """
+    Returns the semi-interquartile range of the repetitions of each metric and load point.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        computed (dict): The intermediate results of the statistics already computed.
+    Returns:
+        np.ndarray: The semi-interquartile range of each metric and load point.
+    """
+    p25 = get_percentile(values, computed, PERCENTILES["p25"])
+    p75 = get_percentile(values, computed, PERCENTILES["p75"])
+    return (p75 - p25) / 2
+
+
+# Kernel of each statistic, called with the array of repetitions and the
+# intermediate results shared by the kernels.
+STATISTIC_KERNELS = {
+    "mean": get_mean,
+    "error": get_error,
+    "std": get_std,
+    "iqr": get_semi_interquartile_range,
+    **{
+        name: partial(get_confidence_interval, level=level)
+        for name, level in CONFIDENCE_LEVELS.items()
+    },
+    **{
+        name: partial(get_percentile, percentile=percentile)
+        for name, percentile in PERCENTILES.items()
+    },
+}
+
+
+def calculate_mean_and_error(values: np.ndarray) -> np.ndarray:
+    """
+    Calculates the mean and the standard error of the repetitions of a
+    (metric × load point × repetition) array.\\
+    The metrics without missing values are reduced all at once. As in
+    `pd.DataFrame.mean`, the repetitions of a metric with missing values are copied
+    with the missing values replaced by zero before they are summed, so these metrics
+    are reduced one at a time.
+    Args:
+        values (np.ndarray): The array of repetitions.
+    Returns:
+        np.ndarray: A (metric × load point × 2) array with the means and the errors.
+    """
+    number_of_reps = values.shape[2]
+    statistics = np.empty(values.shape[:2] + (2,))
+    missing = np.isnan(values)
+    with_missing = missing.any(axis=(1, 2))
+    complete = ~with_missing
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if complete.all():
+            statistics[..., 0] = values.mean(axis=2)
+            statistics[..., 1] = st.sem(values, axis=2, ddof=number_of_reps - 1)
+        elif complete.any():
+            complete_values = select_metrics(values, complete)
+            statistics[complete, :, 0] = complete_values.mean(axis=2)
+            statistics[complete, :, 1] = st.sem(
+                complete_values, axis=2, ddof=number_of_reps - 1
+            )
+        for i in np.flatnonzero(with_missing):
+            filled = np.ascontiguousarray(np.where(missing[i], 0.0, values[i]))
+            count = number_of_reps - missing[i].sum(axis=1)
+            statistics[i, :, 0] = filled.sum(axis=1) / count
+            statistics[i, :, 1] = st.sem(values[i], axis=1, ddof=number_of_reps - 1)
+    return statistics
+
+
+def select_metrics(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Selects some metrics of a (metric × load point × repetition) array, keeping the
+    repetition axis outermost in memory.
+    Args:
+        values (np.ndarray): The array of repetitions.
+        mask (np.ndarray): A boolean array indicating the metrics to select.
+    Returns:
+        np.ndarray: A (metric × load point × repetition) array with the selected metrics.
+    """
+    positions = np.flatnonzero(mask)
+    number_of_reps = values.shape[2]
+    selected = np.empty(
+        (number_of_reps, len(positions), values.shape[1]), dtype=values.dtype
+    )
+    np.take(values.transpose(2, 0, 1), positions, axis=1, out=selected)
+    return selected.transpose(1, 2, 0)
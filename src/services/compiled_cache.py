@@ -0,0 +1,231 @@
+import json
+import os
+import os.path as op
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data.loading_data import (
+    COMPILED_CACHE_MAX_BYTES,
+    COMPILED_DISK_CACHE_ENABLED,
+)
+from services import (
+    cache_utils as cus,
+    simulation_utils as sus,
+)
+
+COMPILED_SUFFIX = ".compiled"
+
+
+def get_load_points_key(load_points: list[str] | None) -> tuple[float, ...]:
+    """
+    Returns the key of a load point filter, which does not depend on the order or on
+    the type of the load points.
+    Args:
+        load_points (list[str] | None): The load points to keep, or None for all of them.
+    Returns:
+        tuple[float, ...]: The sorted load points, or an empty tuple for all of them.
+    """
+    if not load_points:
+        return ()
+    return tuple(sus.parse_load_points(load_points).tolist())
+
+
+def get_fingerprint(path: str | list[str]) -> tuple[tuple[str, ...], list[dict]]:
+    """
+    Returns the fingerprint of the files of a result, which changes whenever their
+    contents change.
+    Args:
+        path (str | list[str]): The path to the result file, or the paths to its shards.
+    Returns:
+        tuple[tuple[str, ...], list[dict]]: A tuple containing
+        - The absolute paths of the files.
+        - The signature of each file.
+    """
+    paths = path if isinstance(path, list) else [path]
+    return (
+        tuple(op.abspath(p) for p in paths),
+        [cus.get_file_signature(p) for p in paths],
+    )
+
+
+class CompiledSeriesCache:
+    """
+    Cache of the compiled series (statistics by load point) of the metrics of the
+    result files, keyed by the fingerprint of the file, the metric, the load point
+    filter and the statistics.\\
+    The series are kept in an in-process LRU cache and, when the disk cache is
+    enabled, in a JSON file next to the result file, in the cache directory, which
+    is replaced as a whole when the result file changes.
+    The cached DataFrames are shared between requests and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int, disk_enabled: bool):
+        """
+        Initializes the cache with the provided memory budget.
+        Args:
+            max_bytes (int): Maximum memory (in bytes) used by the cached series.
+            disk_enabled (bool): Whether the series are also stored on disk.
+        """
+        self.memory = cus.ResultCache(max_bytes)
+        self.disk_enabled = disk_enabled
+        self.lock = threading.Lock()
+
+    def get(
+        self,
+        path: str | list[str],
+        metrics: list[str],
+        load_points: list[str] | None,
+        statistics: list[str] = sus.STATISTIC_COLUMNS,
+    ) -> tuple[list[dict], list[pd.DataFrame | None]]:
+        """
+        Retrieves the compiled series of some metrics of a result file.
+        Args:
+            path (str | list[str]): The path to the result file, or the paths to its shards.
+            metrics (list[str]): The metrics.
+            load_points (list[str] | None): The load points to keep, or None for all of them.
+            statistics (list[str], optional): The compiled statistics.
+                Defaults to the mean and the standard error.
+        Returns:
+            tuple[list[dict], list[pd.DataFrame | None]]: A tuple containing
+            - The signature of the files, taken before the series were looked up.
+            - The compiled series of each metric, or None for the missing ones.
+        """
+        source, signature = get_fingerprint(path)
+        key = (get_load_points_key(load_points), tuple(statistics))
+        series = [
+            self.memory.get((source, metric) + key, signature) for metric in metrics
+        ]
+        if self.disk_enabled and any(s is None for s in series):
+            stored = self.load(path, source, signature)
+            for i, metric in enumerate(metrics):
+                df = stored.get((metric,) + key)
+                if series[i] is None and df is not None:
+                    self.memory.put((source, metric) + key, signature, df)
+                    series[i] = df
+        return signature, series
+
+    def put(
+        self,
+        path: str | list[str],
+        signature: list[dict],
+        metrics: list[str],
+        load_points: list[str] | None,
+        statistics: list[str],
+        series: list[pd.DataFrame],
+    ):
+        """
+        Stores the compiled series of some metrics of a result file.
+        Args:
+            path (str | list[str]): The path to the result file, or the paths to its shards.
+            signature (list[dict]): The signature of the files, taken before they were read.
+            metrics (list[str]): The metrics.
+            load_points (list[str] | None): The load points to keep, or None for all of them.
+            statistics (list[str]): The compiled statistics.
+            series (list[pd.DataFrame]): The compiled series of each metric.
+        """
+        source = get_fingerprint(path)[0]
+        key = (get_load_points_key(load_points), tuple(statistics))
+        for metric, df in zip(metrics, series):
+            self.memory.put((source, metric) + key, signature, df)
+        if self.disk_enabled:
+            with self.lock:
+                stored = self.load(path, source, signature)
+                stored.update({(m,) + key: df for m, df in zip(metrics, series)})
+                self.save(path, source, signature, stored)
+
+    def load(
+        self, path: str | list[str], source: tuple[str, ...], signature: list[dict]
+    ) -> dict[tuple[str, tuple[float, ...], tuple[str, ...]], pd.DataFrame]:
+        """
+        Loads the compiled series of a result file from the disk cache.
+        Args:
+            path (str | list[str]): The path to the result file, or the paths to its shards.
+            source (tuple[str, ...]): The absolute paths of the files.
+            signature (list[dict]): The current signature of the files.
+        Returns:
+            dict[tuple[str, tuple[float, ...], tuple[str, ...]], pd.DataFrame]: The
+            compiled series, by metric, load point filter and statistics. Empty if the
+            file is missing or stale.
+        """
+        try:
+            with open(get_compiled_path(path), "r") as file:
+                content = json.load(file)
+            if content["source"] != list(source) or content["signature"] != signature:
+                return {}
+            return {
+                (s["metric"], tuple(s["load_points"]), tuple(s["statistics"])): (
+                    pd.DataFrame(
+                        dict(zip(s["statistics"], s["values"])), dtype=np.float64
+                    )
+                )
+                for s in content["series"]
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def save(
+        self,
+        path: str | list[str],
+        source: tuple[str, ...],
+        signature: list[dict],
+        series: dict[tuple[str, tuple[float, ...], tuple[str, ...]], pd.DataFrame],
+    ):
+        """
+        Saves the compiled series of a result file to the disk cache.\\
+        Failures are ignored, since the cache is only an optimization.
+        Args:
+            path (str | list[str]): The path to the result file, or the paths to its shards.
+            source (tuple[str, ...]): The absolute paths of the files.
+            signature (list[dict]): The signature of the files the series were compiled from.
+            series (dict[tuple[str, tuple[float, ...], tuple[str, ...]], pd.DataFrame]):
+                The compiled series, by metric, load point filter and statistics.
+        """
+        content = {
+            "source": list(source),
+            "signature": signature,
+            "series": [
+                {
+                    "metric": metric,
+                    "load_points": list(load_points_key),
+                    "statistics": list(statistics),
+                    "values": [df[statistic].tolist() for statistic in statistics],
+                }
+                for (metric, load_points_key, statistics), df in series.items()
+            ],
+        }
+        compiled_path = get_compiled_path(path)
+        try:
+            os.makedirs(op.dirname(compiled_path), exist_ok=True)
+            cus.write_atomically(
+                compiled_path, lambda f: f.write(json.dumps(content).encode())
+            )
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the usage statistics of the in-process cache.
+        Returns:
+            dict[str, int]: The number of hits, misses and entries, and the memory used and available.
+        """
+        return self.memory.stats()
+
+
+def get_compiled_path(path: str | list[str]) -> str:
+    """
+    Returns the path of the file of the disk cache of the compiled series of a result.
+    Args:
+        path (str | list[str]): The path to the result file, or the paths to its shards.
+    Returns:
+        str: The path to the JSON file, in the cache directory next to the (first) result file.
+    """
+    return cus.get_cache_paths(
+        path[0] if isinstance(path, list) else path, COMPILED_SUFFIX
+    )[0]
+
+
+compiled_cache = CompiledSeriesCache(
+    COMPILED_CACHE_MAX_BYTES, COMPILED_DISK_CACHE_ENABLED
+)
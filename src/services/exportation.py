@@ -5,7 +5,6 @@ from data.metrics_data import METRIC_GROUP_ALIASES
 from services import (
     compilation as cs,
     path_utils as pus,
-    simulation_utils as sus,
 )
 
 
@@ -26,6 +25,8 @@ class ResultExporter:
         loads: list[str],
         load_points: list[str],
         overwrite: bool,
+        snapshot: str | None = None,
+        error_statistic: str = "error",
     ):
         self.set_table_format(metric_type)
         filename_prefix = op.join(base_directory, metric_type)
@@ -34,8 +35,8 @@ class ResultExporter:
         float_loads = self.get_float_loads(loads)
         int_load_points = self.get_int_load_points(load_points)
 
-        self.compiler = cs.DataCompiler(metric_type, load_points)
-        self.fmt = TableFormatter(float_loads, int_load_points)
+        self.compiler = cs.DataCompiler(metric_type, load_points, error_statistic)
+        self.fmt = TableFormatter(float_loads, int_load_points, error_statistic)
         previous_file_content = None
         if overwrite and op.exists(f"{filename}.xlsx"):
             try:
@@ -49,14 +50,19 @@ class ResultExporter:
             try:
                 for metric_group, metrics in chosen_grouped_metrics.items():
                     try:
-                        simulation_results = sus.load_simulation_results(
-                            self.full_directories, metric_group
+                        compiled_results = self.compiler.set_metrics(
+                            metrics
+                        ).compile_group(
+                            base_directory,
+                            self.full_directories,
+                            metric_group,
+                            snapshot=snapshot,
                         )
                     except Exception as e:
                         raise Exception(
                             f"Erro ao carregar resultados de simulação:\n{e}"
                         )
-                    self.set_tables_func(metrics, simulation_results, labels)
+                    self.set_tables_func(metrics, compiled_results, labels)
                     try:
                         self.write_to_excel(metric_group)
                     except Exception as e:
@@ -122,21 +128,19 @@ class ResultExporter:
     def set_tables_individual(
         self,
         metrics: list[str],
-        simulation_results: list[pd.DataFrame],
+        compiled_results: list[list[pd.DataFrame]],
         labels: list[str],
     ):
         """
         Sets the tables for metric of type 'individual'.
         Args:
             metrics (list[str]): List of metrics to be included in the tables.
-            simulation_results (list[pd.DataFrame]): List of DataFrames containing simulation results.
+            compiled_results (list[list[pd.DataFrame]]): For each simulation result, the compiled data of each metric.
             labels (list[str]): List of labels for the simulation results.
         """
         self.fmt.initialize_table_list(labels)
-        self.compiler.set_simulation_results(simulation_results)
-        for metric in metrics:
-            self.compiler.set_metrics([metric])
-            results = self.compiler.compile_data()
+        for i, metric in enumerate(metrics):
+            results = [compiled[i] for compiled in compiled_results]
 
             self.fmt.set_table(results).add_table_title(
                 "metric", metric
@@ -146,22 +150,18 @@ class ResultExporter:
     def set_tables_grouped(
         self,
         metrics: list[str],
-        simulation_results: list[pd.DataFrame],
+        compiled_results: list[list[pd.DataFrame]],
         labels: list[str],
     ):
         """
         Sets the tables for metric of type 'grouped'.
         Args:
             metrics (list[str]): List of metrics to be included in the tables.
-            simulation_results (list[pd.DataFrame]): List of DataFrames containing simulation results.
+            compiled_results (list[list[pd.DataFrame]]): For each simulation result, the compiled data of each metric.
             labels (list[str]): List of labels for the simulation results.
         """
         self.fmt.initialize_table_list(metrics)
-        self.compiler.set_metrics(metrics)
-        for label, simulation_result in zip(labels, simulation_results):
-            self.compiler.set_simulation_results([simulation_result])
-            results = self.compiler.compile_data()
-
+        for label, results in zip(labels, compiled_results):
             self.fmt.set_table(results).add_table_title(
                 "solution", label
             ).append_table().append_empty_row()
@@ -169,12 +169,19 @@ class ResultExporter:
 
 
 class TableFormatter:
-    def __init__(self, float_loads: list[float], int_load_points: list[int]):
+    def __init__(
+        self,
+        float_loads: list[float],
+        int_load_points: list[int],
+        error_statistic: str = "error",
+    ):
         """
-        Initializes the TableFormatter with the provided float loads and integer load points.
+        Initializes the TableFormatter with the provided float loads and integer load points,
+        and the statistic written next to the mean of each header.
         """
         self.float_loads = float_loads
         self.int_load_points = int_load_points
+        self.error_statistic = error_statistic
 
     def initialize_table_list(self, headers: list[str]):
         """
@@ -199,7 +206,7 @@ class TableFormatter:
         """
         Sets the table DataFrame with the current data.\\
         This method constructs a DataFrame with the specified headers,
-        integer load points, and float loads, and calculates the mean and error
+        integer load points, and float loads, and the mean and the error statistic
         for each header in the results.
         Args:
             results (list[pd.DataFrame]): List of DataFrames containing results.
@@ -208,9 +215,9 @@ class TableFormatter:
         data: list = [self.int_load_points, self.float_loads]
         for header, result in zip(self.headers, results):
             columns.append((header, "mean"))
-            columns.append((header, "error"))
+            columns.append((header, self.error_statistic))
             data.append(result["mean"])
-            data.append(result["error"])
+            data.append(result[self.error_statistic])
         self.table = pd.DataFrame(dict(zip(columns, data)))
         self.table.columns = pd.MultiIndex.from_tuples(self.table.columns)  # type: ignore
         return self
@@ -8,7 +8,6 @@ from services import (
     path_utils as pus,
     plotting as ps,
     compilation as cs,
-    simulation_utils as sus,
 )
 
 GroupedMetricT: TypeAlias = dict[str, list[str]]
@@ -32,6 +31,8 @@ class GraphGenerator:
         grouped_metrics: GroupedMetricT,
         loads: list[str],
         load_points: list[str],
+        snapshot: str | None = None,
+        error_statistic: str = "error",
     ):
         self.GENERATION_STRATEGIES: dict[str, Callable] = {
             "individual": self.generate_individual,
@@ -48,12 +49,15 @@ class GraphGenerator:
             raise ValueError(f"Idioma não suportado: {language}")
         self.set_filename_prefix(base_directory, graph_type)
         self.set_dir_labels(dir_labels, directories)
+        self.base_directory = base_directory
         self.set_full_dirs(base_directory, directories)
         self.grouped_metrics = grouped_metrics
         self.loads = loads
         self.load_points = load_points
+        self.snapshot = snapshot
+        self.error_statistic = error_statistic
 
-        self.compiler = cs.DataCompiler(metric_type, load_points)
+        self.compiler = cs.DataCompiler(metric_type, load_points, error_statistic)
 
     def generate_graphs(
         self,
@@ -90,6 +94,7 @@ class GraphGenerator:
             "legend_position": legend_position,
             "max_columns": max_columns,
             "frameon": frameon,
+            "error_statistic": self.error_statistic,
         }
         self.plotter = ps.GraphPlotter(graph_config)
 
@@ -99,12 +104,17 @@ class GraphGenerator:
             except KeyError:
                 raise ValueError(f"Grupo de métrica desconhecido: {self.metric_group}")
             try:
-                simulation_results = sus.load_simulation_results(
-                    self.full_directories, self.metric_group
+                compiled_results = self.compiler.set_metrics(metrics).compile_group(
+                    self.base_directory,
+                    self.full_directories,
+                    self.metric_group,
+                    snapshot=self.snapshot,
                 )
             except Exception as e:
-                raise ValueError(f"Erro ao carregar resultados de simulação:\n{e}")
-            self.generation_func(metrics, simulation_results)
+                raise ValueError(
+                    f"Erro ao compilar dados para o grupo '{self.metric_group}':\n{e}"
+                )
+            self.generation_func(metrics, compiled_results)
         return self
 
     def set_generation_strategy(self, metric_type: str):
@@ -154,17 +164,16 @@ class GraphGenerator:
         self.full_directories = pus.get_full_paths(base_directory, directories)
 
     def generate_individual(
-        self, metrics: list[str], simulation_results: list[pd.DataFrame]
+        self, metrics: list[str], compiled_results: list[list[pd.DataFrame]]
     ):
         """
         Generates graphs for metrics of type 'individual'.\\
-        This function compiles data for each individual metric and generates graphs
-        based on the provided parameters.
+        This function generates a graph for each individual metric from the compiled
+        data of every directory, based on the provided parameters.
         Args:
             metrics (list[str]): List of metrics to be plotted.
-            simulation_results (list[pd.DataFrame]): List of DataFrames containing the simulation results.
+            compiled_results (list[list[pd.DataFrame]]): For each directory, the compiled data of each metric.
         """
-        self.compiler.set_simulation_results(simulation_results)
         try:
             self.plotter.initialize_graphs_data(
                 self.loads,
@@ -173,14 +182,8 @@ class GraphGenerator:
             )
         except Exception as e:
             raise Exception(f"Erro ao inicializar dados dos gráficos:\n{e}")
-        for metric in metrics:
-            self.compiler.set_metrics([metric])
-            try:
-                dataframes = self.compiler.compile_data()
-            except Exception as e:
-                raise Exception(
-                    f"Erro ao compilar dados para a métrica '{metric}':\n{e}"
-                )
+        for i, metric in enumerate(metrics):
+            dataframes = [compiled[i] for compiled in compiled_results]
             filename = (
                 f"{self.filename_prefix}_{metric.replace(' ', '_').replace('/', '_')}"
             )
@@ -201,17 +204,16 @@ class GraphGenerator:
         self.compiler.reset_data()
 
     def generate_grouped(
-        self, metrics: list[str], simulation_results: list[pd.DataFrame]
+        self, metrics: list[str], compiled_results: list[list[pd.DataFrame]]
     ):
         """
         Generates graphs for metrics of type 'grouped'.\\
-        This function compiles data for each metric group and generates graphs
-        based on the provided parameters.
+        This function generates a graph for each directory from the compiled data of
+        the metric group, based on the provided parameters.
         Args:
             metrics (list[str]): List of metrics to be plotted.
-            simulation_results (list[pd.DataFrame]): List of DataFrames containing the simulation results.
+            compiled_results (list[list[pd.DataFrame]]): For each directory, the compiled data of each metric.
         """
-        self.compiler.set_metrics(metrics)
         y_label = mus.translate_metric(mus.get_metric_root(metrics[0]), self.language)
         translated_metrics = [
             mus.translate_metric(metric, self.language) for metric in metrics
@@ -225,14 +227,7 @@ class GraphGenerator:
             )
         except Exception as e:
             raise Exception(f"Erro ao inicializar dados dos gráficos:\n{e}")
-        for label, simulation_result in zip(self.dir_labels, simulation_results):
-            self.compiler.set_simulation_results([simulation_result])
-            try:
-                dataframes = self.compiler.compile_data()
-            except Exception as e:
-                raise Exception(
-                    f"Erro ao compilar dados para o grupo '{self.metric_group}':\n{e}"
-                )
+        for label, dataframes in zip(self.dir_labels, compiled_results):
             filename = f"{self.filename_prefix}_{self.metric_group_alias}_{label}"
             try:
                 self.plotter.plot_graph(
@@ -0,0 +1,234 @@
+import json
+import os
+import os.path as op
+import re
+import threading
+
+from data.loading_data import CACHE_DIRECTORY_NAME, RESULT_FILE_EXTENSIONS
+from services import cache_utils as cus
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 3
+
+# Suffix of the files holding a single repetition of a metric group.
+SHARD_PATTERN = re.compile(r"rep(\d+)")
+
+
+class DirectoryIndex:
+    """
+    Index of the simulation directories of each base directory and of the CSV
+    files of each metric group inside them.\\
+    The index is built with a single scan of the base directory, stored in its
+    cache directory and revalidated with the modification times of the directories,
+    so only the directories that changed are scanned again.
+    """
+
+    def __init__(self):
+        self.indexes: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def get_directories(self, base_directory: str) -> list[str]:
+        """
+        Retrieves the names of the simulation directories of a base directory.
+        Args:
+            base_directory (str): The base directory.
+        Returns:
+            list[str]: The names of the simulation directories.
+        """
+        with self.lock:
+            return list(self.get_index(base_directory)["directories"])
+
+    def get_group_files(self, simulation_directory: str) -> dict[str, str | list[str]]:
+        """
+        Retrieves the CSV file names of a simulation directory by metric group.
+        Args:
+            simulation_directory (str): The simulation directory.
+        Returns:
+            dict[str, str | list[str]]: A dictionary mapping each metric group to its
+            CSV file name, or to the names of its repetition shards, in order.
+        """
+        base_directory, name = op.split(op.normpath(simulation_directory))
+        mtime_ns = os.stat(simulation_directory).st_mtime_ns
+        with self.lock:
+            index = self.get_index(base_directory)
+            entry = index["directories"].get(name)
+            if entry is None or entry["mtime_ns"] != mtime_ns:
+                entry = scan_simulation_directory(simulation_directory)
+                index["directories"][name] = entry
+                save_index(base_directory, index)
+            return entry["groups"]
+
+    def get_index(self, base_directory: str) -> dict:
+        """
+        Retrieves the index of a base directory, loading, revalidating or building it
+        as needed. Must be called with the lock held.
+        Args:
+            base_directory (str): The base directory.
+        Returns:
+            dict: The index of the base directory.
+        """
+        key = op.abspath(base_directory)
+        index = self.indexes.get(key)
+        if index is None:
+            index = load_index(base_directory)
+        mtime_ns = get_base_directory_mtime(base_directory)
+        if index is None or index["mtime_ns"] != mtime_ns:
+            index = build_index(base_directory, mtime_ns, index)
+            save_index(base_directory, index)
+        self.indexes[key] = index
+        return index
+
+
+def get_base_directory_mtime(base_directory: str) -> int:
+    """
+    Returns the modification time of a base directory, creating its cache directory
+    first so that storing the index does not change it afterwards.
+    Args:
+        base_directory (str): The base directory.
+    Returns:
+        int: The modification time (ns) of the base directory.
+    """
+    try:
+        os.makedirs(op.join(base_directory, CACHE_DIRECTORY_NAME), exist_ok=True)
+    except OSError:
+        pass
+    return os.stat(base_directory).st_mtime_ns
+
+
+def build_index(base_directory: str, mtime_ns: int, previous: dict | None) -> dict:
+    """
+    Builds the index of a base directory with a single scan.\\
+    Entries of the previous index whose directories were not modified are reused.
+    Args:
+        base_directory (str): The base directory.
+        mtime_ns (int): The modification time (ns) of the base directory.
+        previous (dict | None): The previous index of the base directory, if any.
+    Returns:
+        dict: The index of the base directory.
+    """
+    previous_directories = previous["directories"] if previous else {}
+    directories = {}
+    with os.scandir(base_directory) as entries:
+        for entry in entries:
+            if entry.name == CACHE_DIRECTORY_NAME or not entry.is_dir():
+                continue
+            directory_mtime_ns = entry.stat().st_mtime_ns
+            previous_entry = previous_directories.get(entry.name)
+            if previous_entry and previous_entry["mtime_ns"] == directory_mtime_ns:
+                directories[entry.name] = previous_entry
+            else:
+                directories[entry.name] = scan_simulation_directory(entry.path)
+    return {"version": INDEX_VERSION, "mtime_ns": mtime_ns, "directories": directories}
+
+
+def scan_simulation_directory(simulation_directory: str) -> dict:
+    """
+    Scans a simulation directory for the CSV files of the metric groups.\\
+    A file named '<prefix>_<MetricGroup>.csv', optionally compressed, belongs to the
+    group 'MetricGroup', and a file named '<prefix>_<MetricGroup>_rep<k>.csv' holds
+    the k-th repetition shard of the group. When a group has more than one file for
+    the same content, the one with the preferred extension is used, and among those
+    the first one found. A single file takes precedence over the shards of its group.
+    Args:
+        simulation_directory (str): The simulation directory.
+    Returns:
+        dict: The modification time (ns) of the directory and the CSV file name, or
+        the list of shard file names, of each group.
+    """
+    mtime_ns = os.stat(simulation_directory).st_mtime_ns
+    files: dict[tuple[str, int | None], tuple[int, str]] = {}
+    with os.scandir(simulation_directory) as entries:
+        for entry in entries:
+            name = entry.name
+            parsed = parse_result_filename(name)
+            if parsed is None:
+                continue
+            group, rank, shard = parsed
+            previous = files.get((group, shard))
+            if (previous is None or rank < previous[0]) and entry.is_file():
+                files[(group, shard)] = (rank, name)
+    groups = {}
+    for (group, shard), (_, name) in sorted(
+        files.items(), key=lambda item: (item[0][0], item[0][1] or 0)
+    ):
+        if shard is None:
+            groups[group] = name
+        elif (group, None) not in files:
+            groups.setdefault(group, []).append(name)
+    return {"mtime_ns": mtime_ns, "groups": groups}
+
+
+def parse_result_filename(name: str) -> tuple[str, int, int | None] | None:
+    """
+    Parses the name of a result file.
+    Args:
+        name (str): The file name.
+    Returns:
+        tuple[str, int, int | None] | None: A tuple containing
+        - The metric group of the file.
+        - The preference rank of its extension.
+        - The repetition number of the file, if it is a repetition shard.
+        Or None if the name is not a result file name.
+    """
+    if name.startswith("."):
+        return None
+    for rank, extension in enumerate(RESULT_FILE_EXTENSIONS):
+        if name.endswith(extension):
+            parts = name[: -len(extension)].split("_")
+            shard = None
+            match = SHARD_PATTERN.fullmatch(parts[-1])
+            if match and len(parts) > 2:
+                shard = int(match.group(1))
+                parts.pop()
+            if len(parts) < 2 or not parts[-1]:
+                return None
+            return parts[-1], rank, shard
+    return None
+
+
+def get_index_path(base_directory: str) -> str:
+    """
+    Returns the path where the index of a base directory is stored.
+    Args:
+        base_directory (str): The base directory.
+    Returns:
+        str: The path to the index file.
+    """
+    return op.join(base_directory, CACHE_DIRECTORY_NAME, INDEX_FILENAME)
+
+
+def load_index(base_directory: str) -> dict | None:
+    """
+    Loads the stored index of a base directory.
+    Args:
+        base_directory (str): The base directory.
+    Returns:
+        dict | None: The stored index, or None if it is missing or invalid.
+    """
+    try:
+        with open(get_index_path(base_directory), "r") as file:
+            index = json.load(file)
+        if isinstance(index, dict) and index.get("version") == INDEX_VERSION:
+            return index
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_index(base_directory: str, index: dict):
+    """
+    Stores the index of a base directory. Failures are ignored.
+    Args:
+        base_directory (str): The base directory.
+        index (dict): The index to store.
+    """
+    try:
+        cus.write_atomically(
+            get_index_path(base_directory),
+            lambda f: f.write(json.dumps(index).encode()),
+        )
+    except OSError:
+        pass
+
+
+directory_index = DirectoryIndex()
@@ -0,0 +1,324 @@
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+import numpy as np
+
+# Number of characters read from the file at a time.
+CHUNK_SIZE = 64 * 1024
+# Smallest number of characters read at a time, since values that span many chunks
+# are copied again at every chunk.
+MIN_CHUNK_SIZE = 4 * 1024
+
+WHITESPACE = " \t\n\r"
+DELIMITERS = WHITESPACE + ",:]}"
+
+# Number of characters of a string, array or object scanned at first.
+SCAN_WINDOW = 1024
+
+# First character that is not whitespace.
+NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+# Characters that end a scalar value.
+SCALAR_END = re.compile(r"[ \t\n\r,:\]}]")
+# Character codes of the quote, of the backslash and of the brackets.
+QUOTE = ord('"')
+BACKSLASH = ord("\\")
+OPENING_BRACKETS = [ord("["), ord("{")]
+CLOSING_BRACKETS = [ord("]"), ord("}")]
+
+
+class JsonStreamReader:
+    """
+    Incremental reader of JSON documents.\\
+    The document is read in chunks and decoded one value at a time, so the reading
+    can stop as soon as the needed values are found, without reading the whole file.
+    Values that are not needed are skipped without being decoded.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE):
+        """
+        Initializes the reader.
+        Args:
+            file (TextIO): The open JSON file.
+            chunk_size (int, optional): Number of characters read at a time. Defaults to `CHUNK_SIZE`,
+                and is at least `MIN_CHUNK_SIZE`.
+        """
+        self.file = file
+        self.chunk_size = max(chunk_size, MIN_CHUNK_SIZE)
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> bool:
+        """
+        Reads the next chunk of the file, discarding the part of the buffer already decoded.
+        Returns:
+            bool: False if the end of the file was reached.
+        """
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        position = self.position
+        self.buffer = self.buffer[position:] + chunk
+        self.position = 0
+        return True
+
+    def peek_char(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it.
+        Returns:
+            str: The next character, or an empty string at the end of the file.
+        """
+        while True:
+            match = NON_WHITESPACE.search(self.buffer, self.position)
+            if match:
+                self.position = match.start()
+                return self.buffer[self.position]
+            self.position = len(self.buffer)
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str):
+        """
+        Consumes the next character, which must be the given one.
+        Args:
+            char (str): The expected character.
+        """
+        if self.peek_char() != char:
+            raise json.JSONDecodeError(f"Esperado '{char}'", self.buffer, self.position)
+        self.position += 1
+
+    def read_value(self) -> Any:
+        """
+        Decodes the next value.\\
+        A value is only accepted when followed by a delimiter or by the end of the file,
+        since a number may be split between chunks. A value that is not complete in the
+        buffer is scanned with `scan_value` and decoded once it is whole.
+        Returns:
+            Any: The decoded value.
+        """
+        self.peek_char()
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, self.position)
+            if end < len(self.buffer) and self.buffer[end] in DELIMITERS:
+                self.position = end
+                return value
+        except json.JSONDecodeError:
+            pass
+        return self.decoder.decode(self.scan_value(keep=True))
+
+    def skip_value(self):
+        """
+        Skips the next value without decoding it.
+        """
+        self.scan_value(keep=False)
+
+    def scan_value(self, keep: bool) -> str:
+        """
+        Advances past the next value without decoding it, so each character is
+        scanned only once.\\
+        Strings, arrays and objects are scanned with `find_container_end` and scalars
+        with `find_scalar_end`, reading more chunks until the end of the value is found.
+        Args:
+            keep (bool): Whether to return the text of the value.
+        Returns:
+            str: The text of the value, or an empty string if it is not kept.
+        """
+        first = self.peek_char()
+        if not first:
+            raise json.JSONDecodeError("Esperado um valor", self.buffer, self.position)
+        scalar = first not in '[{"'
+        find_end = self.find_scalar_end if scalar else self.find_container_end
+        scan = {"window": SCAN_WINDOW, "state": (0, False, False)}
+        pieces = []
+        start = self.position
+        end = find_end(start, scan)
+        while end is None:
+            if keep:
+                pieces.append(self.buffer[start:])
+            self.position = len(self.buffer)
+            start = 0
+            if not self.fill():
+                if not scalar:
+                    raise json.JSONDecodeError(
+                        "Valor incompleto", self.buffer, self.position
+                    )
+                end = start = self.position
+                break
+            end = find_end(start, scan)
+        self.position = end
+        if not keep:
+            return ""
+        pieces.append(self.buffer[start:end])
+        return "".join(pieces)
+
+    def find_scalar_end(self, start: int, scan: dict) -> int | None:
+        """
+        Finds the end of a scalar in the buffer, which is the next delimiter.
+        Args:
+            start (int): The position where the search starts.
+            scan (dict): The state of the scan, which is not used by scalars.
+        Returns:
+            int | None: The position of the delimiter, or None if it is not in the buffer.
+        """
+        match = SCALAR_END.search(self.buffer, start)
+        return match.start() if match else None
+
+    def find_container_end(self, start: int, scan: dict) -> int | None:
+        """
+        Finds the end of a string, array or object in the buffer.\\
+        The buffer is scanned with `scan_chunk` in windows that double in size, so a
+        small value costs little and a large one is scanned in large steps.
+        Args:
+            start (int): The position where the search starts.
+            scan (dict): The window size and the `scan_chunk` state, which are updated
+                so the search can continue in the next chunk.
+        Returns:
+            int | None: The position right after the end of the value, or None if it
+            does not end in the buffer.
+        """
+        index = start
+        while index < len(self.buffer):
+            stop = index + scan["window"]
+            end, *scan["state"] = scan_chunk(self.buffer[index:stop], *scan["state"])
+            if end is not None:
+                return index + end
+            index = stop
+            scan["window"] = min(2 * scan["window"], self.chunk_size)
+        return None
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterates over the keys of the next object.\\
+        After each key, the caller may consume its value with `read_value` or
+        `iter_array`; values not consumed are skipped.
+        Yields:
+            str: The keys of the object.
+        """
+        self.expect("{")
+        if self.peek_char() == "}":
+            self.position += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if self.peek_char() not in ",}":
+                self.skip_value()
+            if self.peek_char() == ",":
+                self.position += 1
+                continue
+            self.expect("}")
+            return
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        Iterates over the elements of the next array, decoding one element at a time.
+        Yields:
+            Any: The elements of the array.
+        """
+        self.expect("[")
+        if self.peek_char() == "]":
+            self.position += 1
+            return
+        while True:
+            yield self.read_value()
+            if self.peek_char() == ",":
+                self.position += 1
+                continue
+            self.expect("]")
+            return
+
+    def seek_key(self, key: str) -> bool:
+        """
+        Advances to the value of a key of the next object.
+        Args:
+            key (str): The key.
+        Returns:
+            bool: True if the key was found, with the reader positioned at its value.
+        """
+        for current_key in self.iter_object():
+            if current_key == key:
+                return True
+        return False
+
+
+def scan_chunk(
+    text: str, depth: int, in_string: bool, escaped: bool
+) -> tuple[int | None, int, bool, bool]:
+    """
+    Scans a chunk of a string, array or object, looking for the end of the value.\\
+    All characters of the chunk are classified at once: quotes preceded by an odd
+    number of backslashes are escaped, the other quotes open and close strings, and
+    the brackets outside strings change the nesting depth.
+    Args:
+        text (str): The chunk, from where the previous chunk left off.
+        depth (int): The nesting depth at the start of the chunk.
+        in_string (bool): Whether the chunk starts inside a string.
+        escaped (bool): Whether the first character of the chunk is escaped.
+    Returns:
+        tuple[int | None, int, bool, bool]: A tuple containing
+        - The position right after the end of the value, or None if it does not end
+          in the chunk, in which case the other items hold the state at its end.
+        - The nesting depth.
+        - Whether the scan is inside a string.
+        - Whether the next character is escaped.
+    """
+    if not text:
+        return None, depth, in_string, escaped
+    codes = np.frombuffer(
+        (("\\" if escaped else " ") + text).encode("utf-32-le"), dtype=np.uint32
+    )
+    positions = np.arange(len(codes))
+    last_plain = np.maximum.accumulate(np.where(codes != BACKSLASH, positions, -1))
+    backslashes = positions - last_plain
+    chars = codes[1:]
+    quotes = (chars == QUOTE) & (backslashes[:-1] % 2 == 0)
+    inside = (np.cumsum(quotes) + in_string) % 2 == 1
+    opening = np.isin(chars, OPENING_BRACKETS) & ~inside
+    closing = np.isin(chars, CLOSING_BRACKETS) & ~inside
+    levels = depth + np.cumsum(opening.astype(np.int64) - closing)
+    ends = np.flatnonzero((closing | (quotes & ~inside)) & (levels == 0))
+    if len(ends):
+        return int(ends[0]) + 1, 0, False, False
+    in_string = bool(inside[-1])
+    escaped = in_string and backslashes[-1] % 2 == 1
+    return None, int(levels[-1]), in_string, bool(escaped)
+
+
+def read_key(file: TextIO, key: str) -> Any:
+    """
+    Reads the value of a key of the top-level object of a JSON file,
+    stopping right after the value.
+    Args:
+        file (TextIO): The open JSON file.
+        key (str): The key.
+    Returns:
+        Any: The value of the key.
+    Raises:
+        KeyError: If the key is not found.
+    """
+    reader = JsonStreamReader(file)
+    if not reader.seek_key(key):
+        raise KeyError(key)
+    return reader.read_value()
+
+
+def iter_key_array(file: TextIO, key: str) -> Iterator[Any]:
+    """
+    Iterates over the elements of an array in a key of the top-level object of a
+    JSON file. The file is only read as far as the iteration goes.
+    Args:
+        file (TextIO): The open JSON file.
+        key (str): The key.
+    Yields:
+        Any: The elements of the array.
+    Raises:
+        KeyError: If the key is not found.
+    """
+    reader = JsonStreamReader(file)
+    if not reader.seek_key(key):
+        raise KeyError(key)
+    yield from reader.iter_array()
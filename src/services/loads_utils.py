@@ -1,28 +1,199 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import json
+import threading
+from typing import Any, Callable, Iterable
 
 import os.path as op
 
+from data.loading_data import LOADING_WORKERS
+from services import cache_utils as cus, json_stream as jss
+
+
+class MetadataCache:
+    """
+    Process-wide cache of the metadata of the simulation directories
+    (loads, number of load points and number of nodes).\\
+    Each value is stored with the signatures of the files it was computed from,
+    and is computed again when any of these files changes.
+    """
+
+    def __init__(self):
+        self.entries: dict[tuple[str, str], tuple[list[dict], Any]] = {}
+        self.lock = threading.Lock()
+
+    def get(
+        self, base_path: str, name: str, filenames: list[str], compute: Callable
+    ) -> Any:
+        """
+        Retrieves a metadata value, computing it if it is missing or stale.
+        Args:
+            base_path (str): The simulation directory.
+            name (str): The name of the metadata value.
+            filenames (list[str]): The files of the simulation directory the value is computed from.
+            compute (Callable): Function that computes the value.
+        Returns:
+            Any: The metadata value.
+        """
+        try:
+            signature = [
+                cus.get_file_signature(op.join(base_path, f)) for f in filenames
+            ]
+        except OSError:
+            return compute()
+        key = (op.abspath(base_path), name)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        value = compute()
+        with self.lock:
+            self.entries[key] = (signature, value)
+        return value
+
+
+metadata_cache = MetadataCache()
+
 
 def calculate_loads(
     base_directory: str, directory: str, load_points_filter: str = ""
 ) -> dict[str, float]:
     base_path = op.join(base_directory, directory)
+    total_loads, load_points_num = metadata_cache.get(
+        base_path,
+        "total_loads",
+        ["simulation", "network", "traffic"],
+        lambda: calculate_total_loads(base_path),
+    )
+    filtered_loads = filter_loads(total_loads, load_points_num, load_points_filter)
+    return filtered_loads
+
+
+def check_loads_consistency(
+    base_directory: str,
+    directories: list[str],
+    load_points_filter: str = "",
+    max_workers: int | None = None,
+) -> tuple[dict[str, float], dict]:
+    """
+    Calculates the loads of all directories concurrently and compares them with the
+    loads of the first directory.
+    Args:
+        base_directory (str): The base directory.
+        directories (list[str]): The simulation directories.
+        load_points_filter (str, optional): Filter string specifying which load points to include.
+        max_workers (int, optional): Maximum number of directories processed at the same time.
+            Defaults to `LOADING_WORKERS`.
+    Returns:
+        tuple[dict[str, float], dict]: A tuple containing
+        - The loads of the first directory.
+        - The consistency report, with the reference directory and, for each directory
+        whose loads differ, its number of load points and the loads that differ.
+    """
+    if max_workers is None:
+        max_workers = LOADING_WORKERS
+    calculate = partial(
+        calculate_loads, base_directory, load_points_filter=load_points_filter
+    )
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(directories)))
+    ) as executor:
+        all_loads = list(executor.map(calculate, directories))
+
+    reference_loads = all_loads[0]
+    differences = []
+    for directory, loads in zip(directories[1:], all_loads[1:]):
+        different_loads = {
+            load_point: [reference_loads.get(load_point), load]
+            for load_point, load in loads.items()
+            if reference_loads.get(load_point) != load
+        }
+        different_loads.update(
+            {
+                load_point: [load, None]
+                for load_point, load in reference_loads.items()
+                if load_point not in loads
+            }
+        )
+        if different_loads:
+            differences.append(
+                {
+                    "directory": directory,
+                    "load_count": len(loads),
+                    "different_loads": different_loads,
+                }
+            )
+    report = {
+        "reference": directories[0],
+        "load_count": len(reference_loads),
+        "differences": differences,
+    }
+    return reference_loads, report
+
+
+def get_loads_consistency_error(report: dict) -> str:
+    """
+    Describes the directories whose loads differ from the ones of the first directory.
+    Args:
+        report (dict): The consistency report of `check_loads_consistency`.
+    Returns:
+        str: The warning message, or an empty string if the loads of all directories are equal.
+    """
+    if not report["differences"]:
+        return ""
+    different_counts = [
+        d["directory"]
+        for d in report["differences"]
+        if d["load_count"] != report["load_count"]
+    ]
+    different_values = [
+        d["directory"]
+        for d in report["differences"]
+        if d["load_count"] == report["load_count"]
+    ]
+    message = (
+        "Gráficos gerados com sucesso, mas os pontos de carga de alguns diretórios "
+        f"selecionados não são iguais aos do diretório '{report['reference']}'."
+    )
+    if different_counts:
+        message += f" Quantidade diferente: {', '.join(different_counts)}."
+    if different_values:
+        message += f" Cargas diferentes: {', '.join(different_values)}."
+    return message
+
+
+def calculate_total_loads(base_path: str) -> tuple[list, int]:
+    """
+    Calculates the loads of all load points of a simulation directory.
+    Args:
+        base_path (str): The simulation directory.
+    Returns:
+        tuple[list, int]: A tuple containing
+        - The loads of the load points.
+        - The number of load points.
+    """
     load_points_num = get_number_of_load_points(base_path)
     nodes_num = get_number_of_nodes(base_path)
     node_pairs_num = nodes_num * (nodes_num - 1)
 
-    traffic_path = op.join(base_directory, directory, "traffic")
+    traffic_path = op.join(base_path, "traffic")
     if not op.exists(traffic_path):
         raise FileNotFoundError(f"Arquivo 'traffic' não encontrado em {traffic_path}")
 
     try:
         with open(traffic_path, "r") as f:
-            traffic = json.load(f)
-    except Exception as e:
+            filtered_req_gen = filter_request_generators(
+                jss.iter_key_array(f, "requestGenerators")
+            )
+    except (
+        OSError,
+        UnicodeDecodeError,
+        json.JSONDecodeError,
+        KeyError,
+        TypeError,
+    ) as e:
         raise ValueError(f"Erro ao ler arquivo de tráfego:\n{e}")
 
-    filtered_req_gen = filter_request_generators(traffic)
-
     arrival_rate_sum = 0
     arrival_rate_increase_sum = 0
     for req_gen in filtered_req_gen:
@@ -38,14 +209,30 @@ def calculate_loads(
     for i in range(1, load_points_num):
         load = total_loads[i - 1] + increment
         total_loads.append(round(load))
-
-    filtered_loads = filter_loads(total_loads, load_points_num, load_points_filter)
-    return filtered_loads
+    return total_loads, load_points_num
 
 
 def get_number_of_load_points(base_path: str):
     """
-    Retrieves the number of load points from the simulation file in the specified base path.
+    Retrieves the number of load points of the simulation in the specified base path,
+    from the metadata cache or from the simulation file.
+    Args:
+        base_path (str): The base directory path where the simulation file is located.
+    Returns:
+        int: The number of load points.
+    """
+    return metadata_cache.get(
+        base_path,
+        "load_points",
+        ["simulation"],
+        lambda: read_number_of_load_points(base_path),
+    )
+
+
+def read_number_of_load_points(base_path: str):
+    """
+    Reads the number of load points from the simulation file in the specified base path.\\
+    The file is only read up to the 'loadPoints' value.
     Args:
         base_path (str): The base directory path where the simulation file is located.
     Returns:
@@ -57,14 +244,28 @@ def get_number_of_load_points(base_path: str):
             f"Arquivo 'simulation' não encontrado em {simulation_path}"
         )
     with open(simulation_path, "r") as f:
-        simulation = json.load(f)
-        load_point_num = simulation["loadPoints"]
+        load_point_num = jss.read_key(f, "loadPoints")
     return load_point_num
 
 
 def get_number_of_nodes(base_path: str):
     """
-    Retrieves the number of nodes from the network file in the specified base path.
+    Retrieves the number of nodes of the network in the specified base path,
+    from the metadata cache or from the network file.
+    Args:
+        base_path (str): The base directory path where the network file is located.
+    Returns:
+        int: The number of nodes.
+    """
+    return metadata_cache.get(
+        base_path, "nodes", ["network"], lambda: read_number_of_nodes(base_path)
+    )
+
+
+def read_number_of_nodes(base_path: str):
+    """
+    Reads the number of nodes from the network file in the specified base path.\\
+    The nodes are counted one at a time and the file is only read up to the end of the 'nodes' array.
     Args:
         base_path (str): The base directory path where the network file is located.
     Returns:
@@ -74,22 +275,22 @@ def get_number_of_nodes(base_path: str):
     if not op.exists(network_path):
         raise FileNotFoundError(f"Arquivo 'network' não encontrado em {network_path}")
     with open(network_path, "r") as f:
-        network = json.load(f)
-        node_num = len(network["nodes"])
+        node_num = sum(1 for _ in jss.iter_key_array(f, "nodes"))
     return node_num
 
 
-def filter_request_generators(traffic: dict):
+def filter_request_generators(request_generators: Iterable[dict]):
     """
     Filters request generators from the traffic data based on specific criteria.\\
-    This function checks if the source node is "1" and the destination node is "2".
+    This function checks if the source node is "1" and the destination node is "2",
+    and stops at the first request generator that does not match.
     Args:
-        traffic (dict): The traffic data containing request generators.
+        request_generators (Iterable[dict]): The request generators of the traffic data.
     Returns:
         list: Filtered request generators.
     """
     filtered_req_gen = []
-    for req_gen in traffic["requestGenerators"]:
+    for req_gen in request_generators:
         if req_gen["source"] == "1" and req_gen["destination"] == "2":
             filtered_req_gen.append(req_gen)
         else:
@@ -0,0 +1,138 @@
+import io
+import os.path as op
+
+from data.loading_data import NORMALIZED_METRIC_GROUPS
+from services import index_utils as ius, utils as us
+
+
+class ColumnDropStream(io.RawIOBase):
+    """
+    Stream that removes a column from the data rows of a CSV stream while it is read.\\
+    Only rows with one field more than the header are changed, so the header and
+    the rows already in the expected layout are kept as they are.
+    """
+
+    def __init__(
+        self, source: io.BufferedReader, sep: bytes, drop_index: int, header_fields: int
+    ):
+        """
+        Initializes the stream.
+        Args:
+            source (io.BufferedReader): The CSV stream.
+            sep (bytes): The separator of the CSV stream.
+            drop_index (int): The position of the field removed from the data rows.
+            header_fields (int): The number of fields of the header.
+        """
+        self.source = source
+        self.sep = sep
+        self.drop_index = drop_index
+        self.header_fields = header_fields
+        self.pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Reads the normalized data into a buffer.
+        Args:
+            buffer: The buffer to fill.
+        Returns:
+            int: The number of bytes read, or 0 at the end of the stream.
+        """
+        while not self.pending:
+            lines = self.source.readlines(us.READ_BUFFER_SIZE)
+            if not lines:
+                return 0
+            self.pending = memoryview(
+                normalize_lines(lines, self.sep, self.drop_index, self.header_fields)
+            )
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+    def close(self):
+        self.source.close()
+        super().close()
+
+
+def needs_normalization(path: str) -> bool:
+    """
+    Checks if a result file belongs to a metric group whose layout may need to be normalized.
+    Args:
+        path (str): The path to the result file.
+    Returns:
+        bool: True if the file belongs to one of the `NORMALIZED_METRIC_GROUPS`.
+    """
+    parsed = ius.parse_result_filename(op.basename(path))
+    return parsed is not None and parsed[0] in NORMALIZED_METRIC_GROUPS
+
+
+def get_drop_index(header: bytes, first_row: bytes, sep: bytes) -> int | None:
+    """
+    Detects the layout with an extra column from the header and the first data row.\\
+    In this layout the data rows have one field more than the header, placed right
+    before the repetition columns, which is the field removed by the regular
+    expression in 'SpectrumUtilization-Regex-Fix.txt'.
+    Args:
+        header (bytes): The header line.
+        first_row (bytes): The first data row.
+        sep (bytes): The separator of the fields.
+    Returns:
+        int | None: The position of the extra field in the data rows, or None if
+        the layout is the expected one.
+    """
+    header_fields = header.split(sep)
+    if len(first_row.split(sep)) != len(header_fields) + 1:
+        return None
+    for position, column in enumerate(header_fields):
+        if b"rep" in column:
+            return position
+    return None
+
+
+def normalize_result_stream(path: str, file: io.BufferedReader) -> io.BufferedReader:
+    """
+    Normalizes the layout of a result file while it is read, if needed.
+    Args:
+        path (str): The path to the result file.
+        file (io.BufferedReader): The stream of the file, positioned at its beginning.
+    Returns:
+        io.BufferedReader: The given stream, or a stream without the extra column.
+    """
+    if not needs_normalization(path):
+        return file
+    lines = file.peek(us.READ_BUFFER_SIZE).split(b"\n", 2)
+    if len(lines) < 2:
+        return file
+    header, first_row = lines[0].rstrip(b"\r"), lines[1].rstrip(b"\r")
+    sep = us.sniff_separator(header.decode(errors="replace")).encode()
+    drop_index = get_drop_index(header, first_row, sep)
+    if drop_index is None:
+        return file
+    stream = ColumnDropStream(file, sep, drop_index, len(header.split(sep)))
+    return io.BufferedReader(stream, buffer_size=us.READ_BUFFER_SIZE)
+
+
+def normalize_lines(
+    lines: list[bytes], sep: bytes, drop_index: int, header_fields: int
+) -> bytes:
+    """
+    Removes the extra field from the lines with one field more than the header.
+    Args:
+        lines (list[bytes]): The lines, with their line breaks.
+        sep (bytes): The separator of the fields.
+        drop_index (int): The position of the field to remove.
+        header_fields (int): The number of fields of the header.
+    Returns:
+        bytes: The normalized lines.
+    """
+    normalized = []
+    for line in lines:
+        fields = line.split(sep)
+        if len(fields) == header_fields + 1:
+            del fields[drop_index]
+            line = sep.join(fields)
+        normalized.append(line)
+    return b"".join(normalized)
@@ -0,0 +1,167 @@
+import importlib.util
+import io
+import os.path as op
+import threading
+import time
+from typing import Callable
+
+import pandas as pd
+
+from data.loading_data import PARSE_ENGINE
+
+ENGINES = ("c", "pyarrow")
+
+# Extensions of the compressed result files.
+COMPRESSED_EXTENSIONS = (".gz", ".xz", ".zst")
+
+# Sizes (rows, repetition columns) of the sample CSV files parsed to calibrate the
+# automatic engine selection.
+CALIBRATION_SAMPLES = ((50, 100), (2_000, 100))
+
+
+class EngineSelector:
+    """
+    Chooses the engine used to parse each result file.\\
+    On first use, a small and a large sample file are parsed with each engine to
+    estimate its fixed cost and its cost per byte. Files at least as large as the
+    size where the costs of both engines meet are parsed with the Arrow engine.
+    """
+
+    def __init__(self):
+        self.threshold: float | None = None
+        self.lock = threading.Lock()
+
+    def select(self, size: int, engine: str = PARSE_ENGINE) -> str:
+        """
+        Selects the engine used to parse a file.
+        Args:
+            size (int): The size of the file, in bytes.
+            engine (str, optional): The configured engine. Defaults to `PARSE_ENGINE`.
+        Returns:
+            str: "pyarrow" or "c".
+        """
+        if engine not in ("auto", *ENGINES):
+            raise ValueError(f"Motor de leitura '{engine}' inválido.")
+        if engine == "c" or not is_arrow_available():
+            return "c"
+        if engine == "pyarrow":
+            return "pyarrow"
+        return "pyarrow" if size >= self.get_threshold() else "c"
+
+    def get_threshold(self) -> float:
+        """
+        Returns the file size from which the Arrow engine is used, calibrating it on first use.
+        Returns:
+            float: The size, in bytes.
+        """
+        with self.lock:
+            if self.threshold is None:
+                self.threshold = calibrate()
+            return self.threshold
+
+
+def is_arrow_available() -> bool:
+    """
+    Checks if the optional 'pyarrow' package is installed.
+    Returns:
+        bool: True if the package can be imported.
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def calibrate() -> float:
+    """
+    Estimates the file size from which the Arrow engine parses faster than the C engine.
+    Returns:
+        float: The size, in bytes, or infinity if the Arrow engine is never faster.
+    """
+    samples = [build_sample(rows, columns) for rows, columns in CALIBRATION_SAMPLES]
+    costs = {}
+    for engine in ENGINES:
+        small, large = [measure(lambda: read_sample(s, engine)) for s in samples]
+        per_byte = max(large - small, 0.0) / (len(samples[1]) - len(samples[0]))
+        costs[engine] = (small - per_byte * len(samples[0]), per_byte)
+    (c_fixed, c_per_byte), (arrow_fixed, arrow_per_byte) = costs["c"], costs["pyarrow"]
+    if arrow_per_byte >= c_per_byte:
+        return float("inf")
+    return max(arrow_fixed - c_fixed, 0.0) / (c_per_byte - arrow_per_byte)
+
+
+def build_sample(rows: int, columns: int) -> bytes:
+    """
+    Builds a sample result file.
+    Args:
+        rows (int): The number of rows.
+        columns (int): The number of repetition columns.
+    Returns:
+        bytes: The contents of the file.
+    """
+    header = ",".join(
+        ["Metrics", "LoadPoint"] + [f"rep{i + 1}" for i in range(columns)]
+    )
+    lines = [header]
+    for row in range(rows):
+        values = [f"{(row * columns + i) % 997 / 997:.6f}" for i in range(columns)]
+        lines.append(",".join([f"Metric {row // 10}", str(row % 10)] + values))
+    return ("\n".join(lines) + "\n").encode()
+
+
+def read_sample(sample: bytes, engine: str) -> pd.DataFrame:
+    """
+    Parses a sample result file.
+    Args:
+        sample (bytes): The contents of the file.
+        engine (str): The parse engine.
+    Returns:
+        pd.DataFrame: The parsed file.
+    """
+    return pd.read_csv(io.BytesIO(sample), engine=engine)  # type: ignore
+
+
+def measure(func: Callable) -> float:
+    """
+    Measures the shortest of three executions of a function.
+    Args:
+        func (Callable): The function to execute.
+    Returns:
+        float: The execution time, in seconds.
+    """
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def get_parse_engine(path: str) -> str:
+    """
+    Returns the engine used to parse a result file, chosen by its size.\\
+    The size of a compressed file does not reflect the size of the data parsed, so
+    compressed files are parsed with the C engine unless the Arrow engine is forced.
+    Args:
+        path (str): The path to the result file.
+    Returns:
+        str: "pyarrow" or "c".
+    """
+    if path.endswith(COMPRESSED_EXTENSIONS) and PARSE_ENGINE == "auto":
+        return "c"
+    return engine_selector.select(op.getsize(path))
+
+
+def read_csv_arrow(
+    file: io.BufferedReader, sep: str, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    Parses a whole CSV file with the multithreaded Arrow engine.
+    Args:
+        file (BufferedReader): The open file.
+        sep (str): The separator of the file.
+        columns (list[str], optional): If provided, only these columns are parsed.
+    Returns:
+        pd.DataFrame: The parsed file.
+    """
+    return pd.read_csv(file, sep=sep, engine="pyarrow", usecols=columns)
+
+
+engine_selector = EngineSelector()
@@ -1,11 +1,11 @@
-import glob
-import os
 import os.path as op
 
+from services.index_utils import directory_index
+
 
 def get_simulations_dirs_paths(base_directory: str) -> list[str]:
     """
-    Retrieves the simulation directories from the base directory.
+    Retrieves the simulation directories from the base directory, using the directory index.
     Args:
         base_directory (str): The base directory to search for directories.
     Returns:
@@ -15,9 +15,8 @@ def get_simulations_dirs_paths(base_directory: str) -> list[str]:
         raise FileNotFoundError(
             f"The base directory '{base_directory}' does not exist."
         )
-    entries = [op.join(base_directory, d) for d in os.listdir(base_directory)]
-    dirs = [op.normpath(d) for d in entries if op.isdir(d)]
-    return dirs
+    directories = directory_index.get_directories(base_directory)
+    return [op.normpath(op.join(base_directory, d)) for d in directories]
 
 
 def get_full_paths(base_directory: str, directories: list[str]) -> list[str]:
@@ -34,24 +33,55 @@ def get_full_paths(base_directory: str, directories: list[str]) -> list[str]:
 
 def get_csv_paths(simulation_directories: list[str], metric_group: str) -> list[str]:
     """
-    Retrieves the csv file paths from the simulation directories based on the given metric group.
+    Retrieves the csv file paths from the simulation directories based on the given metric group,
+    using the directory index.
     Args:
         simulation_directories (list[str]): The simulation directories to search for files.
         metric_group (str): The file name pattern to search for.
     Returns:
         list: A list of csv file paths matching the given pattern.
     """
+    file_paths = get_result_paths(simulation_directories, metric_group)
+    for simulation_directory, path in zip(simulation_directories, file_paths):
+        if isinstance(path, list):
+            raise Exception(
+                f"O grupo '{metric_group}' está dividido em arquivos por repetição "
+                f"no diretório '{simulation_directory}'."
+            )
+    return file_paths  # type: ignore
+
+
+def get_result_paths(
+    simulation_directories: list[str], metric_group: str
+) -> list[str | list[str]]:
+    """
+    Retrieves the result file paths from the simulation directories based on the given
+    metric group, using the directory index.\\
+    A group whose repetitions are stored in separate files is represented by the list
+    of paths of its shards, in the order of the repetitions.
+    Args:
+        simulation_directories (list[str]): The simulation directories to search for files.
+        metric_group (str): The file name pattern to search for.
+    Returns:
+        list: A list with the csv file path, or the list of shard paths, of each directory.
+    """
     file_paths = []
     empty_directories = []
     for simulation_directory in simulation_directories:
         if not op.isdir(simulation_directory):
             raise FileNotFoundError(f"O diretório '{simulation_directory}' não existe.")
-        pattern = f"{simulation_directory}/*_{metric_group}.csv"
-        file_paths_glob = glob.glob(pattern)
-        if not file_paths_glob:
+        filenames = directory_index.get_group_files(simulation_directory).get(
+            metric_group
+        )
+        if filenames is None:
             empty_directories.append(simulation_directory)
             continue
-        file_paths.append(op.normpath(file_paths_glob[0]))
+        if isinstance(filenames, list):
+            file_paths.append(
+                [op.normpath(op.join(simulation_directory, f)) for f in filenames]
+            )
+        else:
+            file_paths.append(op.normpath(op.join(simulation_directory, filenames)))
     if empty_directories and len(empty_directories) != len(simulation_directories):
         raise FileNotFoundError(
             f"Nenhum arquivo CSV encontrado para o grupo '{metric_group}' "
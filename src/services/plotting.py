@@ -47,6 +47,7 @@ class GraphPlotter:
         self.frameon = graph_config.get("frameon", False)
         self.overwrite = graph_config.get("overwrite", False)
         self.use_grid = graph_config.get("use_grid", False)
+        self.error_statistic = graph_config.get("error_statistic", "error")
 
     def initialize_graphs_data(
         self,
@@ -164,7 +165,7 @@ class GraphPlotter:
             style_idx = (i + idx_shift) % len(self.LINESTYLES)
             idx_count += 1
             mean = dataframes[i]["mean"]
-            error = dataframes[i]["error"]
+            error = dataframes[i][self.error_statistic]
             if self.graph_type == "linear" and sum(mean == 0) >= 2:
                 mean_len = len(mean)
                 for idx in range(mean_len):
@@ -248,7 +249,7 @@ class GraphPlotter:
             style_idx = (i + idx_shift) % len(self.HATCHES)
             idx_count += 1
             mean = dataframes[i]["mean"]
-            error = dataframes[i]["error"]
+            error = dataframes[i][self.error_statistic]
             plt.bar(
                 [p + i * bar_width for p in self.load_positions],
                 mean,
@@ -288,7 +289,7 @@ class GraphPlotter:
             style_idx = (i + idx_shift) % len(self.HATCHES)
             idx_count += 1
             y = dataframes[i]["mean"]
-            e = dataframes[i]["error"]
+            e = dataframes[i][self.error_statistic]
             plt.bar(
                 self.load_positions,
                 y,
@@ -0,0 +1,276 @@
+from contextlib import contextmanager
+import json
+import os
+import os.path as op
+import sqlite3
+import threading
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from data.loading_data import (
+    CACHE_DIRECTORY_NAME,
+    COMPACT_RESULTS,
+    FOLLOW_RESULT_FILES,
+    REPETITION_DTYPE,
+    RESULT_STORE_ENABLED,
+    RESULT_STORE_FILENAME,
+)
+from services import (
+    cache_utils as cus,
+    path_utils as pus,
+    simulation_utils as sus,
+    snapshot_utils as sns,
+    tailing as tls,
+)
+
+STORE_VERSION = 2
+SCHEMA = """
+DROP TABLE IF EXISTS sources;
+DROP TABLE IF EXISTS results;
+CREATE TABLE sources (
+    directory TEXT NOT NULL,
+    metric_group TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    repetitions TEXT NOT NULL,
+    PRIMARY KEY (directory, metric_group)
+);
+CREATE TABLE results (
+    directory TEXT NOT NULL,
+    metric_group TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    load_point REAL,
+    repetitions BLOB NOT NULL
+);
+CREATE INDEX results_series
+    ON results (directory, metric_group, metric, load_point);
+"""
+
+
+class ResultStore:
+    """
+    SQLite store of the simulation results of a base directory.\\
+    Each result file is ingested once, with one row per metric and load point
+    holding its repetitions as a float64 vector, and is ingested again only when it
+    is modified. Queries are served by the index on (directory, metric group,
+    metric, load point).
+    """
+
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        self.lock = threading.Lock()
+        os.makedirs(op.dirname(database_path), exist_ok=True)
+        with self.connect() as connection:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != STORE_VERSION:
+                connection.executescript(SCHEMA)
+                connection.execute(f"PRAGMA user_version = {STORE_VERSION}")
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Opens a connection to the database, committing the transaction and closing
+        the connection at the end.
+        Yields:
+            sqlite3.Connection: The connection.
+        """
+        connection = sqlite3.connect(self.database_path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def ingest(self, directory_path: str, metric_group: str):
+        """
+        Ingests the result file of a metric group of a simulation directory, unless
+        it is already stored and was not modified.
+        Args:
+            directory_path (str): The simulation directory.
+            metric_group (str): The metric group.
+        """
+        directory = op.abspath(directory_path)
+        path = pus.get_result_paths([directory_path], metric_group)[0]
+        paths = path if isinstance(path, list) else [path]
+        signature = json.dumps([cus.get_file_signature(p) for p in paths])
+        with self.lock, self.connect() as connection:
+            stored = connection.execute(
+                "SELECT signature FROM sources WHERE directory = ? AND metric_group = ?",
+                (directory, metric_group),
+            ).fetchone()
+            if stored is not None and stored[0] == signature:
+                return
+            df = sus.load_simulation_result(path)
+            repetitions = df.filter(like="rep", axis=1)
+            values = np.ascontiguousarray(repetitions.to_numpy(dtype=np.float64))
+            records = zip(
+                range(len(df)),
+                df["Metrics"].astype(str).tolist(),
+                sus.get_load_point_values(df).tolist(),
+                (row.tobytes() for row in values),
+            )
+            connection.execute(
+                "DELETE FROM results WHERE directory = ? AND metric_group = ?",
+                (directory, metric_group),
+            )
+            connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                ((directory, metric_group, *record) for record in records),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)",
+                (
+                    directory,
+                    metric_group,
+                    signature,
+                    json.dumps(repetitions.columns.tolist()),
+                ),
+            )
+
+    def fetch(
+        self,
+        directory_path: str,
+        metric_group: str,
+        metrics: list[str] | None = None,
+        load_points: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Fetches the simulation result of a metric group of a simulation directory,
+        ingesting its result file first if needed.
+        Args:
+            directory_path (str): The simulation directory.
+            metric_group (str): The metric group.
+            metrics (list[str], optional): If provided, only the rows of these metrics are returned.
+            load_points (list[str], optional): If provided, only the rows of these load points are returned.
+        Returns:
+            pd.DataFrame: A DataFrame with the 'Metrics', 'LoadPoint' and repetition
+            columns, in the order of the rows of the result file.
+        """
+        self.ingest(directory_path, metric_group)
+        directory = op.abspath(directory_path)
+        query = (
+            "SELECT metric, load_point, repetitions FROM results "
+            "WHERE directory = ? AND metric_group = ?"
+        )
+        params: list = [directory, metric_group]
+        if metrics:
+            query += f" AND metric IN ({', '.join('?' * len(metrics))})"
+            params += metrics
+        if load_points:
+            values = sus.parse_load_points(load_points).tolist()
+            query += f" AND load_point IN ({', '.join('?' * len(values))})"
+            params += values
+        with self.connect() as connection:
+            repetitions = json.loads(
+                connection.execute(
+                    "SELECT repetitions FROM sources WHERE directory = ? AND metric_group = ?",
+                    (directory, metric_group),
+                ).fetchone()[0]
+            )
+            records = connection.execute(query + " ORDER BY row", params).fetchall()
+        return build_result(records, repetitions)
+
+
+def build_result(records: list[tuple], repetitions: list[str]) -> pd.DataFrame:
+    """
+    Builds a simulation result from the records of the store, with one column per repetition.
+    Args:
+        records (list[tuple]): The (metric, load point, repetitions) records, ordered by row.
+        repetitions (list[str]): The names of the repetition columns.
+    Returns:
+        pd.DataFrame: The simulation result.
+    """
+    metrics, load_points, vectors = zip(*records) if records else ((), (), ())
+    values = np.frombuffer(b"".join(vectors), dtype=np.float64).reshape(
+        len(records), len(repetitions)
+    )
+    result = pd.DataFrame(
+        {
+            "Metrics": np.array(metrics, dtype=object),
+            "LoadPoint": np.array(load_points, dtype=np.float64),
+        }
+    )
+    result = pd.concat(
+        [result, pd.DataFrame(values, columns=repetitions, copy=True)], axis=1
+    )
+    if COMPACT_RESULTS:
+        result = sus.compact_simulation_result(result, REPETITION_DTYPE)
+    return result
+
+
+def get_result_store(base_directory: str) -> ResultStore:
+    """
+    Returns the result store of a base directory, opening it on first use.
+    Args:
+        base_directory (str): The base directory.
+    Returns:
+        ResultStore: The result store.
+    """
+    database_path = op.abspath(
+        op.join(base_directory, CACHE_DIRECTORY_NAME, RESULT_STORE_FILENAME)
+    )
+    with stores_lock:
+        store = stores.get(database_path)
+        if store is None:
+            store = ResultStore(database_path)
+            stores[database_path] = store
+        return store
+
+
+def load_results(
+    base_directory: str,
+    directory_paths: list[str],
+    metric_group: str,
+    metrics: list[str] | None = None,
+    load_points: list[str] | None = None,
+    snapshot: str | None = None,
+    use_summary: bool | None = None,
+) -> list[pd.DataFrame]:
+    """
+    Loads the simulation results of a metric group, from the result store of the
+    base directory when `RESULT_STORE_ENABLED` is set, or from the CSV files otherwise.\\
+    When a snapshot containing the metric group of all directories is given, the
+    statistics stored in it are returned instead. When `FOLLOW_RESULT_FILES` is set,
+    the CSV files are followed while they are written.
+    Args:
+        base_directory (str): The base directory.
+        directory_paths (list[str]): List of directories containing the simulation results.
+        metric_group (str): The metric group.
+        metrics (list[str], optional): If provided, only the rows of these metrics are loaded.
+        load_points (list[str], optional): If provided, only the rows of these load points are loaded.
+        snapshot (str, optional): The path to the snapshot file of the analysis.
+        use_summary (bool, optional): Whether to use the summary sidecar files of the
+            CSV files. Defaults to `SUMMARY_SIDECARS_ENABLED`.
+    Returns:
+        list[pd.DataFrame]: A list of DataFrames containing the simulation results.
+    """
+    if snapshot:
+        results = sns.load_snapshot(snapshot).get_results(
+            directory_paths, metric_group, metrics=metrics, load_points=load_points
+        )
+        if results is not None:
+            return results
+    if FOLLOW_RESULT_FILES:
+        return tls.load_followed_results(
+            directory_paths, metric_group, metrics=metrics, load_points=load_points
+        )
+    if not RESULT_STORE_ENABLED:
+        return sus.load_simulation_results(
+            directory_paths,
+            metric_group,
+            metrics=metrics,
+            load_points=load_points,
+            use_summary=use_summary,
+        )
+    store = get_result_store(base_directory)
+    return [
+        store.fetch(d, metric_group, metrics=metrics, load_points=load_points)
+        for d in directory_paths
+    ]
+
+
+# Open result stores, by database path.
+stores: dict[str, ResultStore] = {}
+stores_lock = threading.Lock()
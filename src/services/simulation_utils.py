@@ -1,7 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os.path as op
+import weakref
+import numpy as np
 import pandas as pd
 from scipy import stats as st
-from services import path_utils as pus, utils as us
+from data.loading_data import (
+    COMPACT_RESULTS,
+    DISK_CACHE_ENABLED,
+    LOADING_WORKERS,
+    READ_CHUNK_ROWS,
+    REPETITION_DTYPE,
+    SUMMARY_SIDECARS_ENABLED,
+)
+from services import (
+    cache_utils as cus,
+    normalization as nus,
+    parse_engine as pes,
+    path_utils as pus,
+    summary_utils as sms,
+    utils as us,
+)
+
+MetricIndexT = dict[str, slice | np.ndarray]
+
+# Columns with the statistics of the repetitions of each row, present when they
+# were computed before the results are compiled.
+STATISTIC_COLUMNS = ("mean", "error")
+
+# Metric row indexes of the loaded simulation results, by DataFrame id.
+metric_indexes: dict[int, MetricIndexT] = {}
+
+# Row positions of the filtered load points of the loaded simulation results, by
+# DataFrame id and load points.
+load_point_positions: dict[int, dict[tuple[float, ...], np.ndarray]] = {}
 
 
 def calculate_standard_error(
@@ -41,27 +73,688 @@ def calculate_average(results_data: list[pd.DataFrame]) -> list:
 
 
 def load_simulation_results(
-    directory_paths: list[str], metric_group: str
+    directory_paths: list[str],
+    metric_group: str,
+    max_workers: int | None = None,
+    metrics: list[str] | None = None,
+    load_points: list[str] | None = None,
+    use_summary: bool | None = None,
 ) -> list[pd.DataFrame]:
     """
-    Loads simulation results from CSV files based on the specified metric group.
+    Loads simulation results from CSV files based on the specified metric group.\\
+    The files are read concurrently by a thread pool, keeping the order of the directories.
     Args:
         directory_paths (list[str]): List of directories containing the simulation results.
         metric_group (str): The metric group to filter the CSV files by.
+        max_workers (int, optional): Maximum number of files read at the same time.
+            Defaults to `LOADING_WORKERS`. Use 1 to read the files sequentially.
+        metrics (list[str], optional): If provided, only the rows of these metrics are loaded.
+        load_points (list[str], optional): If provided, only the rows of these load points are loaded.
+        use_summary (bool, optional): Whether to use the summary sidecar files.
+            Defaults to `SUMMARY_SIDECARS_ENABLED`.
     Returns:
         list[pd.DataFrame]: A list of DataFrames containing the simulation results for the specified metric group.
+        When the summary sidecar files are used, results with a fresh summary sidecar
+        file contain the statistics of each row instead of the repetitions.
+    """
+    paths = pus.get_result_paths(directory_paths, metric_group)
+    if max_workers is None:
+        max_workers = LOADING_WORKERS
+    max_workers = min(max_workers, len(paths))
+    if use_summary is None:
+        use_summary = SUMMARY_SIDECARS_ENABLED
+    load = partial(
+        load_simulation_result,
+        metrics=metrics,
+        load_points=load_points,
+        use_summary=use_summary,
+    )
+    if max_workers <= 1:
+        return [load(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load, paths))
+
+
+def load_simulation_result(
+    path: str | list[str],
+    metrics: list[str] | None = None,
+    load_points: list[str] | None = None,
+    use_summary: bool = False,
+) -> pd.DataFrame:
+    """
+    Loads the simulation result from a single CSV file, or from the CSV files of its
+    repetition shards.\\
+    The result is kept in the in-process cache, which is used instead of the CSV file
+    while the file is not modified. On a miss, the statistics are taken from the
+    summary sidecar file when requested (see `load_summary_result`), and otherwise
+    the result is parsed (see `parse_simulation_result`).
+    Args:
+        path (str | list[str]): The path to the CSV file, or the paths to the shards.
+        metrics (list[str], optional): If provided, only the rows of these metrics are returned.
+        load_points (list[str], optional): If provided, only the rows of these load points are returned.
+        use_summary (bool, optional): Whether to return the statistics of each row
+            from the summary sidecar file of the result, when it is fresh or can be
+            brought up to date with the repetitions added since it was written.
+    Returns:
+        pd.DataFrame: A DataFrame containing the simulation result.
+    """
+    paths = path if isinstance(path, list) else [path]
+    for p in paths:
+        if not op.exists(p):
+            raise FileNotFoundError(f"O arquivo '{p}' não existe.")
+    source, signature = get_result_source(path)
+    key = (
+        source,
+        tuple(metrics) if metrics else None,
+        tuple(load_points) if load_points else None,
+    )
+    result = cus.result_cache.get(key, signature)
+    if result is None and use_summary:
+        result = load_summary_result(path, key, signature, metrics, load_points)
+    if result is None:
+        result = parse_simulation_result(path, source, signature, metrics, load_points)
+        cus.result_cache.put(key, signature, result)
+    return result
+
+
+def get_result_source(
+    path: str | list[str],
+) -> tuple[str | tuple[str, ...], dict[str, int] | list[dict[str, int]]]:
+    """
+    Returns the absolute path and the signature of a result file, or of its shards.
+    Args:
+        path (str | list[str]): The path to the CSV file, or the paths to the shards.
+    Returns:
+        tuple: A tuple containing
+        - The absolute path, or the tuple of absolute paths of the shards.
+        - The signature, or the list of signatures of the shards.
+    """
+    if isinstance(path, list):
+        return (
+            tuple(op.abspath(p) for p in path),
+            [cus.get_file_signature(p) for p in path],
+        )
+    return op.abspath(path), cus.get_file_signature(path)
+
+
+def load_summary_result(
+    path: str | list[str],
+    key: tuple,
+    signature: dict[str, int] | list[dict[str, int]],
+    metrics: list[str] | None,
+    load_points: list[str] | None,
+) -> pd.DataFrame | None:
+    """
+    Loads the statistics of each row of a result from its summary sidecar file,
+    bringing the sidecar up to date first if needed.\\
+    The summary is kept in the in-process cache, so a sidecar brought up to date in
+    memory is not updated again on every load.
+    Args:
+        path (str | list[str]): The path to the CSV file, or the paths to the shards.
+        key (tuple): The key of the result in the in-process cache.
+        signature (dict[str, int] | list[dict[str, int]]): The signature of the result.
+        metrics (list[str] | None): The metrics to keep.
+        load_points (list[str] | None): The load points to keep.
+    Returns:
+        pd.DataFrame | None: The statistics of the requested rows, or None if the
+        result has no usable summary.
+    """
+    summary_key = key + ("summary",)
+    result = cus.result_cache.get(summary_key, signature)
+    if result is not None:
+        return result
+    summary = sms.load_summary(path)
+    if summary is None:
+        summary = update_simulation_summary(path)
+    if summary is None:
+        return None
+    result = select_simulation_rows(summary, metrics, load_points)
+    if COMPACT_RESULTS:
+        result = compact_simulation_result(result)
+    cus.result_cache.put(summary_key, signature, result)
+    return result
+
+
+def parse_simulation_result(
+    path: str | list[str],
+    source: str | tuple[str, ...],
+    signature: dict[str, int] | list[dict[str, int]],
+    metrics: list[str] | None,
+    load_points: list[str] | None,
+) -> pd.DataFrame:
+    """
+    Parses the requested rows of a result, from the on-disk cache when it is fresh.\\
+    Shards are merged on each load. A file is parsed in full, and stored in the
+    on-disk cache, when `should_cache_result` says so; otherwise only the requested
+    rows and columns are parsed.
+    Args:
+        path (str | list[str]): The path to the CSV file, or the paths to the shards.
+        source (str | tuple[str, ...]): The absolute path of the result.
+        signature (dict[str, int] | list[dict[str, int]]): The signature of the result.
+        metrics (list[str] | None): The metrics to keep.
+        load_points (list[str] | None): The load points to keep.
+    Returns:
+        pd.DataFrame: The requested rows of the result, indexed by metric.
+    """
+    if isinstance(path, list):
+        df = merge_result_shards(path)
+    else:
+        df = cus.load_cached_result(path)
+        if df is None and should_cache_result(
+            source, signature, bool(metrics or load_points)
+        ):
+            df = read_simulation_csv(path)
+            cus.save_cached_result(path, df)
+    if df is not None:
+        result = select_simulation_rows(df, metrics, load_points)
+    else:
+        result = read_simulation_csv(path, metrics, load_points)
+    if COMPACT_RESULTS:
+        result = compact_simulation_result(result, REPETITION_DTYPE)
+    get_metric_index(result)
+    return result
+
+
+def should_cache_result(source: str, signature: dict[str, int], partial: bool) -> bool:
+    """
+    Checks if a result file must be parsed in full to be stored in the on-disk cache.\\
+    Parsing the whole file only pays off when it is read again, so a file of which
+    only part is requested is parsed in full only if part of it was already requested
+    since it was last modified (see `cus.PartialReadLog`).
+    Args:
+        source (str): The absolute path to the result file.
+        signature (dict[str, int]): The signature of the result file.
+        partial (bool): Whether only some metrics or load points are requested.
+    Returns:
+        bool: True if the file must be parsed in full and stored in the on-disk cache.
+    """
+    if not DISK_CACHE_ENABLED:
+        return False
+    if not partial:
+        cus.partial_read_log.forget(source)
+        return True
+    return cus.partial_read_log.record(source, signature)
+
+
+def read_simulation_csv(
+    path: str,
+    metrics: list[str] | None = None,
+    load_points: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Reads a simulation result CSV file, opening it only once.\\
+    Compressed files are decompressed and files with an extra column are normalized
+    while they are read, and the separator is sniffed from the first line of the
+    open stream. The parse engine is chosen by the size of the file.
+    When metrics or load points are provided, only the requested rows and the
+    'Metrics', 'LoadPoint' and repetition columns are kept: the C engine parses the
+    file in chunks of `READ_CHUNK_ROWS` rows, while the Arrow engine parses only
+    those columns of the whole file at once.
+    Args:
+        path (str): The path to the CSV file.
+        metrics (list[str], optional): If provided, only the rows of these metrics are kept.
+        load_points (list[str], optional): If provided, only the rows of these load points are kept.
+    Returns:
+        pd.DataFrame: A DataFrame containing the simulation result.
+    """
+    engine = pes.get_parse_engine(path)
+    with nus.normalize_result_stream(path, us.open_result_file(path)) as file:
+        header = us.peek_first_line(file).strip()
+        sep = us.sniff_separator(header)
+        if engine == "pyarrow":
+            if not metrics and not load_points:
+                df = pes.read_csv_arrow(file, sep)
+            else:
+                columns = [c for c in header.split(sep) if is_required_column(c)]
+                df = pes.read_csv_arrow(file, sep, columns)
+                if "Metrics" in df.columns:
+                    df = select_simulation_rows(df, metrics, load_points)
+        elif not metrics and not load_points:
+            df = pd.read_csv(file, sep=sep)
+        else:
+            reader = pd.read_csv(
+                file, sep=sep, usecols=is_required_column, chunksize=READ_CHUNK_ROWS
+            )
+            chunks = []
+            for chunk in reader:
+                if "Metrics" not in chunk.columns:
+                    break
+                chunks.append(select_simulation_rows(chunk, metrics, load_points))
+            df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+    if "Metrics" not in df.columns:
+        raise Exception(f"O arquivo '{path}' não contém a coluna 'Metrics'.")
+    return df
+
+
+def merge_result_shards(paths: list[str]) -> pd.DataFrame:
+    """
+    Merges the repetition shards of a metric group into a single simulation result.\\
+    The first shard is read to get the 'Metrics' and 'LoadPoint' columns, which every
+    other shard must repeat in the same order. The repetition matrix is allocated once
+    and the other shards are streamed into it in chunks of `READ_CHUNK_ROWS` rows.
+    The repetition columns are renamed 'rep1' to 'repN', in the order of the shards.
+    Args:
+        paths (list[str]): The paths to the shards, in the order of the repetitions.
+    Returns:
+        pd.DataFrame: A DataFrame containing the simulation result.
+    """
+    first = read_simulation_csv(paths[0])
+    keys = first[[c for c in ("Metrics", "LoadPoint") if c in first.columns]]
+    keys = keys.reset_index(drop=True)
+    repetition_counts = [len(first.filter(like="rep", axis=1).columns)]
+    repetition_counts += [count_repetition_columns(p) for p in paths[1:]]
+    offsets = np.cumsum([0] + repetition_counts)
+    rows = len(first)
+    matrix = np.empty((rows, offsets[-1]), dtype="float64")
+    matrix[:, : offsets[1]] = first.filter(like="rep", axis=1).to_numpy()
+
+    key_values = {c: keys[c].to_numpy() for c in keys.columns}
+    for i, path in enumerate(paths[1:], start=1):
+        start = 0
+        for chunk in iter_simulation_chunks(path):
+            stop = start + len(chunk)
+            if stop > rows or any(
+                c not in chunk.columns
+                or not np.array_equal(chunk[c].to_numpy(), values[start:stop])
+                for c, values in key_values.items()
+            ):
+                raise Exception(
+                    f"As linhas do arquivo '{path}' não correspondem às do arquivo '{paths[0]}'."
+                )
+            matrix[start:stop, offsets[i] : offsets[i + 1]] = chunk.filter(
+                like="rep", axis=1
+            ).to_numpy()
+            start = stop
+        if start != rows:
+            raise Exception(
+                f"As linhas do arquivo '{path}' não correspondem às do arquivo '{paths[0]}'."
+            )
+    repetitions = pd.DataFrame(
+        matrix, columns=[f"rep{i + 1}" for i in range(offsets[-1])], copy=False
+    )
+    return pd.concat([keys, repetitions], axis=1)
+
+
+def count_repetition_columns(path: str) -> int:
+    """
+    Counts the repetition columns of a result file from its header line.
+    Args:
+        path (str): The path to the CSV file.
+    Returns:
+        int: The number of repetition columns.
+    """
+    return len(get_repetition_columns(path))
+
+
+def get_repetition_columns(path: str) -> list[str]:
+    """
+    Returns the names of the repetition columns of a result file from its header line.
+    Args:
+        path (str): The path to the CSV file.
+    Returns:
+        list[str]: The names of the repetition columns, in the order of the file.
+    """
+    with nus.normalize_result_stream(path, us.open_result_file(path)) as file:
+        header = us.peek_first_line(file).strip()
+    return [c for c in header.split(us.sniff_separator(header)) if "rep" in c]
+
+
+def read_simulation_columns(path: str, columns: list[str]) -> pd.DataFrame:
+    """
+    Reads only the given columns of a result file.
+    Args:
+        path (str): The path to the CSV file.
+        columns (list[str]): The names of the columns to read.
+    Returns:
+        pd.DataFrame: A DataFrame containing the columns, in the given order.
+    """
+    with nus.normalize_result_stream(path, us.open_result_file(path)) as file:
+        sep = us.sniff_separator(us.peek_first_line(file))
+        return pd.read_csv(file, sep=sep, usecols=columns)[columns]
+
+
+def update_simulation_summary(path: str | list[str]) -> pd.DataFrame | None:
+    """
+    Brings a stale summary sidecar file up to date with the repetitions added to
+    its result since it was written, reading only the new repetitions.\\
+    New repetitions are new columns at the end of a result file (see
+    `read_new_repetition_columns`) or new shards after the previous ones (see
+    `read_new_repetition_shards`). Errors while reading the result are raised.
+    Args:
+        path (str | list[str]): The path to the CSV file, or the paths to the shards.
+    Returns:
+        pd.DataFrame | None: The updated summary, or None if the summary is missing or
+        can not be updated, in which case the result must be read in full. If the
+        updated summary can not be written, it is still returned.
+    """
+    content = sms.read_summary(path)
+    if content is None or not content.get("repetitions"):
+        return None
+    signature = sms.get_signature(path)
+    if isinstance(path, list):
+        new_repetitions = read_new_repetition_shards(path, content, signature)
+    else:
+        new_repetitions = read_new_repetition_columns(path, content)
+    summary = pd.DataFrame(content["rows"], columns=sms.SUMMARY_COLUMNS)
+    if new_repetitions is None or not has_summary_rows(new_repetitions[0], summary):
+        return None
+    df, new_columns, names = new_repetitions
+    values = df[new_columns].to_numpy(dtype=np.float64)
+    summary = sms.merge_running_statistics(summary, values)
+    checksum = None if isinstance(path, list) else sms.get_checksum(values[:, -1])
+    repetitions = content["repetitions"] + names
+    try:
+        sms.save_summary(path, summary, signature, repetitions, checksum)
+    except OSError:
+        pass
+    return summary
+
+
+def read_new_repetition_shards(
+    paths: list[str], content: dict, signature: list[dict[str, int]]
+) -> tuple[pd.DataFrame, list[str], list[str]] | None:
+    """
+    Reads the shards added to a result since its summary was written. The shards the
+    summary was computed from must not have been modified.
+    Args:
+        paths (list[str]): The paths to the shards.
+        content (dict): The content of the summary sidecar file.
+        signature (list[dict[str, int]]): The current signatures of the shards.
+    Returns:
+        tuple[pd.DataFrame, list[str], list[str]] | None: A tuple containing
+        - The rows of the new shards.
+        - The names of their repetition columns.
+        - The names of the new repetitions in the summary.
+        Or None if the summary can not be updated.
+    """
+    count = len(content["signature"])
+    if count >= len(paths) or content["signature"] != signature[:count]:
+        return None
+    df = merge_result_shards(paths[count:])
+    new_columns = list(df.filter(like="rep", axis=1).columns)
+    first = len(content["repetitions"]) + 1
+    names = [f"rep{first + i}" for i in range(len(new_columns))]
+    return df, new_columns, names
+
+
+def read_new_repetition_columns(
+    path: str, content: dict
+) -> tuple[pd.DataFrame, list[str], list[str]] | None:
+    """
+    Reads the repetition columns added to a result file since its summary was
+    written. The previous repetition columns must keep their names, and the last of
+    them is read again to check, by its checksum, that the file was not rewritten.
+    Args:
+        path (str): The path to the CSV file.
+        content (dict): The content of the summary sidecar file.
+    Returns:
+        tuple[pd.DataFrame, list[str], list[str]] | None: A tuple containing
+        - The keys, the last previous repetition and the new repetitions of each row.
+        - The names of the new repetition columns.
+        - The same names, as the new repetitions in the summary.
+        Or None if the summary can not be updated.
     """
-    dataframes = []
-    paths = pus.get_csv_paths(directory_paths, metric_group)
-    for path in paths:
-        if not op.exists(path):
-            raise FileNotFoundError(f"O arquivo '{path}' não existe.")
-        sep = us.get_separator(path)
-        df = pd.read_csv(path, sep=sep)
-        if "Metrics" not in df.columns:
-            raise Exception(f"O arquivo '{path}' não contém a coluna 'Metrics'.")
-        dataframes.append(df)
-    return dataframes
+    repetitions = content["repetitions"]
+    count = len(repetitions)
+    columns = get_repetition_columns(path)
+    if len(columns) <= count or columns[:count] != repetitions:
+        return None
+    new_columns = columns[count:]
+    df = read_simulation_columns(
+        path, ["Metrics", "LoadPoint", repetitions[-1]] + new_columns
+    )
+    if sms.get_checksum(df[repetitions[-1]].to_numpy()) != content["checksum"]:
+        return None
+    return df, new_columns, new_columns
+
+
+def has_summary_rows(df: pd.DataFrame, summary: pd.DataFrame) -> bool:
+    """
+    Checks if the rows of a result are the rows of its summary, in the same order.
+    Args:
+        df (DataFrame): The rows of the result.
+        summary (DataFrame): The summary.
+    Returns:
+        bool: True if both have the same metrics and load points in each row.
+    """
+    return (
+        len(df) == len(summary)
+        and np.array_equal(
+            df["Metrics"].astype(str).to_numpy(), summary["Metrics"].to_numpy()
+        )
+        and np.array_equal(
+            df["LoadPoint"].to_numpy(dtype=np.float64),
+            summary["LoadPoint"].to_numpy(dtype=np.float64),
+        )
+    )
+
+
+def iter_simulation_chunks(path: str):
+    """
+    Reads a result file in chunks of `READ_CHUNK_ROWS` rows, keeping only the
+    'Metrics', 'LoadPoint', repetition and statistics columns.
+    Args:
+        path (str): The path to the CSV file.
+    Yields:
+        pd.DataFrame: The chunks of the file.
+    """
+    with nus.normalize_result_stream(path, us.open_result_file(path)) as file:
+        sep = us.sniff_separator(us.peek_first_line(file))
+        yield from pd.read_csv(
+            file, sep=sep, usecols=is_required_column, chunksize=READ_CHUNK_ROWS
+        )
+
+
+def compact_simulation_result(
+    simulation_result: pd.DataFrame, repetition_dtype: str = "float64"
+) -> pd.DataFrame:
+    """
+    Converts a simulation result to a compact representation.\\
+    The 'Metrics' column becomes categorical, the 'LoadPoint' column becomes integer
+    when all its values are whole numbers, and the repetition columns are converted
+    to the given data type.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+        repetition_dtype (str, optional): Data type of the repetition columns. Defaults to "float64".
+    Returns:
+        pd.DataFrame: The compact DataFrame.
+    """
+    columns = {}
+    if "Metrics" in simulation_result.columns:
+        columns["Metrics"] = simulation_result["Metrics"].astype("category")
+    if "LoadPoint" in simulation_result.columns:
+        loadpoint_col = simulation_result["LoadPoint"]
+        if pd.api.types.is_float_dtype(loadpoint_col) and (
+            loadpoint_col.notna().all() and (loadpoint_col % 1 == 0).all()
+        ):
+            columns["LoadPoint"] = loadpoint_col.astype("int64")
+    for column in simulation_result.columns:
+        if "rep" in column and pd.api.types.is_float_dtype(simulation_result[column]):
+            if simulation_result[column].dtype != repetition_dtype:
+                columns[column] = simulation_result[column].astype(repetition_dtype)
+    return simulation_result.assign(**columns)
+
+
+def is_required_column(column: str) -> bool:
+    """
+    Checks if a column of a result file is used to compile the results.
+    Args:
+        column (str): The column name.
+    Returns:
+        bool: True for the 'Metrics', 'LoadPoint', repetition and statistics columns.
+    """
+    return (
+        column in ("Metrics", "LoadPoint")
+        or "rep" in column
+        or column in STATISTIC_COLUMNS
+    )
+
+
+def select_simulation_rows(
+    simulation_result: pd.DataFrame,
+    metrics: list[str] | None = None,
+    load_points: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Selects the rows of the requested metrics and load points from a simulation result.\\
+    If neither metrics nor load points are provided, the DataFrame is returned unchanged.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+        metrics (list[str], optional): The metrics to keep.
+        load_points (list[str], optional): The load points to keep.
+    Returns:
+        pd.DataFrame: A DataFrame with the requested rows and the required columns.
+    """
+    if not metrics and not load_points:
+        return simulation_result
+    columns = [c for c in simulation_result.columns if is_required_column(c)]
+    selected = simulation_result[columns]
+    if metrics:
+        selected = selected[selected["Metrics"].isin(metrics)]
+    if load_points:
+        selected = filter_result_by_load_points(selected, load_points)
+    return selected
+
+
+def filter_result_by_load_points(
+    simulation_result: pd.DataFrame, load_points: list[str]
+) -> pd.DataFrame:
+    """
+    Filters the simulation result by load points.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+        load_points (list[str]): The load points to keep.
+    Returns:
+        pd.DataFrame: A DataFrame containing only the rows of the given load points.
+    """
+    if simulation_result.empty:
+        return simulation_result
+    return simulation_result.iloc[
+        select_load_point_rows(simulation_result, load_points)
+    ]
+
+
+def parse_load_points(load_points: list[str] | list[int | float]) -> np.ndarray:
+    """
+    Converts load points to numbers, so that they are compared with the 'LoadPoint'
+    column by value, whether it holds integers or floats.\\
+    Load points that are not numbers are ignored, since they match no row.
+    Args:
+        load_points (list[str] | list[int | float]): The load points.
+    Returns:
+        np.ndarray: The sorted unique load points, as floats.
+    """
+    values = []
+    for lp in load_points:
+        try:
+            values.append(float(lp))
+        except (TypeError, ValueError):
+            continue
+    return np.unique(np.array(values, dtype=np.float64))
+
+
+def get_load_point_values(simulation_result: pd.DataFrame) -> np.ndarray:
+    """
+    Returns the 'LoadPoint' column of a simulation result as floats.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+    Returns:
+        np.ndarray: The load point of each row, or NaN where it is not a number.
+    """
+    loadpoint_col = simulation_result["LoadPoint"]
+    if not pd.api.types.is_numeric_dtype(loadpoint_col):
+        loadpoint_col = pd.to_numeric(loadpoint_col, errors="coerce")
+    return loadpoint_col.to_numpy(dtype=np.float64)
+
+
+def select_load_point_rows(
+    simulation_result: pd.DataFrame, load_points: list[str]
+) -> np.ndarray:
+    """
+    Returns the positions of the rows of the given load points in a simulation result.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+        load_points (list[str]): The load points to keep.
+    Returns:
+        np.ndarray: The positions of the rows, in ascending order.
+    """
+    return np.flatnonzero(
+        np.isin(
+            get_load_point_values(simulation_result), parse_load_points(load_points)
+        )
+    )
+
+
+def get_load_point_positions(
+    simulation_result: pd.DataFrame, load_points: list[str]
+) -> np.ndarray:
+    """
+    Returns the positions of the rows of the given load points in a simulation result,
+    resolving them on first use.\\
+    The positions are kept while the DataFrame exists and reused by every metric, so
+    the DataFrame must not be modified.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+        load_points (list[str]): The load points to keep.
+    Returns:
+        np.ndarray: The positions of the rows, in ascending order.
+    """
+    key = id(simulation_result)
+    positions = load_point_positions.get(key)
+    if positions is None:
+        positions = {}
+        load_point_positions[key] = positions
+        weakref.finalize(simulation_result, load_point_positions.pop, key, None)
+    load_points_key = tuple(parse_load_points(load_points).tolist())
+    rows = positions.get(load_points_key)
+    if rows is None:
+        rows = select_load_point_rows(simulation_result, load_points)
+        positions[load_points_key] = rows
+    return rows
+
+
+def get_metric_index(simulation_result: pd.DataFrame) -> MetricIndexT:
+    """
+    Returns the metric row index of a simulation result, building it on first use.\\
+    The index is kept while the DataFrame exists, so the DataFrame must not be modified.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+    Returns:
+        MetricIndexT: A dictionary mapping each metric to the positions of its rows.
+    """
+    key = id(simulation_result)
+    index = metric_indexes.get(key)
+    if index is None:
+        index = build_metric_index(simulation_result)
+        metric_indexes[key] = index
+        weakref.finalize(simulation_result, metric_indexes.pop, key, None)
+    return index
+
+
+def build_metric_index(simulation_result: pd.DataFrame) -> MetricIndexT:
+    """
+    Builds the index of the rows of each metric with a single factorization of the
+    'Metrics' column.\\
+    The rows of a metric are stored as a slice when they are contiguous, as it is
+    usual in the result files, or as an array of positions otherwise.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+    Returns:
+        MetricIndexT: A dictionary mapping each metric to the positions of its rows.
+    """
+    if "Metrics" not in simulation_result.columns:
+        raise Exception("O DataFrame não contém a coluna 'Metrics'.")
+    codes, uniques = pd.factorize(simulation_result["Metrics"])
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    index = {}
+    for code, metric in enumerate(uniques):
+        positions = order[bounds[code] : bounds[code + 1]]
+        if positions[-1] - positions[0] + 1 == len(positions):
+            index[metric] = slice(int(positions[0]), int(positions[-1]) + 1)
+        else:
+            index[metric] = positions
+    return index
 
 
 def filter_result_list_by_metric(
@@ -77,11 +770,10 @@ def filter_result_list_by_metric(
     """
     filtered_results = []
     for sr in simulation_results:
-        if "Metrics" not in sr.columns:
-            raise Exception("O DataFrame não contém a coluna 'Metrics'.")
-        if metric not in sr["Metrics"].values:
+        metric_index = get_metric_index(sr)
+        if metric not in metric_index:
             raise Exception(f"A métrica '{metric}' não foi encontrada no DataFrame.")
-        filtered_results.append(sr[sr.Metrics == metric])
+        filtered_results.append(sr.iloc[metric_index[metric]])
     return filtered_results
 
 
@@ -96,13 +788,12 @@ def filter_result_by_metric_list(
     Returns:
         list: A list of DataFrames containing the filtered metrics.
     """
-    if "Metrics" not in simulation_result.columns:
-        raise Exception("O DataFrame não contém a coluna 'Metrics'.")
+    metric_index = get_metric_index(simulation_result)
     filtered_results = []
     for metric in metrics:
-        if metric not in simulation_result["Metrics"].values:
+        if metric not in metric_index:
             raise Exception(f"A métrica '{metric}' não foi encontrada no DataFrame.")
-        filtered_results.append(simulation_result[simulation_result.Metrics == metric])
+        filtered_results.append(simulation_result.iloc[metric_index[metric]])
     return filtered_results
 
 
@@ -116,3 +807,16 @@ def extract_repetitions(simulation_results: list[pd.DataFrame]) -> list:
     """
 
     return [d.filter(like="rep", axis=1) for d in simulation_results]
+
+
+def has_statistics(simulation_results: list[pd.DataFrame]) -> bool:
+    """
+    Checks if the statistics of each row were already computed in the simulation results.
+    Args:
+        simulation_results (list[DataFrame]): List of DataFrames containing the simulation results.
+    Returns:
+        bool: True if all DataFrames contain the statistics columns.
+    """
+    return all(
+        all(c in sr.columns for c in STATISTIC_COLUMNS) for sr in simulation_results
+    )
@@ -0,0 +1,196 @@
+import json
+import os.path as op
+import threading
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from services import (
+    cache_utils as cus,
+    loads_utils as lus,
+    path_utils as pus,
+    simulation_utils as sus,
+)
+
+SNAPSHOT_VERSION = 1
+
+
+class Snapshot:
+    """
+    Analysis snapshot: the selected directories, their labels, the metric groups,
+    the loads and the statistics of every metric and load point of the selected
+    metric groups, which are used instead of the result files.
+    """
+
+    def __init__(self, metadata: dict, results: dict[tuple[str, str], pd.DataFrame]):
+        self.base_directory: str = metadata["base_directory"]
+        self.metric_type: str = metadata["metric_type"]
+        self.directories: list[str] = metadata["directories"]
+        self.labels: list[str] = metadata["labels"]
+        self.grouped_metrics: dict[str, list[str]] = metadata["grouped_metrics"]
+        self.loads: list[float] = metadata["loads"]
+        self.results = results
+
+    def get_results(
+        self,
+        directories: list[str],
+        metric_group: str,
+        metrics: list[str] | None = None,
+        load_points: list[str] | None = None,
+    ) -> list[pd.DataFrame] | None:
+        """
+        Retrieves the statistics of a metric group of the given directories.
+        Args:
+            directories (list[str]): The simulation directories.
+            metric_group (str): The metric group.
+            metrics (list[str], optional): If provided, only the rows of these metrics are returned.
+            load_points (list[str], optional): If provided, only the rows of these load points are returned.
+        Returns:
+            list[pd.DataFrame] | None: A list of DataFrames with the 'Metrics', 'LoadPoint',
+            'mean' and 'error' columns, or None if the snapshot does not contain the
+            metric group of all directories.
+        """
+        keys = [(metric_group, op.basename(op.normpath(d))) for d in directories]
+        if any(key not in self.results for key in keys):
+            return None
+        return [
+            sus.select_simulation_rows(self.results[key], metrics, load_points)
+            for key in keys
+        ]
+
+    def get_loads(self, load_points_filter: str = "") -> dict[str, float]:
+        """
+        Retrieves the loads of the snapshot, filtered by load points.
+        Args:
+            load_points_filter (str, optional): Filter string specifying which load points to include.
+        Returns:
+            dict[str, float]: A dictionary mapping each load point to its load.
+        """
+        return lus.filter_loads(self.loads, len(self.loads), load_points_filter)
+
+    def get_config_data(self) -> dict:
+        """
+        Returns the selection of the snapshot in the structure of the configuration files.
+        Returns:
+            dict: A dictionary with the directories and their labels and the metrics.
+        """
+        return {
+            "directories": dict(zip(self.directories, self.labels)),
+            "metrics": self.grouped_metrics,
+        }
+
+
+def compute_statistics(simulation_result: pd.DataFrame) -> np.ndarray:
+    """
+    Computes the mean and the standard error of each row of a simulation result,
+    as `sus.calculate_average` and `sus.calculate_standard_error` do.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+    Returns:
+        np.ndarray: An array with the mean and the error of each row.
+    """
+    if sus.has_statistics([simulation_result]):
+        return simulation_result[list(sus.STATISTIC_COLUMNS)].to_numpy(dtype="float64")
+    repetitions = sus.extract_repetitions([simulation_result])
+    number_of_reps = sus.get_number_of_repetitions(repetitions)
+    average = sus.calculate_average(repetitions)[0]
+    error = sus.calculate_standard_error(repetitions, number_of_reps)[0]
+    return np.column_stack([average, error]).astype("float64")
+
+
+def save_snapshot(
+    path: str,
+    base_directory: str,
+    metric_type: str,
+    directories: list[str],
+    labels: list[str],
+    grouped_metrics: dict[str, list[str]],
+):
+    """
+    Compiles the selected metric groups of the selected directories and saves them,
+    with the selection and the loads, in a compressed NPZ file.
+    Args:
+        path (str): The path to the snapshot file.
+        base_directory (str): The base directory.
+        metric_type (str): The metric type.
+        directories (list[str]): The selected simulation directories.
+        labels (list[str]): The labels of the directories.
+        grouped_metrics (dict[str, list[str]]): The selected metrics, by metric group.
+    """
+    loads = list(lus.calculate_loads(base_directory, directories[0]).values())
+    full_directories = pus.get_full_paths(base_directory, directories)
+    arrays = {}
+    results = []
+    for metric_group in grouped_metrics:
+        simulation_results = sus.load_simulation_results(full_directories, metric_group)
+        for directory, simulation_result in zip(directories, simulation_results):
+            i = len(results)
+            results.append([metric_group, directory])
+            arrays[f"metrics_{i}"] = (
+                simulation_result["Metrics"].astype(str).to_numpy(dtype=str)
+            )
+            arrays[f"load_points_{i}"] = simulation_result["LoadPoint"].to_numpy(
+                dtype="float64"
+            )
+            arrays[f"statistics_{i}"] = compute_statistics(simulation_result)
+    metadata = {
+        "version": SNAPSHOT_VERSION,
+        "base_directory": base_directory,
+        "metric_type": metric_type,
+        "directories": directories,
+        "labels": labels,
+        "grouped_metrics": grouped_metrics,
+        "loads": loads,
+        "results": results,
+    }
+    arrays["metadata"] = np.array(json.dumps(metadata))
+    cus.write_atomically(path, lambda f: np.savez_compressed(f, **arrays))
+
+
+def load_snapshot(path: str) -> Snapshot:
+    """
+    Loads a snapshot file, reusing the loaded snapshot while the file is not modified.
+    Args:
+        path (str): The path to the snapshot file.
+    Returns:
+        Snapshot: The snapshot.
+    """
+    if not op.exists(path):
+        raise FileNotFoundError(f"O arquivo de snapshot '{path}' não existe.")
+    key = op.abspath(path)
+    signature = cus.get_file_signature(path)
+    with snapshots_lock:
+        cached = snapshots.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            metadata = json.loads(str(npz["metadata"]))
+            if metadata.get("version") != SNAPSHOT_VERSION:
+                raise ValueError()
+            results = {}
+            for i, (metric_group, directory) in enumerate(metadata["results"]):
+                statistics = npz[f"statistics_{i}"]
+                result = pd.DataFrame(
+                    {
+                        "Metrics": npz[f"metrics_{i}"],
+                        "LoadPoint": npz[f"load_points_{i}"],
+                        "mean": statistics[:, 0],
+                        "error": statistics[:, 1],
+                    }
+                )
+                results[(metric_group, directory)] = sus.compact_simulation_result(
+                    result
+                )
+        snapshot = Snapshot(metadata, results)
+    except (OSError, ValueError, KeyError, IndexError, zipfile.BadZipFile):
+        raise Exception(f"O arquivo '{path}' não é um snapshot válido.")
+    with snapshots_lock:
+        snapshots[key] = (signature, snapshot)
+    return snapshot
+
+
+# Loaded snapshots, by path, with the signature of their files.
+snapshots: dict[str, tuple[dict, Snapshot]] = {}
+snapshots_lock = threading.Lock()
@@ -0,0 +1,183 @@
+import json
+import os
+import os.path as op
+
+import numpy as np
+import pandas as pd
+
+from services import cache_utils as cus
+
+SUMMARY_SUFFIX = ".summary"
+SUMMARY_VERSION = 2
+SUMMARY_COLUMNS = ["Metrics", "LoadPoint", "mean", "error", "n", "m2"]
+
+
+def get_summary_path(path: str | list[str]) -> str:
+    """
+    Returns the path of the summary sidecar file of a result file.
+    Args:
+        path (str | list[str]): The path to the result file, or the paths to its shards.
+    Returns:
+        str: The path to the summary file, in the cache directory next to the (first)
+        result file.
+    """
+    first_path = path[0] if isinstance(path, list) else path
+    return cus.get_cache_paths(first_path, SUMMARY_SUFFIX)[0]
+
+
+def get_signature(path: str | list[str]) -> list[dict[str, int]]:
+    """
+    Returns the signatures of the files of a result.
+    Args:
+        path (str | list[str]): The path to the result file, or the paths to its shards.
+    Returns:
+        list[dict[str, int]]: The signature of each file.
+    """
+    paths = path if isinstance(path, list) else [path]
+    return [cus.get_file_signature(p) for p in paths]
+
+
+def save_summary(
+    path: str | list[str],
+    summary: pd.DataFrame,
+    signature: list[dict[str, int]],
+    repetitions: list[str],
+    checksum: float | None,
+):
+    """
+    Writes the summary sidecar file of a result file.
+    Args:
+        path (str | list[str]): The path to the result file, or the paths to its shards.
+        summary (DataFrame): The summary, with the `SUMMARY_COLUMNS` columns.
+        signature (list[dict[str, int]]): The signatures of the files the summary was
+            computed from, taken before they were read.
+        repetitions (list[str]): The repetition columns the summary was computed from.
+        checksum (float | None): The checksum of the last of these repetition columns,
+            or None for a result split into shards.
+    """
+    content = {
+        "version": SUMMARY_VERSION,
+        "signature": signature,
+        "repetitions": repetitions,
+        "checksum": checksum,
+        "columns": SUMMARY_COLUMNS,
+        "rows": summary[SUMMARY_COLUMNS].values.tolist(),
+    }
+    summary_path = get_summary_path(path)
+    os.makedirs(op.dirname(summary_path), exist_ok=True)
+    cus.write_atomically(summary_path, lambda f: f.write(json.dumps(content).encode()))
+
+
+def read_summary(path: str | list[str]) -> dict | None:
+    """
+    Reads the content of the summary sidecar file of a result file, even if stale.
+    Args:
+        path (str | list[str]): The path to the result file, or the paths to its shards.
+    Returns:
+        dict | None: The content of the summary file, or None if it is missing or invalid.
+    """
+    try:
+        with open(get_summary_path(path), "r") as file:
+            content = json.load(file)
+        if (
+            content.get("version") != SUMMARY_VERSION
+            or content.get("columns") != SUMMARY_COLUMNS
+        ):
+            return None
+        return content
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def load_summary(path: str | list[str]) -> pd.DataFrame | None:
+    """
+    Loads the summary sidecar file of a result file.
+    Args:
+        path (str | list[str]): The path to the result file, or the paths to its shards.
+    Returns:
+        pd.DataFrame | None: The summary, or None if it is missing, invalid or stale.
+    """
+    content = read_summary(path)
+    if content is None or content.get("signature") != get_signature(path):
+        return None
+    return pd.DataFrame(content["rows"], columns=SUMMARY_COLUMNS)
+
+
+def get_checksum(values: np.ndarray) -> float:
+    """
+    Returns the checksum of a repetition column, used to detect whether it was
+    rewritten since a summary was computed from it.
+    Args:
+        values (np.ndarray): The values of the repetition column.
+    Returns:
+        float: The sum of the values, skipping missing values.
+    """
+    return float(np.nansum(values))
+
+
+def compute_running_statistics(
+    repetitions: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the running statistics of each row of a (row × repetition) array.\\
+    As in `sus.calculate_average`, missing values are skipped in the count and in the
+    mean, while the sum of squared differences of a row with missing values is missing,
+    as the standard error of `sus.calculate_standard_error`.
+    Args:
+        repetitions (np.ndarray): The array of repetitions.
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: A tuple containing
+        - The number of repetitions of each row.
+        - The mean of each row.
+        - The sum of squared differences from the mean (M2) of each row.
+    """
+    n = np.count_nonzero(~np.isnan(repetitions), axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(repetitions, axis=1) / n
+    m2 = ((repetitions - mean[:, np.newaxis]) ** 2).sum(axis=1)
+    return n, mean, m2
+
+
+def get_standard_error(m2: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Returns the standard error of each row from its running statistics, as
+    `sus.calculate_standard_error` computes it (with `ddof = n - 1`).
+    Args:
+        m2 (np.ndarray): The sum of squared differences from the mean of each row.
+        n (np.ndarray): The number of repetitions of each row.
+    Returns:
+        np.ndarray: The standard error of each row.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.sqrt(m2) / np.sqrt(n)
+
+
+def merge_running_statistics(
+    summary: pd.DataFrame, repetitions: np.ndarray
+) -> pd.DataFrame:
+    """
+    Adds new repetitions to a summary, combining their running statistics with the
+    ones of the summary (Chan et al. parallel update), in O(new repetitions).
+    Args:
+        summary (DataFrame): The summary, with the `SUMMARY_COLUMNS` columns.
+        repetitions (np.ndarray): The (row × repetition) array of the new repetitions,
+            with the rows in the order of the summary.
+    Returns:
+        pd.DataFrame: The updated summary.
+    """
+    n_a = summary["n"].to_numpy(dtype=np.int64)
+    mean_a = summary["mean"].to_numpy(dtype=np.float64)
+    m2_a = summary["m2"].to_numpy(dtype=np.float64)
+    n_b, mean_b, m2_b = compute_running_statistics(repetitions)
+    n = n_a + n_b
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = mean_b - mean_a
+        mean = np.where(n_a == 0, mean_b, mean_a + delta * n_b / n)
+        mean = np.where(n_b == 0, mean_a, mean)
+        m2 = m2_a + m2_b + delta**2 * n_a * n_b / n
+    updated = summary.copy()
+    updated["mean"] = mean
+    updated["error"] = get_standard_error(m2, n)
+    updated["n"] = n
+    updated["m2"] = m2
+    return updated
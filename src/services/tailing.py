@@ -0,0 +1,313 @@
+from collections import OrderedDict
+import io
+import os
+import threading
+
+import pandas as pd
+
+from data.loading_data import FOLLOWED_FILES_MAX_ENTRIES, RESULT_FILE_EXTENSIONS
+from services import (
+    normalization as nus,
+    path_utils as pus,
+    simulation_utils as sus,
+    utils as us,
+)
+
+
+class TailingReader:
+    """
+    Reader of result files that are still being written by the simulator.\\
+    The reader remembers, for each file, the offset of the last complete line it
+    parsed, the parsed DataFrame and the statistics of each row, so each read only
+    parses the bytes appended since the previous one.\\
+    A new repetition is written as a new column, which rewrites every line of the
+    file, so when the header only gains repetition columns just the new columns are
+    parsed. If the header changes otherwise, or the file shrinks, it is read again
+    from the beginning.\\
+    The states of the least recently read files are dropped when more than
+    `max_entries` files are followed.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initializes the reader with the provided size limit.
+        Args:
+            max_entries (int): Maximum number of files whose state is kept.
+        """
+        self.max_entries = max_entries
+        self.states: OrderedDict[str, dict] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def read(self, path: str) -> pd.DataFrame:
+        """
+        Reads a result file, parsing only the lines appended since the previous read.\\
+        The returned DataFrame also contains the 'mean' and 'error' columns with the
+        statistics of the repetitions of each row.
+        Args:
+            path (str): The path to the result file.
+        Returns:
+            pd.DataFrame: A DataFrame containing the complete lines of the file.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"O arquivo '{path}' não existe.")
+        if path.endswith((".gz", ".xz", ".zst")):
+            return add_statistics(sus.read_simulation_csv(path))
+        with self.lock:
+            state = self.states.get(path)
+            with open(path, "rb") as file:
+                if state is not None and is_same_file(file, state):
+                    read_appended_lines(file, state)
+                elif state is None or not read_added_columns(file, state):
+                    state = read_from_start(path, file)
+            self.states[path] = state
+            self.states.move_to_end(path)
+            while len(self.states) > self.max_entries:
+                self.states.popitem(last=False)
+            return state["df"]
+
+
+def is_same_file(file: io.BufferedReader, state: dict) -> bool:
+    """
+    Checks if a file still starts with the header read before and was not truncated.
+    Args:
+        file (io.BufferedReader): The open file, positioned at its beginning.
+        state (dict): The state of the previous read.
+    Returns:
+        bool: True if the previous state can be extended with the appended lines.
+    """
+    size = os.fstat(file.fileno()).st_size
+    if size < state["offset"]:
+        return False
+    return file.read(len(state["header"])) == state["header"]
+
+
+def read_from_start(path: str, file: io.BufferedReader) -> dict:
+    """
+    Reads the complete lines of a file from its beginning.
+    Args:
+        path (str): The path to the file.
+        file (io.BufferedReader): The open file, positioned at its beginning.
+    Returns:
+        dict: The state of the read.
+    """
+    file.seek(0)
+    data = get_complete_lines(file.read())
+    if not data:
+        raise Exception(f"O arquivo '{path}' ainda não tem nenhuma linha completa.")
+    lines = data.split(b"\n", 2)
+    header = lines[0] + b"\n"
+    sep = us.sniff_separator(header.decode(errors="replace"))
+    state = {
+        "offset": len(data),
+        "header": header,
+        "sep": sep,
+        "drop_index": None,
+        "header_fields": len(header.split(sep.encode())),
+    }
+    if nus.needs_normalization(path) and len(lines) > 1:
+        state["drop_index"] = nus.get_drop_index(
+            lines[0].rstrip(b"\r"), lines[1].rstrip(b"\r"), sep.encode()
+        )
+    df = pd.read_csv(io.BytesIO(normalize_data(data, state)), sep=sep)
+    if "Metrics" not in df.columns:
+        raise Exception(f"O arquivo '{path}' não contém a coluna 'Metrics'.")
+    state["columns"] = [c for c in df.columns]
+    state["df"] = add_statistics(df)
+    return state
+
+
+def read_appended_lines(file: io.BufferedReader, state: dict):
+    """
+    Parses the complete lines appended to a file since the previous read and
+    appends them, with their statistics, to the DataFrame of the state.
+    Args:
+        file (io.BufferedReader): The open file.
+        state (dict): The state of the previous read, which is updated.
+    """
+    file.seek(state["offset"])
+    data = get_complete_lines(file.read())
+    if not data.strip():
+        return
+    appended = pd.read_csv(
+        io.BytesIO(normalize_data(data, state)),
+        sep=state["sep"],
+        header=None,
+        names=state["columns"],
+    )
+    state["df"] = pd.concat([state["df"], add_statistics(appended)], ignore_index=True)
+    state["offset"] += len(data)
+
+
+def read_added_columns(file: io.BufferedReader, state: dict) -> bool:
+    """
+    Reads the repetition columns added to a file since the previous read.\\
+    Every line of the file was rewritten, so the whole file is read again, but only
+    the 'Metrics' and 'LoadPoint' fields at the start of each line and the last
+    column read before and the added columns at its end are split and parsed. If the
+    first three are not equal to the ones read before, the lines were changed
+    otherwise and the file is read again. The statistics of each row are computed
+    again from all repetitions.
+    Args:
+        file (io.BufferedReader): The open file.
+        state (dict): The state of the previous read, which is updated.
+    Returns:
+        bool: False if the file did not just gain repetition columns, in which case
+        the state is not changed.
+    """
+    file.seek(0)
+    data = get_complete_lines(file.read())
+    header = data[: data.find(b"\n") + 1]
+    sep = state["sep"].encode()
+    old_fields = state["header"].rstrip(b"\r\n").split(sep)
+    new_fields = header.rstrip(b"\r\n").split(sep)
+    old_count = len(old_fields)
+    added_fields = new_fields[old_count:]
+    if (
+        new_fields[:old_count] != old_fields
+        or not added_fields
+        or not all(b"rep" in field for field in added_fields)
+    ):
+        return False
+
+    previous = state["df"]
+    columns = state["columns"]
+    if "Metrics" not in columns or "LoadPoint" not in columns:
+        return False
+    checked_columns = ["Metrics", "LoadPoint", columns[-1]]
+    head_positions = [columns.index("Metrics"), columns.index("LoadPoint")]
+    parsed = read_line_ends(data, sep, head_positions, len(added_fields) + 1, state)
+    if (
+        parsed is None
+        or len(parsed) != len(previous)
+        or not all(parsed[c].equals(previous[c]) for c in checked_columns)
+    ):
+        return False
+
+    added = parsed.drop(columns=checked_columns)
+    df = pd.concat([previous.drop(columns=list(sus.STATISTIC_COLUMNS)), added], axis=1)
+    state.update(
+        header=header,
+        header_fields=len(new_fields),
+        columns=list(df.columns),
+        df=add_statistics(df),
+        offset=len(data),
+    )
+    return True
+
+
+def read_line_ends(
+    data: bytes, sep: bytes, head_positions: list[int], tail_count: int, state: dict
+) -> pd.DataFrame | None:
+    """
+    Parses some of the first fields and the last fields of each line of a file,
+    without splitting the fields between them.
+    Args:
+        data (bytes): The complete lines of the file, starting with its header.
+        sep (bytes): The separator of the fields.
+        head_positions (list[int]): The positions of the first fields to parse.
+        tail_count (int): The number of last fields to parse.
+        state (dict): The state of the read.
+    Returns:
+        pd.DataFrame | None: A DataFrame with the parsed fields, or None if the lines
+        do not have enough fields or the extra column of the file is among the
+        first fields.
+    """
+    head_count = max(head_positions) + 1
+    drop_index = state["drop_index"]
+    if drop_index is not None and drop_index < head_count:
+        return None
+    lines = []
+    for line in data.split(b"\n"):
+        line = line.rstrip(b"\r")
+        if not line:
+            continue
+        head = line.split(sep, head_count)
+        if len(head) <= head_count:
+            return None
+        tail = head[head_count].rsplit(sep, tail_count)[-tail_count:]
+        if len(tail) < tail_count:
+            return None
+        lines.append(sep.join([head[p] for p in head_positions] + tail))
+    return pd.read_csv(io.BytesIO(b"\n".join(lines)), sep=state["sep"])
+
+
+def normalize_data(data: bytes, state: dict) -> bytes:
+    """
+    Removes the extra column of the data rows, if the file has it.
+    Args:
+        data (bytes): The complete lines read from the file.
+        state (dict): The state of the read.
+    Returns:
+        bytes: The normalized lines.
+    """
+    if state["drop_index"] is None:
+        return data
+    return nus.normalize_lines(
+        data.splitlines(keepends=True),
+        state["sep"].encode(),
+        state["drop_index"],
+        state["header_fields"],
+    )
+
+
+def get_complete_lines(data: bytes) -> bytes:
+    """
+    Removes the last line of the data if it is still incomplete.
+    Args:
+        data (bytes): The data read from the file.
+    Returns:
+        bytes: The data up to the last line break.
+    """
+    return data[: data.rfind(b"\n") + 1]
+
+
+def add_statistics(simulation_result: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds the 'mean' and 'error' columns, with the statistics of the repetitions
+    of each row, to a simulation result.
+    Args:
+        simulation_result (DataFrame): The DataFrame containing the simulation result.
+    Returns:
+        pd.DataFrame: The DataFrame with the statistics columns.
+    """
+    repetitions = sus.extract_repetitions([simulation_result])
+    number_of_reps = sus.get_number_of_repetitions(repetitions)
+    return simulation_result.assign(
+        mean=sus.calculate_average(repetitions)[0],
+        error=sus.calculate_standard_error(repetitions, number_of_reps)[0],
+    )
+
+
+tailing_reader = TailingReader(FOLLOWED_FILES_MAX_ENTRIES)
+
+
+def load_followed_results(
+    directory_paths: list[str],
+    metric_group: str,
+    metrics: list[str] | None = None,
+    load_points: list[str] | None = None,
+) -> list[pd.DataFrame]:
+    """
+    Loads simulation results that are still being written, parsing only the lines
+    and repetition columns added since the previous call.\\
+    Compressed files and results sharded by repetition are loaded as usual.
+    Args:
+        directory_paths (list[str]): List of directories containing the simulation results.
+        metric_group (str): The metric group to filter the CSV files by.
+        metrics (list[str], optional): If provided, only the rows of these metrics are returned.
+        load_points (list[str], optional): If provided, only the rows of these load points are returned.
+    Returns:
+        list[pd.DataFrame]: A list of DataFrames containing the simulation results,
+        with the statistics of each row.
+    """
+    results = []
+    for path in pus.get_result_paths(directory_paths, metric_group):
+        if isinstance(path, list) or not path.endswith(RESULT_FILE_EXTENSIONS[0]):
+            results.append(sus.load_simulation_result(path, metrics, load_points))
+        else:
+            results.append(
+                sus.select_simulation_rows(
+                    tailing_reader.read(path), metrics, load_points
+                )
+            )
+    return results
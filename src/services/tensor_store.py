@@ -0,0 +1,274 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import os.path as op
+
+import numpy as np
+import pandas as pd
+
+from data.loading_data import DISK_CACHE_ENABLED, LOADING_WORKERS
+from services import cache_utils as cus, path_utils as pus, simulation_utils as sus
+
+TENSOR_SUFFIX = ".tensor"
+# Version of the stored tensors. Stored tensors of other versions are rebuilt.
+TENSOR_VERSION = 2
+TENSOR_AXES = ["metric", "load_point", "repetition"]
+
+
+class ResultTensor:
+    """
+    Dense metric × load point × repetition array of a simulation result.\\
+    Only results with exactly one row per metric and load point, with the load points
+    of each metric in ascending order, are represented, so the tensor holds the same
+    rows as the result file in the same order.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        metrics: list[str],
+        load_points: list[int | float],
+        repetitions: list[str],
+    ):
+        """
+        Initializes the tensor with its values and the labels of its axes.
+        Args:
+            values (np.ndarray): Array of shape (metrics, load points, repetitions).
+            metrics (list[str]): Labels of the metric axis.
+            load_points (list[int | float]): Labels of the load point axis, in ascending order.
+            repetitions (list[str]): Labels of the repetition axis.
+        """
+        self.values = values
+        self.metrics = metrics
+        self.load_points = load_points
+        self.repetitions = repetitions
+        self.metric_positions = {m: i for i, m in enumerate(metrics)}
+        self.load_point_values = np.asarray(load_points, dtype=np.float64)
+
+    @classmethod
+    def from_dataframe(cls, simulation_result: pd.DataFrame) -> "ResultTensor":
+        """
+        Builds the tensor of a simulation result.
+        Args:
+            simulation_result (DataFrame): The DataFrame containing the simulation result.
+        Returns:
+            ResultTensor: The tensor of the simulation result.
+        Raises:
+            ValueError: If a metric has a missing or repeated load point, or its load
+                points are not in ascending order.
+        """
+        metric_index = sus.get_metric_index(simulation_result)
+        metrics = [str(m) for m in metric_index]
+        metric_codes = np.empty(len(simulation_result), dtype=np.intp)
+        for code, positions in enumerate(metric_index.values()):
+            metric_codes[positions] = code
+
+        loadpoint_col = simulation_result["LoadPoint"].to_numpy()
+        load_points, load_codes = np.unique(loadpoint_col, return_inverse=True)
+        if load_points.dtype.kind == "f" and np.all(load_points % 1 == 0):
+            load_points = load_points.astype(np.int64)
+
+        expected_codes = np.arange(len(load_points))
+        for metric, positions in metric_index.items():
+            if not np.array_equal(load_codes[positions], expected_codes):
+                raise ValueError(
+                    f"A métrica '{metric}' não tem exatamente uma linha por ponto de "
+                    "carga, em ordem crescente."
+                )
+
+        repetitions = sus.extract_repetitions([simulation_result])[0]
+        data = repetitions.to_numpy()
+        values = np.empty(
+            (len(metrics), len(load_points), len(repetitions.columns)),
+            dtype=np.result_type(data.dtype, np.float32),
+        )
+        values[metric_codes, load_codes] = data
+        return cls(
+            values, metrics, load_points.tolist(), [str(c) for c in repetitions.columns]
+        )
+
+    def get_metric_positions(self, metrics: list[str]) -> list[int]:
+        """
+        Returns the positions of the given metrics in the metric axis.
+        Args:
+            metrics (list[str]): The metrics.
+        Returns:
+            list[int]: The positions of the metrics.
+        """
+        positions = []
+        for metric in metrics:
+            if metric not in self.metric_positions:
+                raise Exception(f"A métrica '{metric}' não foi encontrada no tensor.")
+            positions.append(self.metric_positions[metric])
+        return positions
+
+    def get_load_positions(self, load_points: list[str] | None) -> list[int]:
+        """
+        Returns the positions of the given load points in the load point axis.\\
+        Load points not present in the tensor are ignored.
+        Args:
+            load_points (list[str] | None): The load points, or None for all of them.
+        Returns:
+            list[int]: The positions of the load points.
+        """
+        if not load_points:
+            return list(range(len(self.load_points)))
+        wanted = sus.parse_load_points(load_points)
+        return np.flatnonzero(np.isin(self.load_point_values, wanted)).tolist()
+
+    def select(
+        self, metrics: list[str], load_points: list[str] | None = None
+    ) -> np.ndarray:
+        """
+        Selects the cells of the given metrics and load points.\\
+        When the requested positions are contiguous, the result is a view of the
+        tensor values, otherwise only the requested cells are copied.
+        Args:
+            metrics (list[str]): The metrics to select.
+            load_points (list[str] | None, optional): The load points to select.
+                Defaults to all of them.
+        Returns:
+            np.ndarray: Array of shape (metrics, load points, repetitions).
+        """
+        metric_index = to_index(self.get_metric_positions(metrics))
+        load_index = to_index(self.get_load_positions(load_points))
+        if isinstance(metric_index, slice) and isinstance(load_index, slice):
+            return self.values[metric_index, load_index]
+        if isinstance(metric_index, slice):
+            metric_index = np.arange(metric_index.start, metric_index.stop)
+        if isinstance(load_index, slice):
+            load_index = np.arange(load_index.start, load_index.stop)
+        return self.values[np.ix_(metric_index, load_index)]
+
+    def get_header(self) -> dict:
+        """
+        Returns the header describing the axes of the tensor.
+        Returns:
+            dict: The names, labels and sizes of the axes.
+        """
+        return {
+            "version": TENSOR_VERSION,
+            "axes": TENSOR_AXES,
+            "shape": list(self.values.shape),
+            "metric": self.metrics,
+            "load_point": self.load_points,
+            "repetition": self.repetitions,
+        }
+
+
+def to_index(positions: list[int]) -> slice | np.ndarray:
+    """
+    Converts a list of positions to a slice when they are contiguous and ascending.
+    Args:
+        positions (list[int]): The positions.
+    Returns:
+        slice | np.ndarray: A slice, or an array with the positions.
+    """
+    if positions and positions == list(range(positions[0], positions[-1] + 1)):
+        return slice(positions[0], positions[-1] + 1)
+    return np.array(positions, dtype=np.intp)
+
+
+class TensorStore:
+    """
+    On-disk store of the tensors of the result files.\\
+    Each tensor is written as a NPY file in the cache directory next to its result
+    file, with a JSON header naming its axes, and is opened as a memory map.
+    """
+
+    def load(self, path: str | list[str]) -> ResultTensor | None:
+        """
+        Loads the tensor of a result file, building and storing it when it is missing or stale.\\
+        The tensors of results sharded by repetition are built but not stored.
+        Args:
+            path (str | list[str]): The path to the result file, or the paths to its shards.
+        Returns:
+            ResultTensor | None: The tensor of the result file, or None if the result
+            can not be represented as a tensor.
+        """
+        if not isinstance(path, list):
+            tensor = self.open(path)
+            if tensor is not None:
+                return tensor
+        try:
+            tensor = ResultTensor.from_dataframe(sus.load_simulation_result(path))
+        except ValueError:
+            return None
+        if not isinstance(path, list):
+            self.write(path, tensor)
+        return tensor
+
+    def open(self, path: str) -> ResultTensor | None:
+        """
+        Opens the stored tensor of a result file as a memory map.
+        Args:
+            path (str): The path to the result file.
+        Returns:
+            ResultTensor | None: The stored tensor, or None if it is missing or stale.
+        """
+        if not DISK_CACHE_ENABLED:
+            return None
+        header_path, data_path = cus.get_cache_paths(path, TENSOR_SUFFIX)
+        try:
+            with open(header_path, "r") as file:
+                header = json.load(file)
+            if header.get("version") != TENSOR_VERSION:
+                return None
+            if header["signature"] != cus.get_file_signature(path):
+                return None
+            values = np.load(data_path, mmap_mode="r")
+            if list(values.shape) != header["shape"]:
+                return None
+            return ResultTensor(
+                values, header["metric"], header["load_point"], header["repetition"]
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def write(self, path: str, tensor: ResultTensor):
+        """
+        Stores the tensor of a result file. Failures are ignored.
+        Args:
+            path (str): The path to the result file.
+            tensor (ResultTensor): The tensor to store.
+        """
+        if not DISK_CACHE_ENABLED:
+            return
+        header_path, data_path = cus.get_cache_paths(path, TENSOR_SUFFIX)
+        header = tensor.get_header()
+        try:
+            header["signature"] = cus.get_file_signature(path)
+            os.makedirs(op.dirname(header_path), exist_ok=True)
+            cus.write_atomically(data_path, lambda f: np.save(f, tensor.values))
+            cus.write_atomically(
+                header_path, lambda f: f.write(json.dumps(header).encode())
+            )
+        except OSError:
+            pass
+
+
+tensor_store = TensorStore()
+
+
+def load_simulation_tensors(
+    directory_paths: list[str], metric_group: str, max_workers: int | None = None
+) -> list[ResultTensor | None]:
+    """
+    Loads the tensors of the simulation results of the specified metric group.
+    Args:
+        directory_paths (list[str]): List of directories containing the simulation results.
+        metric_group (str): The metric group of the result files.
+        max_workers (int, optional): Maximum number of files loaded at the same time.
+            Defaults to `LOADING_WORKERS`.
+    Returns:
+        list[ResultTensor | None]: A list of tensors, in the order of the directories,
+        with None for the results that can not be represented as a tensor.
+    """
+    paths = pus.get_result_paths(directory_paths, metric_group)
+    if max_workers is None:
+        max_workers = LOADING_WORKERS
+    max_workers = min(max_workers, len(paths))
+    if max_workers <= 1:
+        return [tensor_store.load(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(tensor_store.load, paths))
@@ -1,4 +1,11 @@
+import gzip
+import io
 import json
+import lzma
+from typing import BinaryIO
+
+# Size of the read buffer of the result files, which must hold their first line.
+READ_BUFFER_SIZE = 1024**2
 
 
 def to_json(obj: dict) -> str:
@@ -31,16 +38,81 @@ def to_float(*values: str) -> list[float]:
 
 def get_separator(path: str) -> str:
     """
-    Determines the separator used in a CSV file based on its first line.
+    Determines the separator used in a CSV file based on its first line.\\
+    Compressed files are decompressed before the first line is read.
     Args:
         path (str): The path to the CSV file.
     Returns:
         str: The separator used in the CSV file, either ',' or ';'.
     """
-    with open(path, "r") as file:
-        first_line = file.readline()
-        sep = "," if "," in first_line else ";"
-    return sep
+    with open_result_file(path) as file:
+        first_line = peek_first_line(file)
+    return sniff_separator(first_line)
+
+
+def open_result_file(path: str) -> io.BufferedReader:
+    """
+    Opens a result file for binary reading, decompressing it while it is read
+    if its extension is '.gz', '.xz' or '.zst'.
+    Args:
+        path (str): The path to the result file.
+    Returns:
+        io.BufferedReader: The buffered stream of the (decompressed) file.
+    """
+    if path.endswith(".gz"):
+        stream: BinaryIO = gzip.open(path, "rb")
+    elif path.endswith(".xz"):
+        stream = lzma.open(path, "rb")
+    elif path.endswith(".zst"):
+        stream = open_zstd_file(path)
+    else:
+        return open(path, "rb", buffering=READ_BUFFER_SIZE)
+    return io.BufferedReader(stream, buffer_size=READ_BUFFER_SIZE)  # type: ignore
+
+
+def open_zstd_file(path: str) -> BinaryIO:
+    """
+    Opens a Zstandard compressed file for binary reading, using the optional
+    'zstandard' package.
+    Args:
+        path (str): The path to the compressed file.
+    Returns:
+        BinaryIO: The stream of the decompressed file.
+    """
+    try:
+        import zstandard
+    except ImportError:
+        raise Exception(
+            f"O arquivo '{path}' está compactado com Zstandard, "
+            "mas o pacote 'zstandard' não está instalado. "
+            "Instale-o com 'pip install zstandard'."
+        )
+    return zstandard.ZstdDecompressor().stream_reader(
+        open(path, "rb"), read_across_frames=True, closefd=True
+    )
+
+
+def peek_first_line(file: io.BufferedReader) -> str:
+    """
+    Returns the first line of a stream without consuming it.
+    Args:
+        file (io.BufferedReader): The stream, positioned at its beginning.
+    Returns:
+        str: The first line of the stream.
+    """
+    data = file.peek(READ_BUFFER_SIZE)
+    return data.split(b"\n", 1)[0].decode(errors="replace")
+
+
+def sniff_separator(first_line: str) -> str:
+    """
+    Determines the separator used in a CSV file from its first line.
+    Args:
+        first_line (str): The first line of the CSV file.
+    Returns:
+        str: The separator used in the CSV file, either ',' or ';'.
+    """
+    return "," if "," in first_line else ";"
 
 
 def extract_labels(
@@ -41,6 +41,8 @@ mainForm.addEventListener("submit", function (event) {
                 window.location.reload();
             }
         });
+    } else if (action === "load-snapshot") {
+        loadSnapshot();
     }
 });
 
@@ -83,54 +85,7 @@ async function loadConfig() {
     } else {
         const configData = data.config_data;
 
-        if (configData.directories) {
-            document
-                .getElementById("directories-section")
-                .querySelectorAll('input[type="checkbox"]')
-                .forEach((checkbox) => {
-                    checkbox.checked = false;
-                    const labelElement = document.getElementById(
-                        `label-${checkbox.value}`
-                    );
-                    if (labelElement) {
-                        labelElement.disabled = true;
-                        labelElement.value = "";
-                    }
-                });
-            Object.entries(configData.directories).forEach(([dir, label]) => {
-                const dirCheckbox = document.getElementById(dir);
-                const labelElement = document.getElementById(`label-${dir}`);
-                dirCheckbox.checked = true;
-                labelElement.disabled = false;
-                labelElement.value = label;
-            });
-        }
-
-        if (configData.metrics) {
-            Object.entries(configData.metrics).forEach(
-                ([metricGroup, metricList]) => {
-                    const metricGroupHeader = document.getElementById(
-                        `${metricGroup}-header`
-                    );
-                    if (metricGroupHeader) {
-                        metricGroupHeader.classList.remove("collapsed");
-                        metricGroupHeader.ariaExpanded = "true";
-                        document
-                            .getElementById(`${metricGroup}`)
-                            .classList.add("show");
-                    }
-
-                    metricList.forEach((metric) => {
-                        const metricCheckbox = document.querySelector(
-                            `input[type="checkbox"][name="metric-list"][value="${metric}"]`
-                        );
-                        if (metricCheckbox) {
-                            metricCheckbox.checked = true;
-                        }
-                    });
-                }
-            );
-        }
+        setSelection(configData);
 
         if (configData["graph-config"]) {
             if (configData["graph-config"]["loads"]) {
@@ -141,6 +96,114 @@ async function loadConfig() {
     }
 }
 
+// Marcar diretórios, rótulos e métricas selecionados
+function setSelection(selectionData) {
+    if (selectionData.directories) {
+        document
+            .getElementById("directories-section")
+            .querySelectorAll('input[type="checkbox"]')
+            .forEach((checkbox) => {
+                checkbox.checked = false;
+                const labelElement = document.getElementById(
+                    `label-${checkbox.value}`
+                );
+                if (labelElement) {
+                    labelElement.disabled = true;
+                    labelElement.value = "";
+                }
+            });
+        Object.entries(selectionData.directories).forEach(([dir, label]) => {
+            const dirCheckbox = document.getElementById(dir);
+            const labelElement = document.getElementById(`label-${dir}`);
+            dirCheckbox.checked = true;
+            labelElement.disabled = false;
+            labelElement.value = label;
+        });
+    }
+
+    if (selectionData.metrics) {
+        Object.entries(selectionData.metrics).forEach(
+            ([metricGroup, metricList]) => {
+                const metricGroupHeader = document.getElementById(
+                    `${metricGroup}-header`
+                );
+                if (metricGroupHeader) {
+                    metricGroupHeader.classList.remove("collapsed");
+                    metricGroupHeader.ariaExpanded = "true";
+                    document
+                        .getElementById(`${metricGroup}`)
+                        .classList.add("show");
+                }
+
+                metricList.forEach((metric) => {
+                    const metricCheckbox = document.querySelector(
+                        `input[type="checkbox"][name="metric-list"][value="${metric}"]`
+                    );
+                    if (metricCheckbox) {
+                        metricCheckbox.checked = true;
+                    }
+                });
+            }
+        );
+    }
+}
+
+// Carregar snapshot
+async function loadSnapshot() {
+    const inputSnapshot = getElementValue("input-snapshot");
+    const response = await fetch("/config/load-snapshot", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+            "input-snapshot": inputSnapshot,
+        }),
+    });
+    const data = await response.json();
+
+    const showToast = createToastFunction("input-snapshot-toast");
+
+    if (data.error) {
+        showToast("Erro: " + data.error, "warning");
+    } else if (data.reload) {
+        window.location.reload();
+    } else {
+        setSelection(data.snapshot_data);
+        showToast("Snapshot carregado com sucesso.");
+    }
+}
+
+// Salvar snapshot
+async function saveSnapshot() {
+    const outputSnapshot = getElementValue("output-snapshot");
+    const directories = getCheckedValues("directory-list");
+    const labels = directories.map((dir) => {
+        return document.getElementById(`label-${dir}`).value;
+    });
+    const groupedMetrics = getGroupedMetrics();
+
+    const body = {
+        "output-snapshot": outputSnapshot,
+        "directory-list": directories,
+        labels: labels,
+        "grouped-metrics": groupedMetrics,
+    };
+
+    const response = await fetch("/config/save-snapshot", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(body),
+    });
+    const data = await response.json();
+
+    const showToast = createToastFunction("output-snapshot-toast");
+
+    if (data.error) {
+        showToast("Erro: " + data.error, "warning");
+    } else {
+        showToast(data.message);
+    }
+}
+
 // Salvar configuração
 async function saveConfig() {
     const outputConfig = getElementValue("output-config");
@@ -236,6 +299,7 @@ async function generateGraphs() {
     const graphFontSize = getElementValue("graph-font-size");
     const legendFontSize = getElementValue("legend-font-size");
     const legendPosition = getElementValue("legend-position");
+    const errorStatistic = getElementValue("error-statistic");
     const anchorX = getElementValue("anchor-x");
     const anchorY = getElementValue("anchor-y");
     const frameon = getElementValue("frameon");
@@ -275,6 +339,7 @@ async function generateGraphs() {
         "graph-font-size": graphFontSize,
         "legend-font-size": legendFontSize,
         "legend-position": legendPosition,
+        "error-statistic": errorStatistic,
         "anchor-x": anchorX,
         "anchor-y": anchorY,
         frameon: frameon,
@@ -320,12 +385,14 @@ async function exportResults() {
         loadPointsFilter = getElementValue("load-points-filter");
     }
     const overwrite = getElementValue("overwrite");
+    const errorStatistic = getElementValue("error-statistic");
 
     const body = {
         "directory-list": directories,
         labels: directoryLabels,
         "grouped-metrics": groupedMetrics,
         overwrite: overwrite,
+        "error-statistic": errorStatistic,
         loads: loadMap,
         "load-points-filter": loadPointsFilter,
     };
@@ -347,6 +414,7 @@ async function exportResults() {
 
 assignSubmitFunction("load-config-sub", loadConfig);
 assignSubmitFunction("save-config-sub", saveConfig);
+assignSubmitFunction("save-snapshot-sub", saveSnapshot);
 
 assignSubmitFunction("select-all-directories-btn", () =>
     selectAllTextCheckboxes("directory-list", "label")
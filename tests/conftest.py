@@ -0,0 +1,4 @@
+import os.path as op
+import sys
+
+sys.path.insert(0, op.join(op.dirname(op.dirname(op.abspath(__file__))), "src"))
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import compilation as cs, simulation_utils as sus
+
+
+@pytest.fixture
+def simulation_result():
+    """
+    Builds a result with two metrics of three load points, one of them with a NaN
+    repetition, and a metric with only two load points.
+    """
+    rng = np.random.default_rng(7)
+    keys = [("a", lp) for lp in (1, 2, 3)] + [("b", lp) for lp in (1, 2, 3)]
+    keys += [("c", 1), ("c", 2)]
+    df = pd.DataFrame(keys, columns=["Metrics", "LoadPoint"])
+    repetitions = rng.random((len(keys), 5))
+    repetitions[1, 3] = np.nan
+    for i in range(5):
+        df[f"rep{i + 1}"] = repetitions[:, i]
+    return df
+
+
+def compile_separately(simulation_result, metrics, load_points):
+    results = sus.filter_result_by_metric_list(metrics, simulation_result)
+    if load_points:
+        results = [sus.filter_result_by_load_points(r, load_points) for r in results]
+    repetitions = sus.extract_repetitions(results)
+    number_of_reps = sus.get_number_of_repetitions(repetitions)
+    average = sus.calculate_average(repetitions)
+    error = sus.calculate_standard_error(repetitions, number_of_reps)
+    return list(zip(average, error))
+
+
+@pytest.mark.parametrize("metrics", [["a", "b"], ["b", "a", "c"]])
+@pytest.mark.parametrize("load_points", [None, ["1", "3"]])
+def test_batch_matches_the_metric_by_metric_compilation(
+    simulation_result, metrics, load_points
+):
+    compiler = cs.DataCompiler("grouped", load_points)
+    compiler.set_simulation_results([simulation_result]).set_metrics(metrics)
+    compiled = compiler.compile_batch()[0]
+    expected = compile_separately(simulation_result, metrics, load_points)
+    for series, (average, error) in zip(compiled, expected):
+        assert np.array_equal(series["mean"].to_numpy(), np.asarray(average))
+        assert np.array_equal(
+            series["error"].to_numpy(), np.asarray(error), equal_nan=True
+        )
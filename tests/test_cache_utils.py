@@ -0,0 +1,59 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from services import cache_utils as cus, simulation_utils as sus
+
+
+@pytest.fixture
+def result_file(tmp_path):
+    path = tmp_path / "A_BlockingProbability.csv"
+    path.write_text("Metrics,LoadPoint,rep1,rep2\nBlocking probability,1,0.5,0.25\n")
+    return str(path)
+
+
+def test_cached_result_is_reloaded(result_file):
+    df = pd.read_csv(result_file)
+    cus.save_cached_result(result_file, df)
+    pd.testing.assert_frame_equal(cus.load_cached_result(result_file), df)
+
+
+def test_cache_is_stale_after_size_change(result_file):
+    cus.save_cached_result(result_file, pd.read_csv(result_file))
+    with open(result_file, "a") as file:
+        file.write("Blocking probability,2,0.75,0.5\n")
+    assert cus.load_cached_result(result_file) is None
+
+
+def test_cache_is_stale_after_mtime_change(result_file):
+    cus.save_cached_result(result_file, pd.read_csv(result_file))
+    stat = os.stat(result_file)
+    os.utime(result_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cus.load_cached_result(result_file) is None
+
+
+def test_modified_file_is_parsed_again(result_file):
+    assert sus.load_simulation_result(result_file)["rep1"].tolist() == [0.5]
+    with open(result_file, "w") as file:
+        file.write("Metrics,LoadPoint,rep1,rep2\nBlocking probability,1,0.125,0.25\n")
+    stat = os.stat(result_file)
+    os.utime(result_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert sus.load_simulation_result(result_file)["rep1"].tolist() == [0.125]
+    assert cus.load_cached_result(result_file)["rep1"].tolist() == [0.125]
+
+
+def test_concurrent_writes_of_the_same_file_do_not_collide(tmp_path):
+    path = str(tmp_path / "shared.json")
+    payloads = [bytes([65 + i]) * 100_000 for i in range(8)]
+
+    def write(payload):
+        for _ in range(20):
+            cus.write_atomically(path, lambda f: f.write(payload))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, payloads))
+    with open(path, "rb") as file:
+        assert file.read() in payloads
+    assert os.listdir(tmp_path) == ["shared.json"]
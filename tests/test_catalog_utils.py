@@ -0,0 +1,39 @@
+import pytest
+
+from services import catalog_utils as cts
+
+HEADER = "Metrics,LoadPoint,rep1,rep2\n"
+BLOCKING = "Blocking probability,1,0.1,0.2\n"
+CUSTOM = "Custom blocking,1,0.3,0.4\n"
+
+
+@pytest.fixture
+def directory(tmp_path):
+    """
+    Writes a simulation directory A with a result file of one metric.
+    """
+    directory = tmp_path / "A"
+    directory.mkdir()
+    (directory / "A_BlockingProbability.csv").write_text(HEADER + BLOCKING)
+    return directory
+
+
+def test_stray_csv_files_are_ignored(tmp_path, directory):
+    (directory / "A_BlockingProbability.csv").write_text(HEADER + BLOCKING + CUSTOM)
+    (directory / "run_notes.csv").write_text("note,value\nseed,1\n")
+    (directory / "A_SpectrumUtilization.csv").write_text("Load,Value\n1,2\n")
+    discovered = cts.discover_metrics(str(tmp_path), ["A"], "individual")
+    assert discovered == {
+        "BlockingProbability": ["Blocking probability", "Custom blocking"]
+    }
+
+
+def test_catalog_follows_modified_files(directory):
+    catalog = cts.MetricCatalog()
+    metrics = catalog.get_directory_metrics(str(directory))
+    assert metrics == {"BlockingProbability": ["Blocking probability"]}
+    (directory / "A_BlockingProbability.csv").write_text(HEADER + BLOCKING + CUSTOM)
+    metrics = catalog.get_directory_metrics(str(directory))
+    assert metrics == {
+        "BlockingProbability": ["Blocking probability", "Custom blocking"]
+    }
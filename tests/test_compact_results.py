@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from services import compilation as cs, simulation_utils as sus
+
+
+def make_result(load_points):
+    return pd.DataFrame(
+        {
+            "Metrics": ["m", "m", "n"],
+            "LoadPoint": load_points,
+            "rep1": [0.1, 0.2, 0.3],
+            "rep2": [0.4, np.nan, 0.6],
+        }
+    )
+
+
+def test_columns_are_converted_to_compact_types():
+    compact = sus.compact_simulation_result(make_result([1.0, 2.0, 1.0]), "float32")
+    assert isinstance(compact["Metrics"].dtype, pd.CategoricalDtype)
+    assert compact["LoadPoint"].dtype == np.int64
+    assert compact["rep1"].dtype == np.float32
+    assert compact["rep2"].dtype == np.float32
+
+
+def test_fractional_load_points_are_kept():
+    compact = sus.compact_simulation_result(make_result([0.5, 1.0, 0.5]))
+    assert compact["LoadPoint"].tolist() == [0.5, 1.0, 0.5]
+    assert compact["rep1"].dtype == np.float64
+
+
+def test_compact_result_compiles_as_the_original():
+    original = make_result([1.0, 2.0, 1.0])
+    compact = sus.compact_simulation_result(original)
+    for load_points in (None, ["2"]):
+        compiled = cs.compile_metrics(compact, ["m", "n"], load_points, cs.STATISTICS)
+        expected = cs.compile_metrics(original, ["m", "n"], load_points, cs.STATISTICS)
+        for c, e in zip(compiled, expected):
+            assert np.array_equal(c.to_numpy(), e.to_numpy(), equal_nan=True)
@@ -0,0 +1,67 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services import compiled_cache as ccs
+
+STATISTICS = ["mean", "error"]
+
+
+@pytest.fixture
+def result_file(tmp_path):
+    path = tmp_path / "A_BlockingProbability.csv"
+    path.write_text("Metrics,LoadPoint,rep1,rep2\nm,1,0.5,0.25\nm,2,0.75,0.5\n")
+    return str(path)
+
+
+def make_series(mean):
+    return pd.DataFrame({"mean": [mean, mean], "error": [0.0, 0.0]})
+
+
+def store(cache, path, load_points, series):
+    signature, _ = cache.get(path, ["m"], load_points, STATISTICS)
+    cache.put(path, signature, ["m"], load_points, STATISTICS, [series])
+
+
+def test_series_are_found_by_load_points_in_any_order(result_file):
+    cache = ccs.CompiledSeriesCache(2**20, disk_enabled=False)
+    series = make_series(0.5)
+    store(cache, result_file, ["1", "2"], series)
+
+    assert cache.get(result_file, ["m"], ["2.0", "1"], STATISTICS)[1] == [series]
+    assert cache.get(result_file, ["m", "n"], None, STATISTICS)[1] == [None, None]
+    assert cache.stats()["hits"] == 1
+
+
+def test_series_are_dropped_when_the_file_changes(result_file):
+    cache = ccs.CompiledSeriesCache(2**20, disk_enabled=False)
+    store(cache, result_file, None, make_series(0.5))
+    stat = os.stat(result_file)
+    os.utime(result_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert cache.get(result_file, ["m"], None, STATISTICS)[1] == [None]
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_series_are_evicted(result_file):
+    size = int(make_series(0.5).memory_usage(index=True, deep=True).sum())
+    cache = ccs.CompiledSeriesCache(2 * size, disk_enabled=False)
+    for load_points in (["1"], ["2"], None):
+        store(cache, result_file, load_points, make_series(0.5))
+
+    assert cache.get(result_file, ["m"], ["1"], STATISTICS)[1] == [None]
+    assert cache.stats()["entries"] == 2
+
+
+def test_series_are_reloaded_from_disk(result_file):
+    store(
+        ccs.CompiledSeriesCache(2**20, disk_enabled=True),
+        result_file,
+        None,
+        make_series(0.5),
+    )
+    cache = ccs.CompiledSeriesCache(2**20, disk_enabled=True)
+    series = cache.get(result_file, ["m"], None, STATISTICS)[1][0]
+    pd.testing.assert_frame_equal(series, make_series(0.5))
+    assert cache.stats()["entries"] == 1
@@ -0,0 +1,51 @@
+import gzip
+import lzma
+import sys
+
+import pandas as pd
+import pytest
+
+from services import simulation_utils as sus
+
+CSV = b"""Metrics,LoadPoint,rep1,rep2,rep3
+Blocking probability,1,0.1,0.2,0.3
+Blocking probability,2,0.4,,0.6
+Hops,1,3,4,5
+"""
+
+
+def compress_zstd(data):
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(data)
+
+
+COMPRESSORS = {
+    ".csv.gz": gzip.compress,
+    ".csv.xz": lzma.compress,
+    ".csv.zst": compress_zstd,
+}
+
+
+@pytest.mark.parametrize("extension", list(COMPRESSORS))
+def test_compressed_files_are_read_as_the_csv_file(tmp_path, extension):
+    csv_path = tmp_path / "A_BlockingProbability.csv"
+    csv_path.write_bytes(CSV)
+    compressed_path = tmp_path / f"B_BlockingProbability{extension}"
+    compressed_path.write_bytes(COMPRESSORS[extension](CSV))
+
+    expected = sus.read_simulation_csv(str(csv_path))
+    pd.testing.assert_frame_equal(
+        sus.read_simulation_csv(str(compressed_path)), expected
+    )
+    pd.testing.assert_frame_equal(
+        sus.read_simulation_csv(str(compressed_path), metrics=["Hops"]),
+        sus.read_simulation_csv(str(csv_path), metrics=["Hops"]),
+    )
+
+
+def test_missing_zstandard_package_is_reported(tmp_path, monkeypatch):
+    path = tmp_path / "A_BlockingProbability.csv.zst"
+    path.write_bytes(b"")
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(Exception, match="pip install zstandard"):
+        sus.read_simulation_csv(str(path))
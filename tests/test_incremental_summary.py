@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import indexer
+from services import simulation_utils as sus, summary_utils as sms
+
+REPETITIONS = np.array(
+    [
+        [0.1, 0.4, 0.2, 0.9, 0.5],
+        [1.0, 2.0, 4.0, 8.0, 16.0],
+        [0.3, np.nan, 0.6, 0.2, 0.7],
+    ]
+)
+KEYS = [("m", 1), ("m", 2), ("n", 1)]
+
+
+def write_repetitions(path, number_of_reps, repetitions=REPETITIONS):
+    header = ["Metrics", "LoadPoint"] + [f"rep{i + 1}" for i in range(number_of_reps)]
+    lines = [",".join(header)]
+    for (metric, load_point), values in zip(KEYS, repetitions[:, :number_of_reps]):
+        lines.append(",".join([metric, str(load_point)] + [str(v) for v in values]))
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def summarized_file(tmp_path):
+    """
+    Writes a result file with three repetitions and its summary sidecar file.
+    """
+    path = write_repetitions(tmp_path / "A_BlockingProbability.csv", 3)
+    df = sus.read_simulation_csv(path)
+    sms.save_summary(
+        path,
+        indexer.compute_summary(df),
+        sms.get_signature(path),
+        ["rep1", "rep2", "rep3"],
+        sms.get_checksum(df["rep3"].to_numpy()),
+    )
+    return tmp_path / "A_BlockingProbability.csv"
+
+
+def test_merged_statistics_equal_statistics_of_all_repetitions():
+    keys = pd.DataFrame(KEYS, columns=["Metrics", "LoadPoint"])
+    n, mean, m2 = sms.compute_running_statistics(REPETITIONS[:, :2])
+    summary = keys.assign(mean=mean, error=sms.get_standard_error(m2, n), n=n, m2=m2)
+    merged = sms.merge_running_statistics(summary, REPETITIONS[:, 2:])
+    n, mean, m2 = sms.compute_running_statistics(REPETITIONS)
+    assert merged["n"].tolist() == n.tolist()
+    assert np.allclose(merged["mean"], mean)
+    assert np.allclose(merged["m2"], m2, equal_nan=True)
+    expected = sus.calculate_standard_error([pd.DataFrame(REPETITIONS)], 5)[0]
+    assert np.allclose(merged["error"], expected, equal_nan=True)
+
+
+def test_sidecar_is_updated_with_new_repetitions(summarized_file):
+    path = write_repetitions(summarized_file, 5)
+    assert sms.load_summary(path) is None
+    updated = sus.update_simulation_summary(path)
+    full = indexer.compute_summary(sus.read_simulation_csv(path))
+    assert np.allclose(updated["mean"], full["mean"])
+    assert np.allclose(updated["error"], full["error"], equal_nan=True)
+    assert sms.read_summary(path)["repetitions"] == [f"rep{i}" for i in range(1, 6)]
+    assert sms.load_summary(path) is not None
+
+
+def test_rewritten_repetitions_are_not_merged(summarized_file):
+    repetitions = REPETITIONS.copy()
+    repetitions[0, 2] = 0.25
+    path = write_repetitions(summarized_file, 5, repetitions)
+    assert sus.update_simulation_summary(path) is None
+
+
+def test_parse_errors_are_raised(summarized_file):
+    path = write_repetitions(summarized_file, 5)
+    with open(path) as file:
+        text = file.read()
+    with open(path, "w") as file:
+        file.write(text.replace(",0.5\n", ",abc\n", 1))
+    with pytest.raises(ValueError):
+        sus.update_simulation_summary(path)
+
+
+def test_read_errors_are_raised(summarized_file):
+    path = write_repetitions(summarized_file, 5)
+    with open(path) as file:
+        text = file.read()
+    with open(path, "w") as file:
+        file.write(text.replace("Metrics,", "Metric,", 1))
+    with pytest.raises(ValueError):
+        sus.update_simulation_summary(path)
+
+
+def test_summary_is_returned_when_it_can_not_be_written(summarized_file, monkeypatch):
+    path = write_repetitions(summarized_file, 4)
+
+    def fail(*args, **kwargs):
+        raise PermissionError("somente leitura")
+
+    monkeypatch.setattr(sms, "save_summary", fail)
+    updated = sus.update_simulation_summary(path)
+    assert updated["n"].tolist() == [4, 4, 3]
+    assert sms.load_summary(path) is None
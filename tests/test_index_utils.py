@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from services import index_utils as ius
+
+
+def touch_later(path):
+    """
+    Moves the modification time of a directory forward, as a later change would.
+    """
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def base(tmp_path):
+    """
+    Writes a base directory with two simulation directories, A and B.
+    """
+    for name in ("A", "B"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f"{name}_BlockingProbability.csv").write_text("Metrics\n")
+    return str(tmp_path)
+
+
+def test_new_directory_invalidates_index(tmp_path, base):
+    index = ius.DirectoryIndex()
+    assert sorted(index.get_directories(base)) == ["A", "B"]
+    (tmp_path / "C").mkdir()
+    touch_later(base)
+    assert sorted(index.get_directories(base)) == ["A", "B", "C"]
+
+
+def test_new_file_invalidates_directory_entry(tmp_path, base):
+    index = ius.DirectoryIndex()
+    directory = str(tmp_path / "A")
+    assert list(index.get_group_files(directory)) == ["BlockingProbability"]
+    (tmp_path / "A" / "A_SpectrumUtilization.csv").write_text("Metrics\n")
+    touch_later(directory)
+    assert index.get_group_files(directory) == {
+        "BlockingProbability": "A_BlockingProbability.csv",
+        "SpectrumUtilization": "A_SpectrumUtilization.csv",
+    }
+
+
+def test_stored_index_is_revalidated(tmp_path, base):
+    ius.DirectoryIndex().get_directories(base)
+    assert os.path.exists(ius.get_index_path(base))
+    (tmp_path / "B" / "B_BlockingProbability.csv").unlink()
+    (tmp_path / "B" / "B_BlockingProbability.csv.gz").write_bytes(b"")
+    touch_later(str(tmp_path / "B"))
+    groups = ius.DirectoryIndex().get_group_files(str(tmp_path / "B"))
+    assert groups == {"BlockingProbability": "B_BlockingProbability.csv.gz"}
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("A_BlockingProbability.csv", ("BlockingProbability", 0, None)),
+        ("sim_A_BlockingProbability.csv.gz", ("BlockingProbability", 1, None)),
+        ("notes.csv", None),
+        (".A_BlockingProbability.csv", None),
+        ("A_BlockingProbability.txt", None),
+    ],
+)
+def test_result_filenames_are_parsed(name, expected):
+    assert ius.parse_result_filename(name) == expected
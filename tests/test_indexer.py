@@ -0,0 +1,66 @@
+import os.path as op
+
+import numpy as np
+
+import indexer
+from data.loading_data import CACHE_DIRECTORY_NAME
+from services import simulation_utils as sus, summary_utils as sms
+
+ROWS = [
+    ("m", 1, [0.1, 0.4, 0.2, 0.9]),
+    ("m", 2, [1.0, 2.0, 4.0, 8.0]),
+    ("n", 1, [0.3, 0.5, 0.6, 0.2]),
+]
+
+
+def write_rows(path, rows, number_of_reps):
+    header = ["Metrics", "LoadPoint"] + [f"rep{i + 1}" for i in range(number_of_reps)]
+    lines = [",".join(header)]
+    for metric, load_point, values in rows:
+        values = [str(v) for v in values[:number_of_reps]]
+        lines.append(",".join([metric, str(load_point)] + values))
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_summaries_are_written_under_the_cache_directory(tmp_path):
+    directory = tmp_path / "A"
+    directory.mkdir()
+    path = write_rows(directory / "A_BlockingProbability.csv", ROWS, 4)
+
+    assert indexer.write_summaries(str(tmp_path)) == [
+        (str(directory), "BlockingProbability", "written")
+    ]
+    summary_path = sms.get_summary_path(path)
+    assert op.dirname(summary_path) == str(directory / CACHE_DIRECTORY_NAME)
+    assert op.isfile(summary_path)
+    assert not op.exists(path + ".summary.json")
+    assert indexer.write_summaries(str(tmp_path)) == [
+        (str(directory), "BlockingProbability", "up to date")
+    ]
+
+
+def test_summary_is_used_when_loading(tmp_path):
+    directory = tmp_path / "A"
+    directory.mkdir()
+    path = write_rows(directory / "A_BlockingProbability.csv", ROWS, 4)
+    indexer.write_summaries(str(tmp_path))
+
+    result = sus.load_simulation_result(path, metrics=["m"], use_summary=True)
+    assert sus.has_statistics([result])
+    df = sus.read_simulation_csv(path)
+    expected = sus.calculate_average([df.filter(like="rep")])[0][:2]
+    assert np.allclose(result["mean"], expected)
+
+
+def test_files_without_repetitions_are_skipped(tmp_path):
+    directory = tmp_path / "A"
+    directory.mkdir()
+    write_rows(directory / "A_BlockingProbability.csv", ROWS, 4)
+    empty = write_rows(directory / "A_Hops.csv", ROWS, 0)
+
+    assert indexer.write_summaries(str(tmp_path)) == [
+        (str(directory), "BlockingProbability", "written"),
+        (str(directory), "Hops", "no repetitions"),
+    ]
+    assert not op.exists(sms.get_summary_path(empty))
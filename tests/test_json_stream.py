@@ -0,0 +1,76 @@
+import io
+import json
+
+import pytest
+
+from services import json_stream as jss, loads_utils as lus
+
+DOCUMENT = {
+    "links": [{"name": 'a"]}', "path": ["[", "{", "\\"]}, [1, [2, [3]]], "x\\"],
+    "nested": {"a": {"b": [True, None, -1.5e-3]}},
+    "nodes": [{"id": 1}, {"id": 2}, {"id": 3}],
+    "count": 12345,
+}
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """
+    Allows chunks of any size, so that values are split between many chunks.
+    """
+    monkeypatch.setattr(jss, "MIN_CHUNK_SIZE", 1)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_skips_values_with_brackets_and_escapes_in_strings(small_chunks, chunk_size):
+    reader = jss.JsonStreamReader(io.StringIO(json.dumps(DOCUMENT)), chunk_size)
+    assert reader.seek_key("count")
+    assert reader.read_value() == 12345
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_iterates_array_after_skipped_values(small_chunks, chunk_size):
+    text = json.dumps(DOCUMENT, indent=2)
+    reader = jss.JsonStreamReader(io.StringIO(text), chunk_size)
+    assert reader.seek_key("nodes")
+    assert list(reader.iter_array()) == DOCUMENT["nodes"]
+
+
+def test_reads_kept_value_split_between_chunks(small_chunks):
+    text = json.dumps({"skip": "x" * 100, "value": {"numbers": [1.25] * 50}})
+    reader = jss.JsonStreamReader(io.StringIO(text), 8)
+    assert reader.seek_key("value")
+    assert reader.read_value() == {"numbers": [1.25] * 50}
+
+
+def test_chunk_size_is_capped_from_below():
+    reader = jss.JsonStreamReader(io.StringIO(json.dumps(DOCUMENT)), 2)
+    assert reader.chunk_size == jss.MIN_CHUNK_SIZE
+
+
+def test_stops_reading_after_the_value():
+    file = io.StringIO(json.dumps({"first": 1, "rest": ["y" * 10000] * 100}))
+    assert jss.read_key(file, "first") == 1
+    assert file.tell() < len(file.getvalue())
+
+
+def test_missing_key_raises_key_error():
+    with pytest.raises(KeyError):
+        jss.read_key(io.StringIO(json.dumps(DOCUMENT)), "missing")
+
+
+@pytest.mark.parametrize(
+    "text", ['{"a": [1, 2', '{"a": "x', '{"a" 1}', '{"a": [1, }', '{"a": ']
+)
+def test_malformed_documents_raise(small_chunks, text):
+    with pytest.raises(json.JSONDecodeError):
+        jss.read_key(io.StringIO(text), "b")
+
+
+@pytest.mark.parametrize("traffic", [{"generators": []}, {"requestGenerators": [1]}])
+def test_invalid_traffic_files_raise_a_read_error(tmp_path, traffic):
+    (tmp_path / "simulation").write_text(json.dumps({"loadPoints": 3}))
+    (tmp_path / "network").write_text(json.dumps({"nodes": [{}, {}, {}]}))
+    (tmp_path / "traffic").write_text(json.dumps(traffic))
+    with pytest.raises(ValueError, match="Erro ao ler arquivo de tráfego"):
+        lus.calculate_total_loads(str(tmp_path))
@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+from services import simulation_utils as sus
+
+
+@pytest.mark.parametrize(
+    "load_points, expected",
+    [
+        (["1", "3"], [0, 2]),
+        (["1.0", "2.5"], [0, 1]),
+        ([3, "x"], [2]),
+        (["10"], []),
+    ],
+)
+def test_load_points_are_selected_by_value(load_points, expected):
+    df = pd.DataFrame({"Metrics": ["m"] * 3, "LoadPoint": [1.0, 2.5, 3.0]})
+    assert sus.select_load_point_rows(df, load_points).tolist() == expected
+
+
+def test_integer_and_text_load_point_columns_match_numbers():
+    integers = pd.DataFrame({"Metrics": ["m"] * 3, "LoadPoint": [1, 2, 3]})
+    text = pd.DataFrame({"Metrics": ["m"] * 3, "LoadPoint": ["1", "2", "abc"]})
+    assert sus.select_load_point_rows(integers, ["2.0"]).tolist() == [1]
+    assert sus.select_load_point_rows(text, ["2", "abc"]).tolist() == [1]
+
+
+def test_load_point_positions_are_reused(tmp_path):
+    path = tmp_path / "A_BlockingProbability.csv"
+    path.write_text("Metrics,LoadPoint,rep1\nm,1,0.1\nm,2,0.2\nn,1,0.3\nn,2,0.4\n")
+    df = sus.load_simulation_result(str(path))
+    first = sus.get_load_point_positions(df, ["2"])
+    assert first.tolist() == [1, 3]
+    assert sus.get_load_point_positions(df, ["2.0"]) is first
@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from services import simulation_utils as sus
+
+HEADER = "Metrics,LoadPoint,rep1,rep2\n"
+
+
+@pytest.fixture
+def simulation_directories(tmp_path):
+    """
+    Creates three simulation directories whose results differ in their first value.
+    """
+    directories = []
+    for i, name in enumerate(["A", "B", "C"]):
+        directory = tmp_path / name
+        directory.mkdir()
+        (directory / f"{name}_BlockingProbability.csv").write_text(
+            HEADER + f"Blocking probability,1,{i}.5,0.25\n"
+        )
+        directories.append(str(directory))
+    return directories
+
+
+def test_results_keep_the_order_of_the_directories(simulation_directories, monkeypatch):
+    load_simulation_result = sus.load_simulation_result
+
+    def load_slowly_first(path, **kwargs):
+        # The first directory finishes last.
+        time.sleep(0.2 if path.endswith("A_BlockingProbability.csv") else 0.0)
+        return load_simulation_result(path, **kwargs)
+
+    monkeypatch.setattr(sus, "load_simulation_result", load_slowly_first)
+    results = sus.load_simulation_results(
+        simulation_directories, "BlockingProbability", max_workers=3
+    )
+    assert [r["rep1"].iloc[0] for r in results] == [0.5, 1.5, 2.5]
+
+
+def test_failure_in_one_file_is_raised_as_is(simulation_directories, monkeypatch):
+    monkeypatch.setattr(sus, "LOADING_WORKERS", 3)
+    broken = simulation_directories[1] + "/B_BlockingProbability.csv"
+    with open(broken, "w") as file:
+        file.write("LoadPoint,rep1\n1,0.5\n")
+    with pytest.raises(Exception, match="não contém a coluna 'Metrics'") as error:
+        sus.load_simulation_results(simulation_directories, "BlockingProbability")
+    assert type(error.value) is Exception
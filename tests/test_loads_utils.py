@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from services import loads_utils as lus
+
+
+def write_directory(base_directory, name, load_points, arrival_rate):
+    directory = base_directory / name
+    directory.mkdir()
+    (directory / "simulation").write_text(json.dumps({"loadPoints": load_points}))
+    (directory / "network").write_text(json.dumps({"nodes": [{}, {}, {}]}))
+    generator = {
+        "source": "1",
+        "destination": "2",
+        "arrivalRate": arrival_rate,
+        "arrivalRateIncrease": 1,
+        "holdRate": 1,
+    }
+    (directory / "traffic").write_text(json.dumps({"requestGenerators": [generator]}))
+
+
+@pytest.fixture
+def base_directory(tmp_path):
+    """
+    Writes a reference directory A, a directory B with the same loads, a directory C
+    with more load points and a directory D with the same number of different loads.
+    """
+    write_directory(tmp_path, "A", 3, 1)
+    write_directory(tmp_path, "B", 3, 1)
+    write_directory(tmp_path, "C", 4, 1)
+    write_directory(tmp_path, "D", 3, 2)
+    return tmp_path
+
+
+def test_equal_loads_are_consistent(base_directory):
+    loads, report = lus.check_loads_consistency(str(base_directory), ["A", "B"])
+    assert loads == {"0": 6, "1": 12, "2": 18}
+    assert report["differences"] == []
+    assert lus.get_loads_consistency_error(report) == ""
+
+
+def test_different_counts_and_values_are_reported(base_directory):
+    _, report = lus.check_loads_consistency(str(base_directory), ["A", "B", "C", "D"])
+    assert [d["directory"] for d in report["differences"]] == ["C", "D"]
+    assert report["differences"][1]["different_loads"]["0"] == [6, 12]
+
+    error = lus.get_loads_consistency_error(report)
+    assert "Quantidade diferente: C." in error
+    assert "Cargas diferentes: D." in error
@@ -0,0 +1,39 @@
+import json
+import os
+
+import pytest
+
+from services import loads_utils as lus
+
+
+@pytest.fixture
+def simulation_directory(tmp_path):
+    (tmp_path / "simulation").write_text(json.dumps({"loadPoints": 3}))
+    return tmp_path
+
+
+def test_values_are_computed_once_while_the_files_are_unchanged(simulation_directory):
+    cache = lus.MetadataCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return lus.read_number_of_load_points(str(simulation_directory))
+
+    for _ in range(3):
+        assert cache.get(str(simulation_directory), "n", ["simulation"], compute) == 3
+    assert len(calls) == 1
+
+    path = simulation_directory / "simulation"
+    path.write_text(json.dumps({"loadPoints": 5}))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.get(str(simulation_directory), "n", ["simulation"], compute) == 5
+    assert len(calls) == 2
+
+
+def test_values_of_missing_files_are_not_cached(tmp_path):
+    cache = lus.MetadataCache()
+    assert cache.get(str(tmp_path), "n", ["simulation"], lambda: 1) == 1
+    assert cache.get(str(tmp_path), "n", ["simulation"], lambda: 2) == 2
+    assert cache.entries == {}
@@ -0,0 +1,52 @@
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import simulation_utils as sus
+
+
+@pytest.fixture
+def simulation_result():
+    """
+    Builds a result whose metric 'b' has contiguous rows and whose metric 'a' does not.
+    """
+    return pd.DataFrame(
+        {
+            "Metrics": ["a", "b", "b", "a", "c"],
+            "LoadPoint": [1, 1, 2, 2, 1],
+            "rep1": [0.1, 0.2, 0.3, 0.4, 0.5],
+        }
+    )
+
+
+def test_index_holds_slices_for_contiguous_rows(simulation_result):
+    index = sus.build_metric_index(simulation_result)
+    assert index["b"] == slice(1, 3)
+    assert index["c"] == slice(4, 5)
+    assert np.array_equal(index["a"], [0, 3])
+
+
+def test_filtered_rows_match_a_boolean_mask(simulation_result):
+    filtered = sus.filter_result_by_metric_list(["a", "b"], simulation_result)
+    for metric, df in zip(["a", "b"], filtered):
+        expected = simulation_result[simulation_result["Metrics"] == metric]
+        pd.testing.assert_frame_equal(df, expected)
+    by_metric = sus.filter_result_list_by_metric("c", [simulation_result])
+    pd.testing.assert_frame_equal(by_metric[0], simulation_result.iloc[[4]])
+
+
+def test_missing_metric_raises(simulation_result):
+    with pytest.raises(Exception, match="A métrica 'd' não foi encontrada"):
+        sus.filter_result_by_metric_list(["a", "d"], simulation_result)
+
+
+def test_index_is_dropped_with_its_result():
+    simulation_result = pd.DataFrame({"Metrics": ["a", "b"], "rep1": [0.1, 0.2]})
+    key = id(simulation_result)
+    sus.get_metric_index(simulation_result)
+    assert key in sus.metric_indexes
+    del simulation_result
+    gc.collect()
+    assert key not in sus.metric_indexes
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from services import normalization as nus, simulation_utils as sus
+
+HEADER = "Metrics,LoadPoint,rep1,rep2,rep3\n"
+ROWS = "Utilization,1,0.1,0.2,0.3\nUtilization,2,0.4,0.5,0.6\n"
+# Rows written with the extra field before the repetitions.
+ROWS_WITH_EXTRA = "Utilization,1,junk,0.1,0.2,0.3\nUtilization,2,junk,0.4,0.5,0.6\n"
+VALUES = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+
+
+@pytest.mark.parametrize("rows", [ROWS, ROWS_WITH_EXTRA])
+def test_spectrum_utilization_is_read_in_the_expected_layout(tmp_path, rows):
+    path = tmp_path / "A_SpectrumUtilization.csv"
+    path.write_text(HEADER + rows)
+    df = sus.read_simulation_csv(str(path))
+    assert list(df.columns) == ["Metrics", "LoadPoint", "rep1", "rep2", "rep3"]
+    assert df["LoadPoint"].tolist() == [1, 2]
+    assert np.array_equal(df[["rep1", "rep2", "rep3"]].to_numpy(), VALUES)
+
+
+def test_partial_read_is_normalized(tmp_path):
+    path = tmp_path / "A_SpectrumUtilization.csv"
+    path.write_text(HEADER + ROWS_WITH_EXTRA)
+    df = sus.read_simulation_csv(str(path), load_points=["2"])
+    assert df["rep3"].tolist() == [0.6]
+
+
+def test_other_metric_groups_are_not_normalized(tmp_path):
+    assert nus.needs_normalization(str(tmp_path / "A_SpectrumUtilization.csv"))
+    assert not nus.needs_normalization(str(tmp_path / "A_BlockingProbability.csv"))
+
+
+def test_drop_index_is_detected_from_the_first_row():
+    header = HEADER.strip().encode()
+    assert nus.get_drop_index(header, b"Utilization,1,junk,0.1,0.2,0.3", b",") == 2
+    assert nus.get_drop_index(header, b"Utilization,1,0.1,0.2,0.3", b",") is None
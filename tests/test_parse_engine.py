@@ -0,0 +1,25 @@
+import gzip
+
+import pytest
+
+from services import parse_engine as pes
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def arrow_from_any_size(monkeypatch):
+    monkeypatch.setattr(pes, "PARSE_ENGINE", "auto")
+    monkeypatch.setattr(pes.engine_selector, "threshold", 0.0)
+
+
+def test_plain_files_follow_the_threshold(tmp_path, arrow_from_any_size):
+    path = tmp_path / "A_BlockingProbability.csv"
+    path.write_text("Metrics,LoadPoint,rep1\nm,1,0.5\n")
+    assert pes.get_parse_engine(str(path)) == "pyarrow"
+
+
+def test_compressed_files_use_the_c_engine(tmp_path, arrow_from_any_size):
+    path = tmp_path / "A_BlockingProbability.csv.gz"
+    path.write_bytes(gzip.compress(b"Metrics,LoadPoint,rep1\nm,1,0.5\n"))
+    assert pes.get_parse_engine(str(path)) == "c"
@@ -0,0 +1,53 @@
+import os.path as op
+
+import pytest
+
+from services import cache_utils as cus, simulation_utils as sus
+
+ROWS = [
+    "Blocking probability,1,0.5,0.25,x",
+    "Blocking probability,2,0.75,0.5,x",
+    "Blocking probability by fragmentation,1,0.125,0.0625,x",
+]
+
+
+@pytest.fixture
+def result_file(tmp_path):
+    path = tmp_path / "A_BlockingProbability.csv"
+    path.write_text("Metrics,LoadPoint,rep1,rep2,Notes\n" + "\n".join(ROWS) + "\n")
+    return str(path)
+
+
+def is_cached(path):
+    return op.exists(cus.get_cache_paths(path)[1])
+
+
+def test_first_partial_read_parses_only_the_requested_rows(result_file):
+    df = sus.load_simulation_result(result_file, load_points=["2"])
+    assert df["LoadPoint"].tolist() == [2]
+    assert "Notes" not in df.columns
+    assert not is_cached(result_file)
+
+
+def test_second_partial_read_fills_the_disk_cache(result_file, monkeypatch):
+    sus.load_simulation_result(result_file, load_points=["2"])
+    df = sus.load_simulation_result(result_file, metrics=["Blocking probability"])
+    assert df["LoadPoint"].tolist() == [1, 2]
+    assert is_cached(result_file)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("o arquivo não deveria ser lido")
+
+    monkeypatch.setattr(sus, "read_simulation_csv", fail)
+    df = sus.load_simulation_result(result_file, load_points=["1"])
+    assert df["rep1"].tolist() == [0.5, 0.125]
+
+
+def test_partial_read_log_is_bounded():
+    log = cus.PartialReadLog(2)
+    signature = {"size": 1, "mtime_ns": 1}
+    for source in ("a", "b", "c"):
+        assert not log.record(source, signature)
+    assert list(log.entries) == ["b", "c"]
+    assert log.record("c", signature)
+    assert not log.record("b", {"size": 2, "mtime_ns": 1})
@@ -0,0 +1,57 @@
+import pandas as pd
+
+from services import cache_utils as cus
+
+SIGNATURE = {"size": 10, "mtime_ns": 1}
+
+
+def make_result(rows):
+    return pd.DataFrame({"Metrics": ["m"] * rows, "rep1": [0.5] * rows})
+
+
+def get_size(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def test_least_recently_used_entries_are_evicted():
+    df = make_result(100)
+    cache = cus.ResultCache(3 * get_size(df))
+    for key in ("a", "b", "c"):
+        cache.put((key,), SIGNATURE, df)
+    assert cache.get(("a",), SIGNATURE) is df
+    cache.put(("d",), SIGNATURE, df)
+
+    assert cache.get(("b",), SIGNATURE) is None
+    assert [k for (k,) in cache.entries] == ["c", "a", "d"]
+    assert cache.stats()["bytes"] == 3 * get_size(df)
+
+
+def test_results_larger_than_the_budget_are_not_stored():
+    cache = cus.ResultCache(get_size(make_result(10)))
+    cache.put(("a",), SIGNATURE, make_result(100))
+    assert cache.get(("a",), SIGNATURE) is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_entries_are_dropped_when_the_signature_changes():
+    cache = cus.ResultCache(2**20)
+    cache.put(("a",), SIGNATURE, make_result(10))
+    assert cache.get(("a",), dict(SIGNATURE, mtime_ns=2)) is None
+    assert cache.get(("a",), SIGNATURE) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_stats_count_hits_and_misses():
+    df = make_result(10)
+    cache = cus.ResultCache(2**20)
+    cache.get(("a",), SIGNATURE)
+    cache.put(("a",), SIGNATURE, df)
+    cache.get(("a",), SIGNATURE)
+    cache.get(("a",), SIGNATURE)
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "entries": 1,
+        "bytes": get_size(df),
+        "max_bytes": 2**20,
+    }
@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import result_store as rss, simulation_utils as sus
+
+CSV = """Metrics,LoadPoint,rep1,rep2,rep3
+BlockingProbability,100,0.1,0.2,0.3
+BlockingProbability,200,0.4,,0.6
+Hops,100,3,4,5
+"""
+
+
+@pytest.fixture
+def result_directory(tmp_path):
+    """
+    Writes a simulation directory with one result file.
+    """
+    directory = tmp_path / "A"
+    directory.mkdir()
+    (directory / "A_BlockingProbability.csv").write_text(CSV)
+    return directory
+
+
+@pytest.fixture
+def store(tmp_path):
+    return rss.ResultStore(str(tmp_path / ".safs" / "results.sqlite"))
+
+
+def count_rows(store):
+    with store.connect() as connection:
+        return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+def test_fetch_returns_the_result_file(store, result_directory):
+    result = store.fetch(str(result_directory), "BlockingProbability")
+    expected = sus.read_simulation_csv(
+        str(result_directory / "A_BlockingProbability.csv")
+    )
+    assert count_rows(store) == 3
+    assert result["Metrics"].tolist() == expected["Metrics"].tolist()
+    assert result["LoadPoint"].tolist() == expected["LoadPoint"].tolist()
+    assert np.allclose(
+        result.filter(like="rep").to_numpy(dtype=np.float64),
+        expected.filter(like="rep").to_numpy(dtype=np.float64),
+        equal_nan=True,
+    )
+
+
+def test_fetch_filters_metrics_and_load_points(store, result_directory):
+    result = store.fetch(
+        str(result_directory),
+        "BlockingProbability",
+        metrics=["BlockingProbability"],
+        load_points=["200", "abc"],
+    )
+    assert result["LoadPoint"].tolist() == [200]
+    assert np.allclose(
+        result.filter(like="rep").iloc[0], [0.4, np.nan, 0.6], equal_nan=True
+    )
+    empty = store.fetch(
+        str(result_directory), "BlockingProbability", load_points=["abc"]
+    )
+    assert empty.empty
+
+
+def test_modified_file_is_ingested_again(store, result_directory):
+    path = result_directory / "A_BlockingProbability.csv"
+    store.fetch(str(result_directory), "BlockingProbability")
+    path.write_text(CSV + "Hops,200,6,7,8\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    result = store.fetch(str(result_directory), "BlockingProbability")
+    assert count_rows(store) == 4
+    assert result.iloc[-1]["rep3"] == 8
+
+
+def test_unmodified_file_is_not_ingested_again(store, result_directory, monkeypatch):
+    store.ingest(str(result_directory), "BlockingProbability")
+
+    def fail(*args, **kwargs):
+        raise AssertionError()
+
+    monkeypatch.setattr(sus, "load_simulation_result", fail)
+    result = store.fetch(str(result_directory), "BlockingProbability")
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 3
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from services import index_utils as ius, path_utils as pus, simulation_utils as sus
+
+KEYS = [
+    ("Blocking probability", 1),
+    ("Blocking probability", 2),
+    ("Blocking probability by fragmentation", 1),
+    ("Blocking probability by fragmentation", 2),
+]
+
+
+def write_shard(path, repetition, keys=KEYS):
+    """
+    Writes a shard with two repetitions, whose values are the row number plus
+    `repetition` tenths and hundredths.
+    """
+    lines = ["Metrics,LoadPoint,rep1,rep2"]
+    for row, (metric, load_point) in enumerate(keys):
+        values = [row + repetition / 10, row + repetition / 100]
+        lines.append(",".join([metric, str(load_point)] + [str(v) for v in values]))
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_shards_are_merged_in_repetition_order(tmp_path):
+    paths = [
+        write_shard(tmp_path / f"A_BlockingProbability_rep{i}.csv", i) for i in (1, 2)
+    ]
+    df = sus.merge_result_shards(paths)
+    assert list(df.columns) == ["Metrics", "LoadPoint", "rep1", "rep2", "rep3", "rep4"]
+    expected = [[r + 0.1, r + 0.01, r + 0.2, r + 0.02] for r in range(len(KEYS))]
+    assert np.allclose(df[["rep1", "rep2", "rep3", "rep4"]].to_numpy(), expected)
+    assert df["LoadPoint"].tolist() == [1, 2, 1, 2]
+
+
+def test_shards_with_different_rows_are_rejected(tmp_path):
+    first = write_shard(tmp_path / "A_BlockingProbability_rep1.csv", 1)
+    second = write_shard(tmp_path / "A_BlockingProbability_rep2.csv", 2, KEYS[:3])
+    with pytest.raises(Exception, match="não correspondem"):
+        sus.merge_result_shards([first, second])
+
+
+def test_sharded_group_is_loaded_from_the_directory(tmp_path):
+    directory = tmp_path / "A"
+    directory.mkdir()
+    for i in (2, 1):
+        write_shard(directory / f"A_BlockingProbability_rep{i}.csv", i)
+    path = pus.get_result_paths([str(directory)], "BlockingProbability")[0]
+    assert [p.rsplit("_", 1)[-1] for p in path] == ["rep1.csv", "rep2.csv"]
+    df = sus.load_simulation_result(path, metrics=["Blocking probability"])
+    assert len(df) == 2
+    assert len(sus.extract_repetitions([df])[0].columns) == 4
+
+
+def test_shard_filenames_are_parsed():
+    assert ius.parse_result_filename("A_BlockingProbability_rep3.csv") == (
+        "BlockingProbability",
+        0,
+        3,
+    )
@@ -0,0 +1,101 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from services import compilation as cs, snapshot_utils as sns
+
+METRICS = ["Blocking probability", "Bandwidth blocking probability"]
+TRAFFIC = {
+    "requestGenerators": [
+        {
+            "source": "1",
+            "destination": "2",
+            "arrivalRate": 1,
+            "arrivalRateIncrease": 1,
+            "holdRate": 1,
+        }
+    ]
+}
+
+
+def write_result(path, offset):
+    lines = ["Metrics,LoadPoint,rep1,rep2,rep3"]
+    for i, metric in enumerate(METRICS):
+        for load_point in (1, 2):
+            values = [offset + i + load_point * r / 10 for r in (1, 2, 4)]
+            lines.append(",".join([metric, str(load_point)] + [str(v) for v in values]))
+    path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def base_directory(tmp_path):
+    """
+    Writes a base directory with two simulation directories, A and B.
+    """
+    for offset, name in enumerate("AB"):
+        directory = tmp_path / name
+        directory.mkdir()
+        (directory / "simulation").write_text(json.dumps({"loadPoints": 2}))
+        (directory / "network").write_text(json.dumps({"nodes": [{}, {}, {}]}))
+        (directory / "traffic").write_text(json.dumps(TRAFFIC))
+        write_result(directory / f"{name}_BlockingProbability.csv", offset)
+    return tmp_path
+
+
+def compile_group(base_directory, snapshot, error_statistic="error"):
+    compiler = cs.DataCompiler("individual", None, error_statistic)
+    compiler.set_metrics(METRICS)
+    directories = [str(base_directory / name) for name in "AB"]
+    return compiler.compile_group(
+        str(base_directory), directories, "BlockingProbability", snapshot=snapshot
+    )
+
+
+def save_snapshot(base_directory):
+    path = str(base_directory / "analysis.npz")
+    sns.save_snapshot(
+        path,
+        str(base_directory),
+        "individual",
+        ["A", "B"],
+        ["", "bee"],
+        {"BlockingProbability": METRICS},
+    )
+    return path
+
+
+def assert_compiled_equal(compiled, expected, statistics):
+    for directory_series, expected_series in zip(compiled, expected):
+        for series, expected_df in zip(directory_series, expected_series):
+            assert np.allclose(
+                series[statistics].to_numpy(), expected_df[statistics].to_numpy()
+            )
+
+
+def test_snapshot_is_compiled_without_the_result_files(base_directory):
+    expected = compile_group(base_directory, None)
+    path = save_snapshot(base_directory)
+    for name in "AB":
+        os.remove(base_directory / name / f"{name}_BlockingProbability.csv")
+
+    snapshot = sns.load_snapshot(path)
+    assert snapshot.get_config_data()["directories"] == {"A": "", "B": "bee"}
+    assert snapshot.get_loads() == {"0": 6, "1": 12}
+    compiled = compile_group(base_directory, path)
+    assert_compiled_equal(compiled, expected, ["mean", "error"])
+
+
+def test_other_error_statistics_are_compiled_from_the_result_files(base_directory):
+    path = save_snapshot(base_directory)
+    write_result(base_directory / "A" / "A_BlockingProbability.csv", 10)
+    os.utime(base_directory / "A" / "A_BlockingProbability.csv", (1, 1))
+
+    from_snapshot = compile_group(base_directory, path)
+    from_files = compile_group(base_directory, path, error_statistic="std")
+    expected = compile_group(base_directory, None, error_statistic="std")
+    assert_compiled_equal(from_files, expected, ["mean", "error", "std"])
+    assert not np.allclose(
+        from_snapshot[0][0]["mean"].to_numpy(), from_files[0][0]["mean"].to_numpy()
+    )
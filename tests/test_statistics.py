@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats as st
+
+from services import compilation as cs, simulation_utils as sus
+
+# Two metrics, two load points and five repetitions. The second load point of the
+# second metric has a missing repetition.
+VALUES = np.array(
+    [
+        [[0.1, 0.4, 0.2, 0.9, 0.5], [1.0, 2.0, 4.0, 8.0, 16.0]],
+        [[3.0, 3.5, 2.5, 3.25, 2.75], [0.3, np.nan, 0.6, 0.2, 0.7]],
+    ]
+)
+COMPLETE = VALUES[:, :1]
+
+
+def compute(statistic, values=VALUES):
+    return cs.calculate_statistics(values, [statistic])[..., 0]
+
+
+def test_mean_skips_missing_values():
+    assert np.allclose(compute("mean"), np.nanmean(VALUES, axis=2))
+
+
+def test_error_matches_the_standard_error_of_the_results():
+    repetitions = pd.DataFrame(VALUES.reshape(-1, VALUES.shape[2]))
+    expected = sus.calculate_standard_error([repetitions], VALUES.shape[2])[0]
+    expected = np.reshape(expected, VALUES.shape[:2])
+    assert np.allclose(compute("error"), expected, equal_nan=True)
+    assert np.isnan(compute("error")[1, 1])
+
+
+def test_std_uses_one_degree_of_freedom():
+    expected = np.std(VALUES, axis=2, ddof=1)
+    assert np.allclose(compute("std"), expected, equal_nan=True)
+    assert np.isnan(compute("std")[1, 1])
+
+
+@pytest.mark.parametrize("statistic, level", [("ci95", 0.95), ("ci99", 0.99)])
+def test_confidence_intervals_use_the_t_distribution(statistic, level):
+    n = COMPLETE.shape[2]
+    low, high = st.t.interval(
+        level,
+        n - 1,
+        loc=COMPLETE.mean(axis=2),
+        scale=st.sem(COMPLETE, axis=2, ddof=1),
+    )
+    assert np.allclose(compute(statistic, COMPLETE), (high - low) / 2)
+    assert np.isnan(compute(statistic)[1, 1])
+
+
+@pytest.mark.parametrize("statistic, percentile", cs.PERCENTILES.items())
+def test_percentiles_match_numpy(statistic, percentile):
+    expected = np.percentile(VALUES, percentile, axis=2)
+    assert np.allclose(compute(statistic), expected, equal_nan=True)
+    assert np.isnan(compute(statistic)[1, 1])
+
+
+def test_iqr_is_half_the_interquartile_range():
+    p25, p75 = np.percentile(VALUES, [25, 75], axis=2)
+    assert np.allclose(compute("iqr"), (p75 - p25) / 2, equal_nan=True)
+
+
+def test_statistics_computed_together_match_computed_alone():
+    together = cs.calculate_statistics(VALUES, cs.STATISTICS)
+    for i, statistic in enumerate(cs.STATISTICS):
+        assert np.array_equal(together[..., i], compute(statistic), equal_nan=True)
+
+
+def test_unknown_statistic_is_rejected():
+    with pytest.raises(ValueError, match="Estatística não suportada"):
+        cs.calculate_statistics(VALUES, ["mean", "mode"])
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import compilation as cs, tailing as tls
+
+VALUES = np.array(
+    [
+        [0.11, 0.52, 0.33, 0.74, 0.25],
+        [0.61, 0.12, 0.93, 0.44, 0.85],
+        [0.21, 0.72, 0.13, 0.54, 0.95],
+        [0.81, 0.32, 0.63, 0.14, 0.45],
+    ]
+)
+KEYS = [("m", 1), ("m", 2), ("n", 1), ("n", 2)]
+
+
+def write_lines(path, number_of_rows, number_of_reps, values=VALUES, extra=None):
+    """
+    Writes the first rows and repetitions of `values` as a result file, with an
+    extra field before the repetitions of each data row if `extra` is given.
+    """
+    header = ["Metrics", "LoadPoint"] + [f"rep{i + 1}" for i in range(number_of_reps)]
+    lines = [",".join(header)]
+    for (metric, load_point), row in zip(KEYS[:number_of_rows], values):
+        fields = [metric, str(load_point)] + ([extra] if extra else [])
+        lines.append(",".join(fields + [str(v) for v in row[:number_of_reps]]))
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+    return path
+
+
+def read_expected(path):
+    return tls.add_statistics(pd.read_csv(path))
+
+
+@pytest.fixture
+def starts(monkeypatch):
+    """
+    Counts the reads of whole files.
+    """
+    calls = []
+    read_from_start = tls.read_from_start
+    monkeypatch.setattr(
+        tls, "read_from_start", lambda *a: calls.append(a[0]) or read_from_start(*a)
+    )
+    return calls
+
+
+def test_appended_lines_and_columns_are_read(tmp_path, starts):
+    path = str(tmp_path / "A_BlockingProbability.csv")
+    reader = tls.TailingReader(8)
+    for number_of_rows, number_of_reps in [(2, 3), (4, 3), (4, 4), (4, 5)]:
+        write_lines(path, number_of_rows, number_of_reps)
+        pd.testing.assert_frame_equal(reader.read(path), read_expected(path))
+    assert len(starts) == 1
+
+
+def test_added_columns_of_normalized_files_are_read(tmp_path, starts):
+    path = str(tmp_path / "A_SpectrumUtilization.csv")
+    reader = tls.TailingReader(8)
+    write_lines(path, 4, 3, extra="x")
+    reader.read(path)
+    write_lines(path, 4, 5, extra="x")
+    expected = read_expected(write_lines(str(tmp_path / "expected.csv"), 4, 5))
+    pd.testing.assert_frame_equal(reader.read(path), expected)
+    assert len(starts) == 1
+
+
+def test_rewritten_file_is_read_again(tmp_path, starts):
+    path = str(tmp_path / "A_BlockingProbability.csv")
+    reader = tls.TailingReader(8)
+    write_lines(path, 4, 3)
+    reader.read(path)
+    values = VALUES.copy()
+    values[1, 2] = 0.5
+    write_lines(path, 4, 4, values=values)
+    pd.testing.assert_frame_equal(reader.read(path), read_expected(path))
+    assert len(starts) == 2
+
+
+def test_least_recently_read_files_are_dropped(tmp_path):
+    reader = tls.TailingReader(2)
+    paths = [write_lines(str(tmp_path / f"{name}_Hops.csv"), 4, 3) for name in "ABC"]
+    for path in paths + paths[1:2]:
+        reader.read(path)
+    assert list(reader.states) == [paths[2], paths[1]]
+
+
+def test_file_without_complete_lines_raises(tmp_path):
+    path = tmp_path / "A_BlockingProbability.csv"
+    path.write_text("Metrics,LoadPoint,rep1")
+    with pytest.raises(Exception, match="nenhuma linha completa"):
+        tls.TailingReader(8).read(str(path))
+
+
+def test_followed_results_compile_as_the_repetitions(tmp_path):
+    directory = tmp_path / "A"
+    directory.mkdir()
+    path = write_lines(str(directory / "A_BlockingProbability.csv"), 4, 5)
+    followed = tls.load_followed_results([str(directory)], "BlockingProbability")[0]
+    repetitions = pd.read_csv(path)
+    for statistics in (["mean", "error"], ["mean", "error", "std"]):
+        compiled = cs.compile_metrics(followed, ["m", "n"], None, statistics)
+        expected = cs.compile_metrics(repetitions, ["m", "n"], None, statistics)
+        for c, e in zip(compiled, expected):
+            assert np.array_equal(c.to_numpy(), e.to_numpy())
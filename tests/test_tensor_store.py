@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import compilation as cs, tensor_store as tss
+
+
+@pytest.fixture
+def result():
+    """
+    Builds a result with three metrics, three load points and four repetitions.
+    """
+    rng = np.random.default_rng(0)
+    keys = [(m, lp) for m in ("a", "b", "c") for lp in (1, 2, 3)]
+    df = pd.DataFrame(keys, columns=["Metrics", "LoadPoint"])
+    repetitions = rng.random((len(keys), 4))
+    repetitions[4, 2] = np.nan
+    for i in range(4):
+        df[f"rep{i + 1}"] = repetitions[:, i]
+    return df
+
+
+@pytest.mark.parametrize("load_points", [None, ["2", "3"], ["3", "1"]])
+def test_tensor_compiles_as_the_result(result, load_points):
+    tensor = tss.ResultTensor.from_dataframe(result)
+    compiled = cs.compile_tensor(tensor, ["c", "a"], load_points, cs.STATISTICS)
+    expected = cs.compile_metrics(result, ["c", "a"], load_points, cs.STATISTICS)
+    for c, e in zip(compiled, expected):
+        assert np.array_equal(c.to_numpy(), e.to_numpy(), equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [0, 1, 2, 2, 3, 4, 5, 6, 7, 8],
+        [0, 1, 3, 4, 5, 6, 7, 8],
+        [1, 0, 2, 3, 4, 5, 6, 7, 8],
+    ],
+)
+def test_incomplete_grids_are_rejected(result, rows):
+    with pytest.raises(ValueError):
+        tss.ResultTensor.from_dataframe(result.iloc[rows].reset_index(drop=True))
+
+
+def test_tensor_is_stored_without_a_cache_directory(tmp_path, result):
+    path = str(tmp_path / "A_BlockingProbability.csv")
+    result.to_csv(path, index=False)
+    store = tss.TensorStore()
+    store.write(path, tss.ResultTensor.from_dataframe(result))
+
+    stored = store.open(path)
+    assert stored is not None
+    assert np.array_equal(
+        stored.values, tss.ResultTensor.from_dataframe(result).values, equal_nan=True
+    )